@@ -0,0 +1,200 @@
+"""
+Condenser - Resumen local de descripciones de jobs para el prompt de Gemini
+
+Propósito:
+- El prompt llevaba job.description[:300]: casi siempre la intro de la empresa
+  ("We are a fast-growing...") y ninguno de los requisitos que deciden el match
+- El condenser parte la descripción en frases, puntúa cada una contra las
+  keywords del usuario (mismo tokenizer que el pre-ranker BM25) y se queda con
+  las mejores que entren en un presupuesto de tokens
+- Mismo (o menor) costo de entrada, mejor información para el modelo
+
+Cómo:
+1. Frases: se corta en saltos de línea, viñetas y fin de oración
+2. Score por frase: keywords distintas que aparecen (peso fuerte) + repeticiones
+   + bonus si parece requisito ("experience", "requisitos", "must"...)
+   - penalización si parece boilerplate ("equal opportunity", "benefits"...)
+3. Greedy por score hasta llenar el presupuesto; las frases elegidas se
+   devuelven en su orden original para que el texto se lea natural
+4. Ninguna frase con score > 0: las primeras frases (como antes, pero sin
+   cortar palabras a la mitad)
+
+Tokens: estimación local de ~4 caracteres por token (la de Gemini para texto
+en inglés/español), sin llamadas a la API. Cada condense() registra tokens
+originales vs tokens enviados (ver stats()).
+
+Ejemplo:
+    >>> condenser = DescriptionCondenser(token_budget=75)
+    >>> condenser.condense(job.description, ["python", "django"])
+    'Requirements: 5+ years with Python and Django. ...'
+"""
+
+import logging
+import math
+import re
+import threading
+from typing import List, Optional, Sequence
+
+from backend.agents.prerank import query_terms, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Caracteres por token (estimación para texto latino)
+CHARS_PER_TOKEN = 4
+
+# Frases más cortas que esto son ruido ("Apply now", "About us:")
+MIN_SENTENCE_CHARS = 12
+
+# Saltos de línea, viñetas y fin de oración seguido de espacio
+SENTENCE_SPLIT_RE = re.compile(r"\s*(?:\n+|[•·▪●◦]+|(?<=[.!?;])\s+)\s*")
+# Markdown de JobSpy (negritas, escapes, encabezados) que solo gasta tokens
+MARKDOWN_RE = re.compile(r"\\(?=[^\w\s])|\*\*|__|^#+\s*", re.MULTILINE)
+
+REQUIREMENT_CUES = frozenset(
+    "requirements requirement required qualifications experience skills must proficient "
+    "knowledge stack responsibilities years remote contract requisitos experiencia "
+    "conocimientos habilidades responsabilidades años remoto".split()
+)
+BOILERPLATE_CUES = frozenset(
+    "equal opportunity employer benefits insurance diversity founded mission culture "
+    "perks beneficios igualdad".split()
+)
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Tokens aproximados de un texto (0 si está vacío)"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Descripción → frases limpias (sin markdown, espacios colapsados, sin repetidas)"""
+    text = MARKDOWN_RE.sub("", text)
+    sentences = []
+    seen = set()
+    for part in SENTENCE_SPLIT_RE.split(text):
+        sentence = " ".join(part.strip(" -*\t").split())
+        if len(sentence) >= MIN_SENTENCE_CHARS and sentence.lower() not in seen:
+            seen.add(sentence.lower())
+            sentences.append(sentence)
+    return sentences
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """Cortar en límite de palabra para no pasar de `budget` tokens (budget <= 0 → "")"""
+    if budget <= 0:
+        return ""
+    max_chars = budget * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text[: max_chars - 1].rsplit(" ", 1)[0]
+    return cut + "…"
+
+
+def _terminated(sentence: str) -> str:
+    """Viñetas sin punto final: agregarlo para que al unirlas no se mezclen"""
+    return sentence if sentence[-1] in ".!?:;…" else sentence + "."
+
+
+class DescriptionCondenser:
+    """
+    Selecciona las frases de una descripción más relevantes para unas keywords
+
+    Thread-safe (solo los contadores comparten estado).
+    """
+
+    DEFAULT_TOKEN_BUDGET = 75  # ≈ los 300 caracteres del recorte anterior
+
+    def __init__(self, token_budget: int = DEFAULT_TOKEN_BUDGET):
+        """
+        Args:
+            token_budget: Tokens máximos de descripción por job en el prompt
+
+        Raises:
+            ValueError: token_budget < 1
+        """
+        if token_budget < 1:
+            raise ValueError("token_budget debe ser >= 1")
+        self.token_budget = token_budget
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.original_tokens = 0
+        self.condensed_tokens = 0
+
+    def condense(self, description: Optional[str], keywords: Sequence[str]) -> str:
+        """
+        Descripción → las frases más relevantes que entran en token_budget
+
+        Returns:
+            str: Texto condensado ("No description" si no hay descripción)
+        """
+        if not description or not description.strip():
+            return "No description"
+
+        sentences = split_sentences(description)
+        if not sentences:
+            condensed = truncate_to_tokens(" ".join(description.split()), self.token_budget)
+        else:
+            condensed = self._select(sentences, query_terms(keywords))
+
+        original, sent = estimate_tokens(description), estimate_tokens(condensed)
+        with self._lock:
+            self.calls += 1
+            self.original_tokens += original
+            self.condensed_tokens += sent
+        logger.debug(f"📝 Descripción condensada: {original} → {sent} tokens")
+        return condensed
+
+    def _select(self, sentences: List[str], terms: List[str]) -> str:
+        scores = [self._score(sentence, terms) for sentence in sentences]
+
+        # Sin ninguna coincidencia: las primeras frases (comportamiento anterior)
+        ranked = any(score > 0 for score in scores)
+        if ranked:
+            order = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))
+        else:
+            order = list(range(len(sentences)))
+
+        # La mejor frase va siempre; si sola ya no entra, recortada ocupa todo el presupuesto
+        top = order[0]
+        used = estimate_tokens(sentences[top]) + 1  # +1: separador / punto
+        if used > self.token_budget:
+            return truncate_to_tokens(sentences[top], self.token_budget)
+
+        chosen = [top]
+        for i in order[1:]:
+            if ranked and scores[i] < 0:
+                break  # solo quedan frases de boilerplate
+            cost = estimate_tokens(sentences[i]) + 1
+            if used + cost <= self.token_budget:
+                chosen.append(i)
+                used += cost
+
+        return " ".join(_terminated(sentences[i]) for i in sorted(chosen))
+
+    @staticmethod
+    def _score(sentence: str, terms: List[str]) -> float:
+        tokens = tokenize(sentence)
+        if not tokens:
+            return -1.0
+        token_set = set(tokens)
+
+        distinct = sum(1 for term in terms if term in token_set)
+        repeats = sum(tokens.count(term) for term in terms) - distinct
+        score = 3.0 * distinct + 0.5 * repeats
+        if token_set & REQUIREMENT_CUES:
+            score += 1.0
+        if token_set & BOILERPLATE_CUES:
+            score -= 2.0
+        return score
+
+    def stats(self) -> dict:
+        """Tokens de descripción originales vs enviados a Gemini"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "original_tokens": self.original_tokens,
+                "condensed_tokens": self.condensed_tokens,
+                "avg_condensed_tokens": round(self.condensed_tokens / self.calls, 1) if self.calls else 0.0,
+            }
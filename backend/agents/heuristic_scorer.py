@@ -0,0 +1,71 @@
+"""
+Heuristic Scorer - Score local de un job cuando no hay cuota de Gemini
+
+Propósito:
+- Con la cuota del free tier agotada (5 RPM / 20 RPD, ver llm_scheduler.py)
+  el usuario se quedaba con "⚠️ Error analizando este job" en los 5 jobs
+- Este scorer da un score 0-100 y un motivo corto SIN llamar a la API, con
+  el mismo tokenizer que el pre-ranker BM25: la lista sigue saliendo
+  ordenada al instante y el motivo aclara que es una estimación
+
+Cómo:
+- Cobertura de keywords: cada término del usuario vale 1 si está en el
+  título, HEURISTIC_DESCRIPTION_WEIGHT si solo está en la descripción
+  y 0 si no aparece. "remote"/"remoto" también cuenta con job.is_remote
+- score = HEURISTIC_MIN_SCORE + cobertura × (HEURISTIC_MAX_SCORE - HEURISTIC_MIN_SCORE)
+  (nunca 0 ni 100: es una estimación, no un veredicto)
+
+Ejemplo:
+    >>> score, reason, highlights = heuristic_verdict(job, ["python", "remote"])
+    >>> reason
+    '⚡ Estimado rápido (sin IA): ✅ python, ✅ remote'
+"""
+
+from typing import List, Sequence, Tuple
+
+from backend.agents.prerank import query_terms, tokenize
+from database.models import Job
+
+HEURISTIC_MIN_SCORE = 10.0
+HEURISTIC_MAX_SCORE = 90.0
+# Un término solo en la descripción vale menos que en el título
+HEURISTIC_DESCRIPTION_WEIGHT = 0.6
+
+# Sin keywords no hay nada que comparar: score neutro
+NEUTRAL_SCORE = 50.0
+
+REMOTE_TERMS = frozenset({"remote", "remoto"})
+
+
+def heuristic_verdict(job: Job, keywords: Sequence[str]) -> Tuple[float, str, List[str]]:
+    """
+    Score local de un job contra las keywords del usuario
+
+    Returns:
+        (match_score 0-100, reason en 1 línea, highlights = términos encontrados)
+    """
+    terms = query_terms(keywords)
+    if not terms:
+        return NEUTRAL_SCORE, "⚡ Estimado rápido (sin IA): sin keywords para comparar", []
+
+    title = set(tokenize(job.title))
+    description = set(tokenize(job.description))
+
+    found: List[str] = []
+    missing: List[str] = []
+    coverage = 0.0
+    for term in terms:
+        if term in title or (term in REMOTE_TERMS and job.is_remote):
+            coverage += 1.0
+            found.append(term)
+        elif term in description:
+            coverage += HEURISTIC_DESCRIPTION_WEIGHT
+            found.append(term)
+        else:
+            missing.append(term)
+
+    score = HEURISTIC_MIN_SCORE + (coverage / len(terms)) * (HEURISTIC_MAX_SCORE - HEURISTIC_MIN_SCORE)
+    parts = ", ".join(f"✅ {term}" for term in found)
+    if missing:
+        parts = (parts + " · " if parts else "") + ", ".join(f"❌ {term}" for term in missing)
+    return round(score), f"⚡ Estimado rápido (sin IA): {parts}", found
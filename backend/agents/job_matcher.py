@@ -11,20 +11,91 @@ Framework: LangChain + Google Generative AI (Gemini 2.5 Flash)
 
 Diseño:
 1. FewShotPromptTemplate: Ejemplos estructurados para enseñar al LLM cómo responder
-2. with_structured_output(): Garantizar JSON válido con Pydantic
+   (formateado UNA vez como system instruction, ver "Prefijo estático")
+2. with_structured_output(): Garantizar JSON válido con Pydantic, con un schema
+   mínimo (MatchVerdict: score, reason, highlights). El Job y el telegram_message
+   de JobMatchResult se completan localmente, Gemini no los genera
+   (template con Markdown escapado: backend/agents/message_renderer.py)
 3. PromptTemplate: Template reutilizable para formatear ejemplos
+
+Modo batch (match_jobs_batch, por defecto):
+- UNA llamada a Gemini para N jobs: el perfil va una sola vez + N resúmenes
+  compactos numerados → lista estructurada de (index, score, reason)
+- 1 request contra el límite de 5 RPM / 20 RPD en vez de N
+- Si el batch falla (API o parseo), o faltan índices, esos jobs pasan por
+  match_job() uno por uno
+- Comparar contra el loop: scripts/bench_batch_matching.py
+
+API async (amatch_job / amatch_jobs_batch):
+- Mismo comportamiento con ainvoke: el handler no bloquea el event loop
+  mientras Gemini responde, el bot sigue atendiendo a otros usuarios
+- Las llamadas en paralelo (fallback por job, batched=False) pasan por
+  asyncio.gather bajo un semáforo de GEMINI_MAX_CONCURRENCY
+
+Streaming (astream_jobs_batch):
+- Entrega cada JobMatchResult apenas está listo: MatchCache primero, cada
+  job del batch en cuanto Gemini cierra su entrada en el stream de tokens
+  (astream_events + JSON parcial) y el fallback por job a medida que termina
+- El trabajo total es el mismo; /vacantes manda la 1ª tarjeta sin esperar
+  a las 5. Modelos sin astream_events() (mocks) usan ainvoke
+
+Descripciones (backend/agents/condenser.py):
+- En vez de description[:300] (casi siempre la intro de la empresa) va un
+  resumen local con las frases más relevantes a las keywords, dentro de un
+  presupuesto de GEMINI_DESCRIPTION_TOKENS tokens por job
+
+Prefijo estático (system instruction):
+- Instrucciones + EXAMPLES son iguales en todas las llamadas: van como
+  SystemMessage construido una sola vez por matcher (BATCH_SYSTEM_PROMPT en
+  modo batch); cada llamada manda solo el delta (job + perfil)
+- El prefijo idéntico byte a byte es lo que Gemini puede servir desde su
+  caché implícita de prefijos; backend/agents/token_ledger.py registra
+  prefijo / delta / cache_read por llamada y por día
+
+Backend del modelo (create_chat_model; el bot lo elige con GEMINI_BACKEND):
+- "live": Gemini; "record": Gemini + cassette de prompt → respuesta;
+  "replay": offline desde el cassette (backend/agents/llm_replay.py)
+
+Caché (backend/agents/match_cache.py):
+- Antes de llamar a Gemini se busca cada job en la MatchCache por
+  (URL canónica, keywords+ubicación, PROMPT_VERSION); los hits no gastan cuota
+- Un lookup y un commit por llamada a Gemini; desde async corren en un
+  thread (aget_many / aset_many), nunca en el event loop
+
+Cuota (backend/agents/llm_scheduler.py):
+- Con scheduler (el del MatcherPool), cada llamada pide turno según RPM, RPD
+  y tokens del proceso; priority=ADMIN pasa antes que USER
+- Sin cuota (QuotaExceeded) el job recibe el score local de
+  heuristic_scorer.py en vez de un error (no se cachea)
 """
 
+import asyncio
 import json
 import logging
 import os
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from contextlib import aclosing, nullcontext
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, ValidationError
 
 from database.models import Job
+from backend.agents.condenser import DescriptionCondenser, estimate_tokens
+from backend.agents.heuristic_scorer import heuristic_verdict
+from backend.agents.llm_replay import RecordingLLM, ReplayLLM
+from backend.agents.llm_scheduler import (
+    USER,
+    LLMScheduler,
+    QuotaExceeded,
+    Reservation,
+    is_quota_error,
+)
+from backend.agents.match_cache import MatchCache, MatchKey, get_match_cache, make_match_key
+from backend.agents.message_renderer import render_job_message
+from backend.agents.token_ledger import TokenLedger, get_token_ledger
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import FewShotPromptTemplate, PromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.utils.json import parse_partial_json
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -39,7 +110,12 @@ load_dotenv()
 
 
 class JobMatchResult(BaseModel):
-    """Resultado del análisis de match de un job - YA FORMATEADO PARA TELEGRAM"""
+    """
+    Resultado del análisis de match de un job - YA FORMATEADO PARA TELEGRAM
+
+    Tipo INTERNO: NO es el schema que se le pide a Gemini (ver MatchVerdict).
+    El job y el telegram_message se completan localmente.
+    """
 
     job: Job = Field(..., description="Job object original (para acceder a job_url, etc)")
     match_score: float = Field(..., ge=0, le=100, description="Score de 0-100")
@@ -49,6 +125,36 @@ class JobMatchResult(BaseModel):
     telegram_message: str = Field(
         ..., description="Mensaje YA formateado en Markdown para Telegram, listo para enviar"
     )
+    highlights: List[str] = Field(default_factory=list, description="Puntos clave del match")
+
+
+class MatchVerdict(BaseModel):
+    """
+    Lo ÚNICO que genera Gemini por job (schema de with_structured_output)
+
+    Antes el schema era JobMatchResult: el modelo tenía que generar el Job
+    completo (que después se pisaba con result.job = job) y el mensaje de
+    Telegram. Un schema mínimo = menos tokens de salida, menos latencia y
+    menos respuestas que no validan.
+    """
+
+    match_score: float = Field(..., ge=0, le=100, description="Score de 0-100")
+    reason: str = Field(..., description="Por qué matchea o no, en 1 línea")
+    highlights: List[str] = Field(
+        default_factory=list, description="Opcional: hasta 3 coincidencias clave, ej. 'Python'"
+    )
+
+
+class BatchJobScore(MatchVerdict):
+    """MatchVerdict de UN job dentro de la respuesta batch"""
+
+    index: int = Field(..., description="Número del job en la lista (empieza en 1)")
+
+
+class BatchMatchResponse(BaseModel):
+    """Respuesta batch: un BatchJobScore por job enviado"""
+
+    results: List[BatchJobScore] = Field(..., description="Un resultado por job, en cualquier orden")
 
 
 # ============================================================================
@@ -112,6 +218,117 @@ Location: USA
 ]
 
 
+# Los EXAMPLES con la respuesta en el formato que se le pide al modelo
+# (MatchVerdict): el few-shot muestra qué devolver, no solo la entrada
+VERDICT_EXAMPLES = [
+    {
+        "job_info": example["job_info"],
+        "user_profile": example["user_profile"],
+        # Sin llaves: el FewShotPromptTemplate re-formatea el texto completo
+        "verdict": "match_score: {score}\nreason: {reason}".format(
+            score=example["output"]["match_score"],
+            reason=example["output"]["personalized_message"],
+        ),
+    }
+    for example in EXAMPLES
+]
+
+# Calibración del modo batch: los mismos EXAMPLES, reducidos a 1 línea cada uno
+# (el perfil es común a ambos)
+BATCH_CALIBRATION = "\n".join(
+    "- {job} → match_score {score}, reason: \"{reason}\"".format(
+        job=" | ".join(line.strip() for line in example["job_info"].strip().splitlines()[:4]),
+        score=example["output"]["match_score"],
+        reason=example["output"]["personalized_message"],
+    )
+    for example in EXAMPLES
+)
+
+# Parte estática del modo batch (system instruction, igual en cada llamada)
+BATCH_SYSTEM_PROMPT = PromptTemplate.from_template(
+    """Evalúa qué tan bien matchea cada job con el perfil del usuario.
+
+Ejemplos de calibración (perfil: Keywords ["python", "remote", "contract"], Location: USA):
+{calibration}
+
+Retorna JSON con "results": un objeto por job, con index (el número entre
+corchetes), match_score (0-100) y reason (1 línea en español, estilo
+"Matches porque: ✅ ..." o "No matchea. ...")."""
+).format(calibration=BATCH_CALIBRATION)
+
+# Delta del modo batch: solo perfil + jobs de esta llamada
+BATCH_PROMPT = PromptTemplate(
+    input_variables=["user_profile", "jobs", "n_jobs"],
+    template="""USER PROFILE:
+{user_profile}
+
+JOBS ({n_jobs}):
+{jobs}
+
+Retorna exactamente {n_jobs} resultados.""",
+)
+
+# Delta de un job: el prefijo (instrucciones + EXAMPLES) va en la system instruction
+MATCH_PROMPT = PromptTemplate(
+    input_variables=["job_info", "user_profile"],
+    template="""Ahora analiza este nuevo job:
+
+JOB DETAILS:
+{job_info}
+
+USER PROFILE:
+{user_profile}""",
+)
+
+# Versión de prompts + schema: forma parte de la key de la MatchCache.
+# Subirla al cambiar EXAMPLES, templates o lo que se le pide al modelo.
+PROMPT_VERSION = "4"
+
+# Máximo de highlights que se conservan por job
+MAX_HIGHLIGHTS = 3
+
+# Tokens de descripción por job en el prompt (ver backend/agents/condenser.py).
+# Solo el default: el bot lo lee del entorno en bot/config.py y lo pasa al pool
+DESCRIPTION_TOKEN_BUDGET = DescriptionCondenser.DEFAULT_TOKEN_BUDGET
+
+# Llamadas simultáneas a Gemini por matcher (free tier: 5 RPM → más no sirve).
+# Solo el default: el bot lo lee del entorno en bot/config.py y lo pasa al pool
+GEMINI_MAX_CONCURRENCY = 5
+
+# Tokens de respuesta estimados por job (para reservar cuota antes de llamar)
+VERDICT_OUTPUT_TOKENS = 60
+
+# Backend del modelo: "live" (Gemini), "record" (Gemini + graba) o "replay" (offline).
+# Solo los defaults: el bot los lee del entorno en bot/config.py y los pasa al pool
+GEMINI_BACKEND = "live"
+GEMINI_CASSETTE = "gemini.cassette.jsonl"
+
+
+def create_chat_model(backend: str = GEMINI_BACKEND, cassette: str = GEMINI_CASSETTE) -> Any:
+    """
+    Chat model por defecto de JobMatcher según el backend
+
+    Args:
+        backend: "live", "record" o "replay"
+        cassette: Archivo JSONL de RecordingLLM / ReplayLLM
+
+    Raises:
+        ValueError: Backend desconocido
+    """
+    if backend == "replay":
+        # Sin cassette todavía: todo sintetizado (el bot igual arranca offline)
+        return ReplayLLM(cassette if os.path.exists(cassette) else None, on_miss="synthesize")
+
+    if backend not in ("live", "record"):
+        raise ValueError(f"GEMINI_BACKEND desconocido: {backend!r} (live, record o replay)")
+
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.3,  # Más bajo para mayor consistencia
+    )
+    return RecordingLLM(llm, cassette) if backend == "record" else llm
+
+
 # ============================================================================
 # JOB MATCHER
 # ============================================================================
@@ -137,25 +354,74 @@ class JobMatcher:
         >>> result = matcher.match_job(job, ["python", "remote"], "USA")
         >>> print(result.match_score)  # 85
         >>> print(result.telegram_message)  # "✅ Senior Python Developer..."
+        >>> results = matcher.match_jobs_batch(top5, ["python"], "USA")  # 1 llamada
+        >>> results = await matcher.amatch_jobs_batch(top5, ["python"], "USA")  # sin bloquear
+        >>> results = await matcher.amatch_jobs_batch(top5, ["python"], "USA", priority=ADMIN)
+        >>> async for result in matcher.astream_jobs_batch(top5, ["python"], "USA"):
+        ...     await send_card(result)  # apenas llega cada uno
     """
 
-    def __init__(self):
-        """Inicializar JobMatcher con Gemini 2.5 Flash + FewShotPromptTemplate"""
+    def __init__(
+        self,
+        llm: Optional[Any] = None,
+        max_concurrency: int = GEMINI_MAX_CONCURRENCY,
+        cache: Optional[MatchCache] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        description_tokens: int = DESCRIPTION_TOKEN_BUDGET,
+        scheduler: Optional[LLMScheduler] = None,
+        ledger: Optional[TokenLedger] = None,
+    ):
+        """
+        Inicializar JobMatcher con Gemini 2.5 Flash + FewShotPromptTemplate
+
+        Args:
+            llm: Chat model a usar (None = create_chat_model(): gemini-2.5-flash;
+                 RecordingLLM / ReplayLLM se pasan armados, ver MatcherPool).
+                 Debe soportar with_structured_output(schema, method, include_raw)
+            max_concurrency: Máximo de llamadas async en vuelo (amatch_*)
+            cache: MatchCache de resultados (None = la global, get_match_cache())
+            semaphore: Semáforo compartido con otros matchers (MatcherPool);
+                       None = uno propio de max_concurrency
+            description_tokens: Presupuesto de tokens de descripción por job
+            scheduler: Cuota global de Gemini (MatcherPool pasa la del proceso);
+                       None = sin control de RPM/RPD
+            ledger: Cuenta de tokens por llamada/día (None = la global, get_token_ledger())
+        """
         try:
+            self.cache = cache if cache is not None else get_match_cache()
+
+            # Frases de la descripción relevantes a las keywords (en vez de [:300])
+            self.condenser = DescriptionCondenser(token_budget=description_tokens)
+
+            # Limita las llamadas async en vuelo de este matcher (o del pool)
+            self._semaphore = semaphore or asyncio.Semaphore(max_concurrency)
+            self.scheduler = scheduler
+            self.ledger = ledger if ledger is not None else get_token_ledger()
+
             # Inicializar modelo con structured output
-            self.llm = ChatGoogleGenerativeAI(
-                model="gemini-2.5-flash",
-                temperature=0.3,  # Más bajo para mayor consistencia
-            )
+            self.llm = llm if llm is not None else create_chat_model()
 
             # Crear structured model con Pydantic
+            # include_raw: la respuesta cruda trae usage_metadata (tokens)
+            # Schema mínimo (MatchVerdict), NO JobMatchResult
             self.structured_llm = self.llm.with_structured_output(
-                JobMatchResult,
+                MatchVerdict,
                 method="json_schema",  # Usar JSON Schema (recomendado para Gemini)
+                include_raw=True,
             )
+            self.batch_llm = self.llm.with_structured_output(
+                BatchMatchResponse,
+                method="json_schema",
+                include_raw=True,
+            )
+
+            # Tokens consumidos (según usage_metadata de Gemini)
+            self.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0}
 
-            # Crear FewShotPromptTemplate
+            # Crear FewShotPromptTemplate y el prefijo estático (una sola vez)
             self._setup_few_shot_template()
+            self.system_message = SystemMessage(content=self.few_shot_prompt.format())
+            self.batch_system_message = SystemMessage(content=BATCH_SYSTEM_PROMPT)
 
             logger.info("✅ JobMatcher inicializado con FewShotPromptTemplate + with_structured_output()")
         except Exception as e:
@@ -165,31 +431,28 @@ class JobMatcher:
     def _setup_few_shot_template(self):
         """Configurar FewShotPromptTemplate con ejemplos estructurados"""
 
-        # Template para formatear cada ejemplo
+        # Template para formatear cada ejemplo (con la respuesta esperada)
         example_prompt = PromptTemplate(
-            input_variables=["job_info", "user_profile"],
+            input_variables=["job_info", "user_profile", "verdict"],
             template="""JOB DETAILS:
 {job_info}
 
 USER PROFILE:
-{user_profile}""",
+{user_profile}
+
+RESPUESTA:
+{verdict}""",
         )
 
-        # FewShotPromptTemplate que combina ejemplos + suffix
+        # FewShotPromptTemplate estático: instrucciones + ejemplos, sin variables.
+        # El job y el perfil de cada llamada van aparte (MATCH_PROMPT)
         self.few_shot_prompt = FewShotPromptTemplate(
-            examples=EXAMPLES,
+            examples=VERDICT_EXAMPLES,
             example_prompt=example_prompt,
-            suffix="""Ahora analiza este nuevo job:
-
-JOB DETAILS:
-{job_info}
-
-USER PROFILE:
-{user_profile}
-
-Retorna JSON con 3 campos: match_score (0-100), personalized_message, telegram_message.
-telegram_message DEBE estar formateado en Markdown con emojis, listo para enviar a Telegram.""",
-            input_variables=["job_info", "user_profile"],
+            prefix="Evalúa qué tan bien matchea un job con el perfil del usuario. Ejemplos:",
+            suffix="""Para cada job nuevo retorna JSON con match_score (0-100), reason (1 línea
+en español) y, opcional, highlights (hasta 3 coincidencias clave).""",
+            input_variables=[],
         )
 
     def match_job(
@@ -197,6 +460,7 @@ telegram_message DEBE estar formateado en Markdown con emojis, listo para enviar
         job: Job,
         user_keywords: List[str],
         user_location: str,
+        priority: int = USER,
     ) -> JobMatchResult:
         """
         Analizar un job y generar match score + mensaje personalizado
@@ -205,79 +469,752 @@ telegram_message DEBE estar formateado en Markdown con emojis, listo para enviar
             job: Job model con detalles del empleo
             user_keywords: Keywords que busca el usuario ["python", "remote"]
             user_location: País/ubicación del usuario "Colombia"
+            priority: ADMIN o USER (turno en el scheduler)
 
         Returns:
             JobMatchResult: {match_score, personalized_message, telegram_message}
+            (de la MatchCache si ya se puntuó; sin cuota: score local;
+            si Gemini falla: score 0, no lanza)
+        """
+        cached = self._cached_results([job], user_keywords, user_location)
+        if cached:
+            return cached[id(job)]
+        return self._match_job_uncached(job, user_keywords, user_location, priority)
 
-        Raises:
-            Exception: Si error en API de Gemini
+    async def amatch_job(
+        self,
+        job: Job,
+        user_keywords: List[str],
+        user_location: str,
+        priority: int = USER,
+    ) -> JobMatchResult:
         """
-        try:
-            # Construir información del job
-            job_info = f"""
+        Igual que match_job() pero sin bloquear el event loop (ainvoke)
+
+        La llamada espera turno en el scheduler (si hay) y en el semáforo del
+        matcher (max_concurrency).
+        """
+        cached = await self._acached_results([job], user_keywords, user_location)
+        if cached:
+            return cached[id(job)]
+        return await self._amatch_job_uncached(job, user_keywords, user_location, priority)
+
+    def build_messages(
+        self, job: Job, user_keywords: List[str], user_location: str
+    ) -> List[BaseMessage]:
+        """[system instruction estática, delta de UN job]"""
+        return [self.system_message, HumanMessage(content=self.build_prompt(job, user_keywords, user_location))]
+
+    def build_prompt(self, job: Job, user_keywords: List[str], user_location: str) -> str:
+        """Delta de UN job (job + perfil); el few-shot va en self.system_message"""
+        # Construir información del job
+        job_info = f"""
 Job: {job.title}
 Company: {job.company}
 Remote: {'Yes' if job.is_remote else 'No'}
 Type: {job.job_type or 'Unknown'}
-Description: {job.description[:300] if job.description else 'No description'}..."""
+Description: {self.condenser.condense(job.description, user_keywords)}"""
 
-            # Construir perfil del usuario
-            user_profile = f"""
+        # Construir perfil del usuario
+        user_profile = f"""
 Keywords: {user_keywords}
 Location: {user_location}"""
 
-            # Llamar FewShotPromptTemplate
-            prompt = self.few_shot_prompt.format(
-                job_info=job_info,
-                user_profile=user_profile,
-            )
+        return MATCH_PROMPT.format(job_info=job_info, user_profile=user_profile)
 
-            logger.debug(f"Prompt:\n{prompt}")
+    def _match_job_uncached(
+        self, job: Job, user_keywords: List[str], user_location: str, priority: int = USER
+    ) -> JobMatchResult:
+        try:
+            messages = self.build_messages(job, user_keywords, user_location)
+            logger.debug(f"Prompt:\n{messages[-1].content}")
 
             # Llamar modelo estructurado
-            result = self.structured_llm.invoke(prompt)
+            result = self._finish_match(job, self._invoke(self.structured_llm, messages, priority))
+            self._cache_store([result], user_keywords, user_location)
+            return result
 
-            logger.info(
-                f"✅ Job matched: {job.title} @ {job.company} (score: {result.match_score})"
-            )
-            # Agregar job object al resultado
-            result.job = job
+        except QuotaExceeded:
+            return self._heuristic_result(job, user_keywords)
+        except Exception as e:
+            return self._failed_result(job, e, user_keywords)
+
+    async def _amatch_job_uncached(
+        self, job: Job, user_keywords: List[str], user_location: str, priority: int = USER
+    ) -> JobMatchResult:
+        try:
+            messages = self.build_messages(job, user_keywords, user_location)
+            logger.debug(f"Prompt:\n{messages[-1].content}")
+
+            result = self._finish_match(job, await self._ainvoke(self.structured_llm, messages, priority))
+            await self._acache_store([result], user_keywords, user_location)
             return result
 
+        except QuotaExceeded:
+            return self._heuristic_result(job, user_keywords)
         except Exception as e:
-            logger.error(f"❌ Error en JobMatcher: {e}")
-            # Fallback: score bajo (con job object)
-            return JobMatchResult(
-                job=job,
-                match_score=0,
-                personalized_message="⚠️ Error analizando este job",
-                telegram_message="⚠️ Error analizando este job. Intenta más tarde.",
-            )
+            return self._failed_result(job, e, user_keywords)
+
+    def _finish_match(self, job: Job, verdict: MatchVerdict) -> JobMatchResult:
+        logger.info(
+            f"✅ Job matched: {job.title} @ {job.company} (score: {verdict.match_score})"
+        )
+        return self._result_from_verdict(job, verdict)
+
+    def _failed_result(self, job: Job, error: Exception, user_keywords: List[str]) -> JobMatchResult:
+        """Llamada fallida: un 429 de Gemini recibe el score local (como el batch); el resto, error"""
+        if is_quota_error(error):
+            logger.warning(f"⚠️ Gemini sin cuota ({error}): score local para {job.title}")
+            return self._heuristic_result(job, user_keywords)
+        return self._error_result(job, error)
+
+    @staticmethod
+    def _error_result(job: Job, error: Exception) -> JobMatchResult:
+        logger.error(f"❌ Error en JobMatcher: {error}")
+        # Fallback: score bajo (con job object). No se cachea.
+        return JobMatchResult(
+            job=job,
+            match_score=0,
+            personalized_message="⚠️ Error analizando este job",
+            telegram_message="⚠️ Error analizando este job. Intenta más tarde.",
+        )
+
+    def _heuristic_result(self, job: Job, user_keywords: List[str]) -> JobMatchResult:
+        """Sin cuota de Gemini: score local (heuristic_scorer.py). No se cachea."""
+        score, reason, highlights = heuristic_verdict(job, user_keywords)
+        return self._result_from_verdict(
+            job, MatchVerdict(match_score=score, reason=reason, highlights=highlights)
+        )
 
     def match_jobs_batch(
         self,
         jobs: List[Job],
         user_keywords: List[str],
         user_location: str,
+        batched: bool = True,
+        priority: int = USER,
     ) -> List[JobMatchResult]:
         """
         Analizar múltiples jobs (para TOP 3-5)
 
+        Los jobs que ya están en la MatchCache no van a Gemini.
+
         Args:
             jobs: Lista de jobs a analizar
             user_keywords: Keywords del usuario
             user_location: Ubicación del usuario
+            batched: True = 1 sola llamada para todos (ver docstring del módulo);
+                     False = 1 llamada por job
+            priority: ADMIN o USER (turno en el scheduler)
 
         Returns:
-            List[JobMatchResult]: Resultados para cada job
+            List[JobMatchResult]: Resultados para cada job (mismo orden que jobs)
+        """
+        cached = self._cached_results(jobs, user_keywords, user_location)
+        pending = [job for job in jobs if id(job) not in cached]
+        fresh = self._match_pending(pending, user_keywords, user_location, batched, priority) if pending else []
+        return self._in_job_order(jobs, list(cached.values()) + fresh)
+
+    async def amatch_jobs_batch(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        batched: bool = True,
+        priority: int = USER,
+    ) -> List[JobMatchResult]:
+        """
+        Igual que match_jobs_batch() pero async
+
+        - batched=True: 1 ainvoke para todos; el fallback por job corre en paralelo
+        - batched=False: 1 ainvoke por job con asyncio.gather
+        En ambos casos las llamadas respetan el scheduler y el semáforo (max_concurrency).
+        Sin cuota: todos los jobs pendientes con score local, al instante.
         """
+        cached = await self._acached_results(jobs, user_keywords, user_location)
+        pending = [job for job in jobs if id(job) not in cached]
+        fresh = (
+            await self._amatch_pending(pending, user_keywords, user_location, batched, priority)
+            if pending
+            else []
+        )
+        return self._in_job_order(jobs, list(cached.values()) + fresh)
+
+    async def astream_jobs_batch(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        batched: bool = True,
+        priority: int = USER,
+    ) -> AsyncIterator[JobMatchResult]:
+        """
+        Igual que amatch_jobs_batch() pero entrega cada resultado apenas está listo
+
+        Orden de llegada (no el de jobs ni por score): primero los de MatchCache,
+        después cada job del batch en cuanto Gemini termina de escribir su
+        entrada, y al final los del fallback por job a medida que terminan.
+        Mismas reglas de scheduler, semáforo, caché y score local.
+
+        Ejemplo:
+            >>> async for result in matcher.astream_jobs_batch(top5, ["python"], "USA"):
+            ...     await send_card(result)
+        """
+        cached = await self._acached_results(jobs, user_keywords, user_location)
+        for job in jobs:
+            if id(job) in cached:
+                yield cached[id(job)]
+
+        pending = [job for job in jobs if id(job) not in cached]
+        if not pending:
+            return
+        if not batched or len(pending) <= 1:
+            async for result in self._astream_concurrently(pending, user_keywords, user_location, priority):
+                yield result
+            return
+
+        messages = self.build_batch_messages(pending, user_keywords, user_location)
+        logger.debug(f"Prompt batch:\n{messages[-1].content}")
+        scored = set()
+        try:
+            async with aclosing(self._astream_scores(pending, messages, priority)) as scores:
+                async for index, score in scores:
+                    scored.add(index)
+                    result = self._result_from_verdict(pending[index - 1], score)
+                    await self._acache_store([result], user_keywords, user_location)
+                    yield result
+        except QuotaExceeded:
+            for index, job in enumerate(pending, start=1):
+                if index not in scored:
+                    yield self._heuristic_result(job, user_keywords)
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ Batch de {len(pending)} jobs falló ({e}): fallback job por job")
+
+        # Gemini omitió estos jobs (o el stream se cortó): se analizan solos
+        missing = [job for index, job in enumerate(pending, start=1) if index not in scored]
+        logger.info(
+            f"✅ Batch (stream): {len(scored)}/{len(pending)} jobs en 1 llamada"
+            + (f", {len(missing)} por fallback" if missing else "")
+        )
+        async for result in self._astream_concurrently(missing, user_keywords, user_location, priority):
+            yield result
+
+    def _match_pending(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        batched: bool,
+        priority: int = USER,
+    ) -> List[JobMatchResult]:
+        """Jobs sin caché: 1 llamada batch (+ fallback por job) o 1 por job"""
+        if not batched or len(jobs) <= 1:
+            return self._match_jobs_one_by_one(jobs, user_keywords, user_location, priority)
+
+        try:
+            messages = self.build_batch_messages(jobs, user_keywords, user_location)
+            logger.debug(f"Prompt batch:\n{messages[-1].content}")
+            response = self._invoke(self.batch_llm, messages, priority, len(jobs))
+            scores = self._parse_batch(jobs, response)
+        except QuotaExceeded:
+            return [self._heuristic_result(job, user_keywords) for job in jobs]
+        except Exception as e:
+            logger.warning(f"⚠️ Batch de {len(jobs)} jobs falló ({e}): fallback job por job")
+            return self._match_jobs_one_by_one(jobs, user_keywords, user_location, priority)
+
+        # Gemini omitió estos jobs: se analizan solos
+        missing = [job for index, job in enumerate(jobs, start=1) if index not in scores]
+        fallback = self._match_jobs_one_by_one(missing, user_keywords, user_location, priority)
+        from_batch = self._batch_results(jobs, scores)
+        self._cache_store(from_batch, user_keywords, user_location)
+        return self._merge_batch(jobs, from_batch, fallback)
+
+    async def _amatch_pending(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        batched: bool,
+        priority: int = USER,
+    ) -> List[JobMatchResult]:
+        if not batched or len(jobs) <= 1:
+            return await self._amatch_jobs_concurrently(jobs, user_keywords, user_location, priority)
+
+        try:
+            messages = self.build_batch_messages(jobs, user_keywords, user_location)
+            logger.debug(f"Prompt batch:\n{messages[-1].content}")
+            response = await self._ainvoke(self.batch_llm, messages, priority, len(jobs))
+            scores = self._parse_batch(jobs, response)
+        except QuotaExceeded:
+            return [self._heuristic_result(job, user_keywords) for job in jobs]
+        except Exception as e:
+            logger.warning(f"⚠️ Batch de {len(jobs)} jobs falló ({e}): fallback job por job")
+            return await self._amatch_jobs_concurrently(jobs, user_keywords, user_location, priority)
+
+        missing = [job for index, job in enumerate(jobs, start=1) if index not in scores]
+        fallback = await self._amatch_jobs_concurrently(missing, user_keywords, user_location, priority)
+        from_batch = self._batch_results(jobs, scores)
+        await self._acache_store(from_batch, user_keywords, user_location)
+        return self._merge_batch(jobs, from_batch, fallback)
+
+    def _match_jobs_one_by_one(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        priority: int = USER,
+    ) -> List[JobMatchResult]:
+        """Una llamada a Gemini por job (modo original)"""
         results = []
         for job in jobs:
             try:
-                result = self.match_job(job, user_keywords, user_location)
+                result = self._match_job_uncached(job, user_keywords, user_location, priority)
                 results.append(result)
             except Exception as e:
                 logger.error(f"Error matching {job.title}: {e}")
                 continue
 
         return results
+
+    async def _amatch_jobs_concurrently(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        priority: int = USER,
+    ) -> List[JobMatchResult]:
+        """Todos los jobs a la vez (scheduler y semáforo limitan cuántos llaman a Gemini)"""
+        outcomes = await asyncio.gather(
+            *(self._amatch_job_uncached(job, user_keywords, user_location, priority) for job in jobs),
+            return_exceptions=True,
+        )
+        results = []
+        for job, outcome in zip(jobs, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error matching {job.title}: {outcome}")
+                continue
+            results.append(outcome)
+        return results
+
+    async def _astream_concurrently(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        priority: int = USER,
+    ) -> AsyncIterator[JobMatchResult]:
+        """Como _amatch_jobs_concurrently() pero entrega cada job al terminar"""
+        tasks = [
+            asyncio.ensure_future(self._amatch_job_uncached(job, user_keywords, user_location, priority))
+            for job in jobs
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    logger.error(f"Error matching job: {e}")
+                    continue
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _parse_batch(jobs: List[Job], response: BatchMatchResponse) -> Dict[int, BatchJobScore]:
+        """
+        Respuesta batch → index (1..N) → score
+
+        Índices fuera de rango o repetidos se ignoran (gana el primero)
+        """
+        scores: Dict[int, BatchJobScore] = {}
+        for score in response.results:
+            if 1 <= score.index <= len(jobs) and score.index not in scores:
+                scores[score.index] = score
+        return scores
+
+    @staticmethod
+    def _complete_scores(jobs: List[Job], text: str) -> Dict[int, BatchJobScore]:
+        """
+        JSON batch a medio escribir → scores de las entradas ya cerradas
+
+        La última entrada de "results" puede estar cortada (reason a medias):
+        solo cuentan las anteriores a ella.
+        """
+        try:
+            data = parse_partial_json(text)
+        except ValueError:
+            return {}
+        items = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            return {}
+
+        complete = []
+        for item in items[:-1]:
+            try:
+                complete.append(BatchJobScore.model_validate(item))
+            except ValidationError:
+                continue
+        return JobMatcher._parse_batch(jobs, BatchMatchResponse.model_construct(results=complete))
+
+    def _batch_results(self, jobs: List[Job], scores: Dict[int, BatchJobScore]) -> List[JobMatchResult]:
+        """Resultados de las entradas del batch (el caller los guarda en caché)"""
+        return [
+            self._result_from_verdict(job, scores[index])
+            for index, job in enumerate(jobs, start=1)
+            if index in scores
+        ]
+
+    def _merge_batch(
+        self, jobs: List[Job], from_batch: List[JobMatchResult], fallback: List[JobMatchResult]
+    ) -> List[JobMatchResult]:
+        """Resultados del batch + los del fallback, en el orden de jobs"""
+        logger.info(
+            f"✅ Batch: {len(from_batch)}/{len(jobs)} jobs en 1 llamada"
+            + (f", {len(fallback)} por fallback" if fallback else "")
+        )
+        return self._in_job_order(jobs, from_batch + fallback)
+
+    @staticmethod
+    def _in_job_order(jobs: List[Job], results: List[JobMatchResult]) -> List[JobMatchResult]:
+        """Ordenar resultados como jobs (los jobs sin resultado se omiten)"""
+        by_job = {id(result.job): result for result in results}
+        return [by_job[id(job)] for job in jobs if id(job) in by_job]
+
+    # ------------------------------------------------------------------
+    # MatchCache
+    # ------------------------------------------------------------------
+
+    def _cached_results(
+        self, jobs: List[Job], user_keywords: List[str], user_location: str
+    ) -> Dict[int, JobMatchResult]:
+        """id(job) → resultado guardado, para los jobs que ya están en caché"""
+        if not self.cache.enabled:
+            return {}
+        keys = self._cache_keys(jobs, user_keywords, user_location)
+        return self._results_from_cache(jobs, keys, self.cache.get_many(keys))
+
+    async def _acached_results(
+        self, jobs: List[Job], user_keywords: List[str], user_location: str
+    ) -> Dict[int, JobMatchResult]:
+        """Igual que _cached_results() pero el SQLite corre fuera del event loop"""
+        if not self.cache.enabled:
+            return {}
+        keys = self._cache_keys(jobs, user_keywords, user_location)
+        return self._results_from_cache(jobs, keys, await self.cache.aget_many(keys))
+
+    @staticmethod
+    def _cache_keys(jobs: List[Job], user_keywords: List[str], user_location: str) -> List[MatchKey]:
+        return [make_match_key(job, user_keywords, user_location, PROMPT_VERSION) for job in jobs]
+
+    @staticmethod
+    def _results_from_cache(
+        jobs: List[Job], keys: List[MatchKey], found: Dict[MatchKey, dict]
+    ) -> Dict[int, JobMatchResult]:
+        results = {}
+        for job, key in zip(jobs, keys):
+            value = found.get(key)
+            if value is not None:
+                # El mensaje se re-arma con el template actual (no el de cuando se guardó)
+                value = dict(
+                    value,
+                    telegram_message=format_telegram_message(
+                        job, value["match_score"], value["personalized_message"]
+                    ),
+                )
+                results[id(job)] = JobMatchResult(job=job, **value)
+        if results:
+            logger.info(f"💾 {len(results)}/{len(jobs)} jobs desde MatchCache (sin Gemini)")
+        return results
+
+    @staticmethod
+    def _cache_items(
+        results: List[JobMatchResult], user_keywords: List[str], user_location: str
+    ) -> List[Tuple[MatchKey, dict]]:
+        return [
+            (
+                make_match_key(result.job, user_keywords, user_location, PROMPT_VERSION),
+                result.model_dump(
+                    include={"match_score", "personalized_message", "telegram_message", "highlights"}
+                ),
+            )
+            for result in results
+        ]
+
+    def _cache_store(self, results: List[JobMatchResult], user_keywords: List[str], user_location: str) -> None:
+        """Guardar resultados de Gemini (una transacción por llamada)"""
+        if self.cache.enabled:
+            self.cache.set_many(self._cache_items(results, user_keywords, user_location))
+
+    async def _acache_store(
+        self, results: List[JobMatchResult], user_keywords: List[str], user_location: str
+    ) -> None:
+        """Igual que _cache_store() pero el commit corre fuera del event loop"""
+        if self.cache.enabled:
+            await self.cache.aset_many(self._cache_items(results, user_keywords, user_location))
+
+    def build_batch_messages(
+        self, jobs: List[Job], user_keywords: List[str], user_location: str
+    ) -> List[BaseMessage]:
+        """[system instruction batch estática, delta con perfil + jobs]"""
+        return [
+            self.batch_system_message,
+            HumanMessage(content=self.build_batch_prompt(jobs, user_keywords, user_location)),
+        ]
+
+    def build_batch_prompt(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+    ) -> str:
+        """Delta batch: perfil 1 vez + 1 resumen compacto por job"""
+        user_profile = f"Keywords: {user_keywords}\nLocation: {user_location}"
+        summaries = "\n".join(
+            self._job_summary(index, job, user_keywords) for index, job in enumerate(jobs, start=1)
+        )
+        return BATCH_PROMPT.format(user_profile=user_profile, jobs=summaries, n_jobs=len(jobs))
+
+    def _job_summary(self, index: int, job: Job, user_keywords: List[str]) -> str:
+        """'[1] Senior Python Dev | Acme | Remote | contract — Requirements: Python...'"""
+        return (
+            f"[{index}] {job.title} | {job.company} | "
+            f"{'Remote' if job.is_remote else 'On-site'} | {job.job_type or 'Unknown'}"
+            f" — {self.condenser.condense(job.description, user_keywords)}"
+        )
+
+    @staticmethod
+    def _result_from_verdict(job: Job, verdict: MatchVerdict) -> JobMatchResult:
+        """MatchVerdict (de Gemini) → JobMatchResult con job y mensaje armados localmente"""
+        highlights = [h.strip() for h in verdict.highlights if h and h.strip()][:MAX_HIGHLIGHTS]
+        return JobMatchResult(
+            job=job,
+            match_score=verdict.match_score,
+            personalized_message=verdict.reason,
+            telegram_message=format_telegram_message(job, verdict.match_score, verdict.reason),
+            highlights=highlights,
+        )
+
+    async def aclose(self) -> None:
+        """Cerrar los clientes HTTP del modelo (sync y async), si los expone"""
+        client = getattr(self.llm, "client", None)
+        try:
+            aio = getattr(client, "aio", None)
+            if aio is not None and hasattr(aio, "aclose"):
+                await aio.aclose()
+            if client is not None and hasattr(client, "close"):
+                client.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error cerrando cliente de Gemini: {e}")
+
+    # ------------------------------------------------------------------
+    # Llamadas al modelo (scheduler + semáforo)
+    # ------------------------------------------------------------------
+
+    def _invoke(
+        self, runnable: Any, messages: List[BaseMessage], priority: int, n_jobs: int = 1
+    ) -> Any:
+        """
+        invoke() con turno del scheduler (sin espera) → modelo parseado
+
+        Raises:
+            QuotaExceeded: Sin cuota en este momento
+        """
+        reservation = None
+        if self.scheduler is not None:
+            reservation = self.scheduler.reserve_nowait(priority, self._estimate_tokens(messages, n_jobs))
+        try:
+            output = runnable.invoke(messages)
+        except Exception as e:
+            self._check_quota_error(e)
+            raise
+        return self._unwrap(output, reservation, messages, n_jobs)
+
+    async def _ainvoke(
+        self, runnable: Any, messages: List[BaseMessage], priority: int, n_jobs: int = 1
+    ) -> Any:
+        """
+        ainvoke() con turno del scheduler (espera hasta max_wait) y del semáforo
+
+        Raises:
+            QuotaExceeded: Sin cuota dentro de la espera máxima
+        """
+        slot = (
+            self.scheduler.slot(priority, self._estimate_tokens(messages, n_jobs))
+            if self.scheduler is not None
+            else nullcontext()
+        )
+        async with slot as reservation:
+            async with self._semaphore:
+                try:
+                    output = await runnable.ainvoke(messages)
+                except Exception as e:
+                    self._check_quota_error(e)
+                    raise
+        return self._unwrap(output, reservation, messages, n_jobs)
+
+    async def _astream_scores(
+        self, jobs: List[Job], messages: List[BaseMessage], priority: int
+    ) -> AsyncIterator[Tuple[int, BatchJobScore]]:
+        """
+        (index, score) del batch a medida que Gemini escribe la respuesta
+
+        Los tokens llegan por astream_events() (on_chat_model_stream: el
+        include_raw de with_structured_output no deja pasar chunks por astream);
+        cada entrada de "results" sale cuando empieza la siguiente y la última
+        (y las que el JSON parcial no dejó ver) con la respuesta completa
+        (on_chain_end). Sin astream_events() es un _ainvoke() normal.
+
+        Raises:
+            QuotaExceeded: Sin cuota dentro de la espera máxima
+        """
+        if not self._supports_streaming(self.batch_llm):
+            response = await self._ainvoke(self.batch_llm, messages, priority, len(jobs))
+            for index, score in self._parse_batch(jobs, response).items():
+                yield index, score
+            return
+
+        # El stream corre en una tarea aparte que llena una cola: el turno del
+        # scheduler y el semáforo se sueltan apenas Gemini termina, aunque el
+        # consumidor siga pausado entre resultados (ej: mandando tarjetas)
+        queue: asyncio.Queue = asyncio.Queue()
+        producer = asyncio.ensure_future(self._produce_scores(jobs, messages, priority, queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    async def _produce_scores(
+        self, jobs: List[Job], messages: List[BaseMessage], priority: int, queue: asyncio.Queue
+    ) -> None:
+        """
+        Productor de _astream_scores(): (index, score) a la cola, luego None
+
+        Un error (QuotaExceeded incluido) va a la cola en lugar del None.
+        """
+        slot = (
+            self.scheduler.slot(priority, self._estimate_tokens(messages, len(jobs)))
+            if self.scheduler is not None
+            else nullcontext()
+        )
+        emitted = set()
+        text, output = "", None
+        try:
+            async with slot as reservation:
+                async with self._semaphore:
+                    try:
+                        async for event in self.batch_llm.astream_events(messages, version="v2"):
+                            if event["event"] == "on_chat_model_stream":
+                                text += _message_text(event["data"]["chunk"])
+                                for index, score in self._complete_scores(jobs, text).items():
+                                    if index not in emitted:
+                                        emitted.add(index)
+                                        queue.put_nowait((index, score))
+                            elif event["event"] == "on_chain_end" and not event.get("parent_ids"):
+                                output = event["data"].get("output")
+                    except Exception as e:
+                        self._check_quota_error(e)
+                        raise
+
+            if output is None:
+                raise ValueError("El stream terminó sin respuesta final")
+            response = self._unwrap(output, reservation, messages, len(jobs))
+            for index, score in self._parse_batch(jobs, response).items():
+                if index not in emitted:
+                    queue.put_nowait((index, score))
+        except Exception as e:
+            queue.put_nowait(e)
+        else:
+            queue.put_nowait(None)
+
+    @staticmethod
+    def _supports_streaming(runnable: Any) -> bool:
+        """astream_events() de verdad (Runnable de LangChain, ReplayLLM); los mocks no cuentan"""
+        return callable(getattr(type(runnable), "astream_events", None))
+
+    @staticmethod
+    def _estimate_tokens(messages: List[BaseMessage], n_jobs: int) -> int:
+        """Tokens a reservar: prefijo + delta + respuesta esperada"""
+        return sum(estimate_tokens(m.content) for m in messages) + VERDICT_OUTPUT_TOKENS * n_jobs
+
+    def _check_quota_error(self, error: Exception) -> None:
+        """Un 429 de Gemini pese al scheduler: pausar las siguientes llamadas"""
+        if self.scheduler is not None and is_quota_error(error):
+            self.scheduler.penalize()
+
+    def _unwrap(
+        self,
+        output: Any,
+        reservation: Optional[Reservation] = None,
+        messages: Optional[List[BaseMessage]] = None,
+        n_jobs: int = 1,
+    ) -> Any:
+        """
+        Salida de with_structured_output(include_raw=True) → modelo parseado
+
+        Suma los tokens de usage_metadata a self.usage, corrige con ellos la
+        estimación reservada en el scheduler y registra la llamada en el ledger
+        (prefijo = system instruction, delta = último mensaje).
+
+        Raises:
+            ValueError: Si Gemini respondió algo que no valida contra el schema
+        """
+        if not isinstance(output, dict) or "parsed" not in output:
+            return output  # LLM sin include_raw (ya es el modelo)
+
+        usage = getattr(output.get("raw"), "usage_metadata", None) or {}
+        self.usage["calls"] += 1
+        self.usage["input_tokens"] += usage.get("input_tokens", 0)
+        self.usage["output_tokens"] += usage.get("output_tokens", 0)
+        if reservation is not None and usage:
+            reservation.tokens = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        if messages:
+            self.ledger.record(
+                "batch" if n_jobs > 1 else "single",
+                n_jobs,
+                prefix_tokens=sum(estimate_tokens(m.content) for m in messages[:-1]),
+                delta_tokens=estimate_tokens(messages[-1].content),
+                usage=usage,
+            )
+
+        if output.get("parsing_error") is not None or output.get("parsed") is None:
+            raise ValueError(f"Respuesta no parseable: {output.get('parsing_error')}")
+        return output["parsed"]
+
+
+def _message_text(message: Any) -> str:
+    """Texto de un AIMessage(Chunk): content str o lista de partes"""
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, (str, dict))
+    )
+
+
+def format_telegram_message(job: Job, match_score: float, reason: str) -> str:
+    """
+    Mensaje de Telegram con el formato de EXAMPLES, armado con datos locales
+
+    Valores escapados para parse_mode="Markdown" (ver message_renderer.py).
+
+    Ejemplo:
+        ✅ Senior Python Developer
+        🏢 Acme Corp
+        📍 Remote | 💼 contract
+        ⭐ Score: 85/100
+
+        🤖 Matches porque: ✅ Python, ✅ Remote
+
+        🔗 [Ver en Indeed](https://indeed.com/jobs/123)
+    """
+    return render_job_message(job, match_score, reason)
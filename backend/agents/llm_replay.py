@@ -0,0 +1,386 @@
+"""
+LLM Replay - Grabar y reproducir respuestas de Gemini para JobMatcher
+
+Propósito:
+- Sin API key ni red no había forma de medir o hacer regression-test de
+  JobMatcher: cada corrida gasta cuota (5 RPM / 20 RPD) y depende de la red
+- RecordingLLM envuelve el chat model real y guarda cada prompt → respuesta
+  en un cassette (JSONL); ReplayLLM lo reproduce offline con latencia y tasa
+  de errores configurables
+- Los dos se inyectan con JobMatcher(llm=...) (misma interfaz que usa el
+  matcher: with_structured_output(schema, method, include_raw) →
+  invoke/ainvoke). Así se pueden ajustar batching, caché y concurrencia en
+  una laptop (ver scripts/bench_replay.py)
+
+Cassette (una línea JSON por llamada):
+    {"key": sha256(schema + mensajes), "schema": "BatchMatchResponse",
+     "prompt": "<delta de la llamada>", "parsed": {...},
+     "usage": {"input_tokens": 480, "output_tokens": 120}, "latency": 1.84}
+
+Replay:
+- Latencia: la grabada × latency_scale + jitter uniforme (0..jitter s)
+- Errores: con probabilidad error_rate la llamada lanza ReplayError con un
+  mensaje tipo 429 o 500 (error_kind), para probar fallbacks y el scheduler
+- Prompt no grabado: on_miss="error" lanza CassetteMiss; on_miss="synthesize"
+  arma una respuesta válida (score determinístico por hash del prompt) con
+  la latencia mediana del cassette
+- astream_events(): el JSON de la respuesta en chunks de STREAM_CHUNK_CHARS
+  repartidos en la latencia, como el stream de tokens de Gemini
+
+Record:
+- astream_events() deja pasar los eventos del modelo real y graba la salida
+  final (on_chain_end): el batch streameado de /vacantes también queda en el
+  cassette
+
+Ejemplo:
+    >>> recorder = RecordingLLM(ChatGoogleGenerativeAI(model="gemini-2.5-flash"), "jobs.jsonl")
+    >>> JobMatcher(llm=recorder).match_jobs_batch(top5, ["python"], "USA")   # graba
+    >>> replay = ReplayLLM("jobs.jsonl", latency_scale=0.5, error_rate=0.1)
+    >>> JobMatcher(llm=replay).match_jobs_batch(top5, ["python"], "USA")     # offline
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import statistics
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type
+
+from langchain_core.messages import AIMessageChunk
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Latencia de respuestas sintetizadas si el cassette está vacío
+DEFAULT_SYNTHETIC_LATENCY = 1.0
+
+# Caracteres de JSON por chunk en astream_events() (~ unos pocos tokens de Gemini)
+STREAM_CHUNK_CHARS = 24
+
+# Índices de jobs en el delta batch: "[3] Senior Python Dev | ..."
+BATCH_INDEX_RE = re.compile(r"^\[(\d+)\]", re.MULTILINE)
+
+ERROR_MESSAGES = {
+    "quota": "429 RESOURCE_EXHAUSTED: quota exceeded (replay)",
+    "server": "500 INTERNAL: backend error (replay)",
+}
+
+
+class CassetteMiss(KeyError):
+    """El prompt no está en el cassette (on_miss="error")"""
+
+
+class ReplayError(RuntimeError):
+    """Error inyectado por ReplayLLM (error_rate)"""
+
+
+def _content(messages: Any) -> List[str]:
+    """str | [BaseMessage] → contenidos de texto"""
+    if isinstance(messages, str):
+        return [messages]
+    return [getattr(m, "content", str(m)) for m in messages]
+
+
+def cassette_key(schema: Type[BaseModel], messages: Any) -> str:
+    """Key estable de una llamada: schema + texto de todos los mensajes"""
+    digest = hashlib.sha256(schema.__name__.encode())
+    for content in _content(messages):
+        digest.update(b"\x00" + content.encode())
+    return digest.hexdigest()
+
+
+def _usage_metadata(usage: dict) -> Optional[dict]:
+    """usage grabado → UsageMetadata de LangChain (exige total_tokens)"""
+    if not usage:
+        return None
+    metadata = {
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "total_tokens": usage.get("total_tokens", usage.get("input_tokens", 0) + usage.get("output_tokens", 0)),
+    }
+    if usage.get("input_token_details"):
+        metadata["input_token_details"] = usage["input_token_details"]
+    return metadata
+
+
+def _raw_output(parsed: BaseModel, usage: dict) -> dict:
+    """Misma forma que with_structured_output(include_raw=True)"""
+    return {"raw": SimpleNamespace(usage_metadata=usage), "parsed": parsed, "parsing_error": None}
+
+
+# ============================================================================
+# RECORDER
+# ============================================================================
+
+
+class RecordingLLM:
+    """
+    Chat model que delega en `llm` y graba cada respuesta en el cassette
+
+    Solo se graban respuestas que parsean (las fallidas no sirven para replay).
+    """
+
+    def __init__(self, llm: Any, path: str):
+        self.llm = llm
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """Cliente del modelo real (JobMatcher.aclose() lo cierra)"""
+        return getattr(self.llm, "client", None)
+
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs: Any) -> "_RecordingRunnable":
+        return _RecordingRunnable(self, schema, self.llm.with_structured_output(schema, **kwargs))
+
+    def _record(self, schema: Type[BaseModel], messages: Any, output: Any, latency: float) -> None:
+        if isinstance(output, dict):  # include_raw=True
+            parsed = output.get("parsed")
+            usage = getattr(output.get("raw"), "usage_metadata", None) or {}
+        else:
+            parsed, usage = output, {}
+        if not isinstance(parsed, BaseModel):
+            return
+        entry = {
+            "key": cassette_key(schema, messages),
+            "schema": schema.__name__,
+            "prompt": _content(messages)[-1],
+            "parsed": parsed.model_dump(mode="json"),
+            "usage": dict(usage),
+            "latency": round(latency, 4),
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.recorded += 1
+
+
+class _RecordingRunnable:
+    def __init__(self, recorder: RecordingLLM, schema: Type[BaseModel], inner: Any):
+        self._recorder = recorder
+        self._schema = schema
+        self._inner = inner
+
+    def invoke(self, messages: Any) -> Any:
+        start = time.perf_counter()
+        output = self._inner.invoke(messages)
+        self._recorder._record(self._schema, messages, output, time.perf_counter() - start)
+        return output
+
+    async def ainvoke(self, messages: Any) -> Any:
+        start = time.perf_counter()
+        output = await self._inner.ainvoke(messages)
+        self._recorder._record(self._schema, messages, output, time.perf_counter() - start)
+        return output
+
+    async def astream_events(self, messages: Any, version: str = "v2") -> AsyncIterator[dict]:
+        """
+        Eventos del modelo real tal cual; la salida final (on_chain_end raíz)
+        se graba como la de ainvoke(). Si el modelo no streamea: ainvoke() y
+        un solo on_chain_end
+        """
+        if not callable(getattr(type(self._inner), "astream_events", None)):
+            output = await self.ainvoke(messages)
+            yield {"event": "on_chain_end", "data": {"output": output}, "parent_ids": []}
+            return
+
+        start = time.perf_counter()
+        async for event in self._inner.astream_events(messages, version=version):
+            if event["event"] == "on_chain_end" and not event.get("parent_ids"):
+                output = event["data"].get("output")
+                self._recorder._record(self._schema, messages, output, time.perf_counter() - start)
+            yield event
+
+
+# ============================================================================
+# REPLAYER
+# ============================================================================
+
+
+class ReplayLLM:
+    """
+    Chat model offline que responde desde un cassette
+
+    Ejemplo:
+        >>> replay = ReplayLLM("jobs.jsonl", latency_scale=0, on_miss="synthesize")
+        >>> matcher = JobMatcher(llm=replay)
+        >>> replay.stats()   # {"calls": 5, "hits": 4, "misses": 1, "errors": 0}
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        entries: Optional[Sequence[dict]] = None,
+        latency_scale: float = 1.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_kind: str = "server",
+        on_miss: str = "error",
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            path: Cassette JSONL (de RecordingLLM)
+            entries: Entradas ya cargadas (en vez de / además de path)
+            latency_scale: Multiplica la latencia grabada (0 = sin espera)
+            jitter: Segundos extra aleatorios (uniforme 0..jitter) por llamada
+            error_rate: Probabilidad 0-1 de que una llamada lance ReplayError
+            error_kind: "server" (500) o "quota" (429, activa el scheduler)
+            on_miss: "error" (CassetteMiss) o "synthesize" (respuesta armada)
+            seed: Semilla para jitter / errores reproducibles
+        """
+        if on_miss not in ("error", "synthesize"):
+            raise ValueError("on_miss debe ser 'error' o 'synthesize'")
+        if error_kind not in ERROR_MESSAGES:
+            raise ValueError(f"error_kind debe ser uno de {sorted(ERROR_MESSAGES)}")
+
+        self.latency_scale = latency_scale
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_kind = error_kind
+        self.on_miss = on_miss
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._entries: Dict[str, dict] = {}
+        for entry in list(entries or []) + (self.load(path) if path else []):
+            self._entries[entry["key"]] = entry
+        latencies = [e.get("latency", 0.0) for e in self._entries.values()]
+        self.median_latency = statistics.median(latencies) if latencies else DEFAULT_SYNTHETIC_LATENCY
+        logger.info(f"📼 ReplayLLM: {len(self._entries)} respuestas grabadas (on_miss={on_miss})")
+
+        self.calls = self.hits = self.misses = self.errors = 0
+
+    @staticmethod
+    def load(path: str) -> List[dict]:
+        """Leer un cassette (líneas vacías o corruptas se saltan)"""
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs: Any) -> "_ReplayRunnable":
+        return _ReplayRunnable(self, schema, include_raw=kwargs.get("include_raw", False))
+
+    def _respond(self, schema: Type[BaseModel], messages: Any) -> tuple:
+        """→ (salida, latencia a simular); lanza ReplayError / CassetteMiss"""
+        with self._lock:
+            self.calls += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+            entry = self._entries.get(cassette_key(schema, messages))
+            if failed:
+                self.errors += 1
+            elif entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if failed:
+            latency = self.median_latency * self.latency_scale + extra
+            return ReplayError(ERROR_MESSAGES[self.error_kind]), latency
+
+        if entry is not None:
+            parsed = schema.model_validate(entry["parsed"])
+            usage = entry.get("usage", {})
+            latency = entry.get("latency", 0.0) * self.latency_scale + extra
+            return (parsed, usage), latency
+
+        if self.on_miss == "error":
+            return CassetteMiss(f"Prompt no grabado en el cassette ({schema.__name__})"), 0.0
+        parsed, usage = self._synthesize(schema, messages)
+        return (parsed, usage), self.median_latency * self.latency_scale + extra
+
+    @staticmethod
+    def _synthesize(schema: Type[BaseModel], messages: Any) -> tuple:
+        """Respuesta válida para un prompt no grabado (score estable por hash)"""
+        contents = _content(messages)
+        delta = contents[-1]
+
+        def score(salt: str) -> int:
+            return int(hashlib.sha256((delta + salt).encode()).hexdigest(), 16) % 101
+
+        if "results" in schema.model_fields:  # BatchMatchResponse
+            indices = [int(i) for i in BATCH_INDEX_RE.findall(delta)]
+            parsed = schema.model_validate(
+                {"results": [{"index": i, "match_score": score(str(i)), "reason": "Respuesta sintética (replay)"} for i in indices]}
+            )
+        else:
+            parsed = schema.model_validate({"match_score": score(""), "reason": "Respuesta sintética (replay)"})
+
+        input_tokens = sum(len(c) for c in contents) // 4
+        output_tokens = len(parsed.model_dump_json()) // 4
+        return parsed, {"input_tokens": input_tokens, "output_tokens": output_tokens}
+
+    def stats(self) -> dict:
+        """Llamadas, hits / misses del cassette y errores inyectados"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "calls": self.calls,
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+            }
+
+
+class _ReplayRunnable:
+    def __init__(self, replay: ReplayLLM, schema: Type[BaseModel], include_raw: bool):
+        self._replay = replay
+        self._schema = schema
+        self._include_raw = include_raw
+
+    def _output(self, result: Any) -> Any:
+        if isinstance(result, Exception):
+            raise result
+        parsed, usage = result
+        return _raw_output(parsed, usage) if self._include_raw else parsed
+
+    def invoke(self, messages: Any) -> Any:
+        result, latency = self._replay._respond(self._schema, messages)
+        if latency > 0:
+            time.sleep(latency)
+        return self._output(result)
+
+    async def ainvoke(self, messages: Any) -> Any:
+        result, latency = self._replay._respond(self._schema, messages)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        return self._output(result)
+
+    async def astream_events(self, messages: Any, version: str = "v2") -> AsyncIterator[dict]:
+        """
+        Como ainvoke() pero con los eventos que JobMatcher lee del Runnable de
+        LangChain: on_chat_model_stream con pedazos del JSON (la latencia se
+        reparte entre ellos; el último trae el usage) y on_chain_end con la
+        salida final
+        """
+        result, latency = self._replay._respond(self._schema, messages)
+        if isinstance(result, Exception):
+            if latency > 0:
+                await asyncio.sleep(latency)
+            raise result
+
+        parsed, usage = result
+        text = parsed.model_dump_json()
+        pieces = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)]
+        for n, piece in enumerate(pieces, start=1):
+            if latency > 0:
+                await asyncio.sleep(latency / len(pieces))
+            last = n == len(pieces)
+            chunk = AIMessageChunk(content=piece, usage_metadata=_usage_metadata(usage) if last else None)
+            yield {"event": "on_chat_model_stream", "data": {"chunk": chunk}, "parent_ids": []}
+        yield {"event": "on_chain_end", "data": {"output": self._output(result)}, "parent_ids": []}
@@ -0,0 +1,338 @@
+"""
+LLM Scheduler - Cuota global de Gemini (RPM, RPD, tokens) con prioridad
+
+Propósito:
+- Los límites del free tier de Gemini (5 RPM, 20 RPD, 250k tokens/min) son
+  por API key, o sea por PROCESO, pero cada JobMatcher solo tenía un semáforo
+  de concurrencia: con 3 usuarios a la vez el 6º request del minuto se iba a
+  Gemini igual, volvía 429 y el usuario veía "⚠️ Error analizando este job"
+- El scheduler lleva la cuenta de requests y tokens en ventanas deslizantes
+  y decide ANTES de llamar: pasar ya, esperar turno o rechazar
+- Cola por prioridad: el admin (ADMIN_CHAT_ID) pasa antes que los usuarios
+- Sin cuota (RPD agotado o la espera supera max_wait): QuotaExceeded al
+  instante; JobMatcher responde con el score local de heuristic_scorer.py
+  y el usuario recibe su lista ordenada igual
+
+Ventanas:
+- Minuto: requests (rpm) y tokens (tpm) de los últimos window_seconds
+- Día: requests (rpd) y tokens (tpd, opcional) de las últimas day_seconds.
+  Gemini reinicia el RPD a medianoche del Pacífico; la ventana deslizante de
+  24 h es más conservadora y no depende de zona horaria
+- Los tokens de cada request se reservan con una estimación del prompt y se
+  corrigen con el usage_metadata real al terminar (Reservation.tokens)
+
+Ciclo de vida:
+- bot/main.py llama init_llm_scheduler() en post_init con los límites de
+  bot/config.py; el MatcherPool se lo pasa a sus JobMatchers
+- Un JobMatcher sin scheduler (scripts, tests) no tiene límite de cuota
+
+Ejemplo:
+    >>> scheduler = get_llm_scheduler()
+    >>> async with scheduler.slot(priority=ADMIN, tokens=900) as reservation:
+    ...     output = await llm.ainvoke(prompt)
+    ...     reservation.tokens = output_tokens_reales
+    >>> scheduler.stats()   # {"rpm_used": 1, "rpd_used": 1, "rejected": 0, ...}
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Prioridades: menor = antes
+ADMIN = 0
+USER = 1
+
+# Límites del free tier de gemini-2.5-flash (solo defaults: el bot los lee
+# del entorno en bot/config.py y los pasa a init_llm_scheduler())
+GEMINI_RPM = 5
+GEMINI_RPD = 20
+GEMINI_TPM = 250000
+GEMINI_TPD = 0  # 0 = sin límite diario de tokens
+# Segundos que un request espera turno antes de caer al score local
+GEMINI_MAX_WAIT = 8.0
+
+# Cuánto bloquear las llamadas cuando Gemini igual devuelve 429
+QUOTA_COOLDOWN_SECONDS = 60.0
+
+QUOTA_ERROR_MARKERS = ("429", "RESOURCE_EXHAUSTED", "quota")
+
+
+class QuotaExceeded(Exception):
+    """No hay cuota de Gemini para este request dentro de max_wait"""
+
+    def __init__(self, reason: str, retry_in: float):
+        super().__init__(f"Cuota de Gemini agotada ({reason}), reintentar en {retry_in:.0f}s")
+        self.reason = reason
+        self.retry_in = retry_in
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """¿La excepción de Gemini es un 429 / RESOURCE_EXHAUSTED?"""
+    text = str(error)
+    return any(marker in text for marker in QUOTA_ERROR_MARKERS)
+
+
+@dataclass
+class Reservation:
+    """Un request admitido: cuenta en las ventanas con `tokens` (corregible)"""
+
+    at: float
+    tokens: int
+    priority: int
+
+
+class LLMScheduler:
+    """
+    Admisión de llamadas a Gemini según RPM, RPD y presupuestos de tokens
+
+    Async-first: slot() espera turno en una cola por prioridad. reserve_nowait()
+    es la variante sin espera para el camino sync (scripts).
+    """
+
+    def __init__(
+        self,
+        rpm: int = GEMINI_RPM,
+        rpd: int = GEMINI_RPD,
+        tpm: int = GEMINI_TPM,
+        tpd: int = GEMINI_TPD,
+        max_wait: float = GEMINI_MAX_WAIT,
+        window_seconds: float = 60.0,
+        day_seconds: float = 86400.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rpm: Requests por ventana de window_seconds (0 = sin límite)
+            rpd: Requests por ventana de day_seconds (0 = sin límite)
+            tpm: Tokens por ventana de window_seconds (0 = sin límite)
+            tpd: Tokens por ventana de day_seconds (0 = sin límite)
+            max_wait: Segundos máximos de espera por turno antes de QuotaExceeded
+            window_seconds / day_seconds: Largo de las ventanas (configurables para tests)
+            clock: Reloj monotónico (inyectable para tests)
+        """
+        self.rpm, self.rpd, self.tpm, self.tpd = rpm, rpd, tpm, tpd
+        self.max_wait = max_wait
+        self.window_seconds = window_seconds
+        self.day_seconds = day_seconds
+        self._clock = clock
+
+        self._minute: Deque[Reservation] = deque()
+        self._day: Deque[Reservation] = deque()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()  # ventanas: también las usa el camino sync
+
+        # Cola: [prioridad, orden de llegada]; la cabeza es la única que puede pasar
+        self._waiters: List[List[int]] = []
+        self._order = itertools.count()
+        self._cond = asyncio.Condition()
+
+        self.admitted = {ADMIN: 0, USER: 0}
+        self.rejected = 0
+        self.penalties = 0
+        self.wait_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Admisión
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: int = USER,
+        tokens: int = 0,
+        max_wait: Optional[float] = None,
+    ) -> AsyncIterator[Reservation]:
+        """
+        Esperar turno para UNA llamada a Gemini
+
+        Args:
+            priority: ADMIN o USER (menor pasa antes)
+            tokens: Tokens estimados del request (prompt + respuesta)
+            max_wait: Espera máxima (None = la del scheduler)
+
+        Raises:
+            QuotaExceeded: RPD/TPD agotado o no hay turno dentro de max_wait
+        """
+        reservation = await self._admit(priority, tokens, self.max_wait if max_wait is None else max_wait)
+        yield reservation
+
+    async def _admit(self, priority: int, tokens: int, max_wait: float) -> Reservation:
+        start = self._clock()
+        deadline = start + max_wait
+        entry = [priority, next(self._order)]
+
+        async with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = self._clock()
+                    remaining = deadline - now
+                    if self._waiters[0] is entry:
+                        with self._lock:
+                            delay = self._delay(tokens, now)
+                            if delay <= 0:
+                                reservation = self._record(tokens, now, priority)
+                                self.wait_seconds += now - start
+                                return reservation
+                        if delay > remaining:
+                            raise self._reject(delay)
+                        timeout = delay
+                    else:
+                        if remaining <= 0:
+                            raise self._reject(0.0, reason="cola")
+                        timeout = remaining
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def reserve_nowait(self, priority: int = USER, tokens: int = 0) -> Reservation:
+        """
+        Admisión sin espera (camino sync)
+
+        Raises:
+            QuotaExceeded: Si no hay turno YA (o hay requests async en cola)
+        """
+        with self._lock:
+            now = self._clock()
+            delay = self._delay(tokens, now)
+            if delay <= 0 and not self._waiters:
+                return self._record(tokens, now, priority)
+        raise self._reject(delay, reason="" if delay > 0 else "cola")
+
+    def penalize(self, seconds: float = QUOTA_COOLDOWN_SECONDS) -> None:
+        """Gemini devolvió 429 igual (otra instancia, otra app con la key): pausar"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            self.penalties += 1
+        logger.warning(f"🚦 Gemini devolvió 429: llamadas en pausa {seconds:.0f}s")
+
+    def _delay(self, tokens: int, now: float) -> float:
+        """
+        Segundos hasta que un request de `tokens` entre en todas las ventanas
+        (0 = ya). Llamar con self._lock tomado.
+        """
+        self._expire(now)
+
+        delay = max(0.0, self._blocked_until - now)
+        delay = max(delay, self._window_delay(self._minute, self.rpm, self.tpm, tokens, now, self.window_seconds))
+        day_delay = self._window_delay(self._day, self.rpd, self.tpd, tokens, now, self.day_seconds)
+        # Cuota diaria: nadie espera horas, math.inf fuerza el rechazo inmediato
+        return math.inf if day_delay > 0 else delay
+
+    @staticmethod
+    def _window_delay(
+        window: Deque[Reservation],
+        max_requests: int,
+        max_tokens: int,
+        tokens: int,
+        now: float,
+        length: float,
+    ) -> float:
+        """Espera hasta que salgan de la ventana suficientes requests / tokens"""
+        delay = 0.0
+        if max_requests and len(window) >= max_requests:
+            delay = window[len(window) - max_requests].at + length - now
+        if max_tokens:
+            excess = sum(r.tokens for r in window) + tokens - max_tokens
+            for reservation in window:
+                if excess <= 0:
+                    break
+                excess -= reservation.tokens
+                delay = max(delay, reservation.at + length - now)
+        return max(0.0, delay)
+
+    def _expire(self, now: float) -> None:
+        while self._minute and self._minute[0].at <= now - self.window_seconds:
+            self._minute.popleft()
+        while self._day and self._day[0].at <= now - self.day_seconds:
+            self._day.popleft()
+
+    def _record(self, tokens: int, now: float, priority: int) -> Reservation:
+        reservation = Reservation(at=now, tokens=tokens, priority=priority)
+        self._minute.append(reservation)
+        self._day.append(reservation)
+        self.admitted[priority] = self.admitted.get(priority, 0) + 1
+        return reservation
+
+    def _reject(self, delay: float, reason: str = "") -> QuotaExceeded:
+        self.rejected += 1
+        with self._lock:
+            if not reason:
+                reason = "RPD" if math.isinf(delay) else "RPM"
+            retry_in = self._day[0].at + self.day_seconds - self._clock() if math.isinf(delay) and self._day else delay
+        logger.warning(f"🚦 Sin cuota de Gemini ({reason}): score local")
+        return QuotaExceeded(reason, retry_in)
+
+    # ------------------------------------------------------------------
+    # Observabilidad
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        """Uso actual de cada ventana + admitidos / rechazados"""
+        with self._lock:
+            self._expire(self._clock())
+            admitted = sum(self.admitted.values())
+            return {
+                "rpm_used": len(self._minute),
+                "rpd_used": len(self._day),
+                "tpm_used": sum(r.tokens for r in self._minute),
+                "tpd_used": sum(r.tokens for r in self._day),
+                "queued": len(self._waiters),
+                "admitted": admitted,
+                "admitted_admin": self.admitted.get(ADMIN, 0),
+                "rejected": self.rejected,
+                "penalties": self.penalties,
+                "avg_wait_ms": round(self.wait_seconds / admitted * 1000, 1) if admitted else 0.0,
+            }
+
+
+# ============================================================================
+# SCHEDULER GLOBAL (uno por proceso: la cuota es por API key)
+# ============================================================================
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def init_llm_scheduler(
+    rpm: int = GEMINI_RPM,
+    rpd: int = GEMINI_RPD,
+    tpm: int = GEMINI_TPM,
+    tpd: int = GEMINI_TPD,
+    max_wait: float = GEMINI_MAX_WAIT,
+) -> LLMScheduler:
+    """Crear el scheduler global (llamar una vez al arrancar el bot, antes del pool)"""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = LLMScheduler(rpm=rpm, rpd=rpd, tpm=tpm, tpd=tpd, max_wait=max_wait)
+        logger.info(
+            f"✅ LLMScheduler: {rpm} RPM, {rpd} RPD, {tpm} TPM"
+            + (f", {tpd} TPD" if tpd else "")
+            + f" (espera máx. {max_wait:.0f}s)"
+        )
+        return _scheduler
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Obtener el scheduler global (lo crea con los límites por defecto si no existe)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler()
+    return _scheduler
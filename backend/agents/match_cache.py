@@ -0,0 +1,267 @@
+"""
+Match Cache - Caché persistente de JobMatchResult (SQLite + TTL)
+
+Propósito:
+- Usuarios con las mismas keywords reciben el mismo job: antes se le pagaba
+  a Gemini por puntuarlo otra vez en cada /vacantes
+- Un hit devuelve el score y los mensajes guardados SIN llamar al LLM
+- SQLite en disco: los hits sobreviven reinicios del bot (":memory:" = solo RAM)
+
+Key: (hash de la URL canónica del job, hash de keywords+ubicación normalizadas,
+versión del prompt). Cambiar el prompt (PROMPT_VERSION en job_matcher.py)
+invalida todo lo anterior sin tener que borrar la base.
+
+Qué se guarda:
+- match_score, personalized_message, telegram_message (NO el Job: el job
+  llega en cada consulta y se adjunta al resultado)
+- Los resultados de error (score 0 por fallo de Gemini) NO se guardan
+
+Desde async (JobMatcher.amatch_*):
+- aget_many() / aset_many() corren el SQLite en un thread (asyncio.to_thread):
+  un lookup o un commit nunca bloquea el event loop
+- Las escrituras de un batch van en UNA transacción (set_many); en disco la
+  base usa WAL + synchronous=NORMAL (sin fsync por commit)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from backend.scrapers.dedup import canonicalize_url
+from database.models import Job
+
+logger = logging.getLogger(__name__)
+
+MatchKey = Tuple[str, str, str]
+
+# Cada cuántas escrituras se borran las filas vencidas
+PURGE_EVERY = 200
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def job_hash(job: Job) -> str:
+    """Hash de la URL canónica (tracking params fuera); sin URL, del id"""
+    return _digest(canonicalize_url(job.job_url) or f"id:{job.id}")
+
+
+def profile_hash(keywords: Sequence[str], location: Optional[str]) -> str:
+    """
+    Hash de keywords + ubicación normalizadas
+
+    Normalización: minúsculas, espacios colapsados, sin duplicados y ordenadas
+    → ["Python", "remote "] y ["remote", "python"] comparten entrada
+    """
+    normalized = sorted({" ".join(k.lower().split()) for k in keywords if k and k.strip()})
+    location_key = " ".join((location or "").lower().split())
+    return _digest(json.dumps([normalized, location_key], ensure_ascii=False))
+
+
+def make_match_key(
+    job: Job, keywords: Sequence[str], location: Optional[str], prompt_version: str
+) -> MatchKey:
+    return (job_hash(job), profile_hash(keywords, location), prompt_version)
+
+
+class MatchCache:
+    """
+    Caché SQLite thread-safe de resultados de match
+
+    Ejemplo:
+        >>> cache = MatchCache(path="match_cache.sqlite3", ttl_seconds=86400)
+        >>> key = make_match_key(job, ["python"], "USA", "v2")
+        >>> cache.get(key)              # None (miss)
+        >>> cache.set(key, {"match_score": 85, ...})
+        >>> cache.get(key)              # {"match_score": 85, ...} (hit)
+        >>> cache.stats()               # {"hits": 1, "misses": 1, "hit_rate": 0.5, ...}
+    """
+
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, path: str = ":memory:", ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            path: Archivo SQLite (":memory:" = no persistente)
+            ttl_seconds: Vida de cada resultado (0 = caché desactivada)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.expired = 0
+
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            # WAL: lectores y escritor no se bloquean; NORMAL: fsync solo en checkpoint
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS match_cache ("
+            "job_hash TEXT NOT NULL, profile_hash TEXT NOT NULL, prompt_version TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, payload TEXT NOT NULL, "
+            "PRIMARY KEY (job_hash, profile_hash, prompt_version))"
+        )
+        self._db.commit()
+        self.purge_expired()
+        if path != ":memory:":
+            logger.info(f"✅ MatchCache en disco: {path}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self._db is not None
+
+    def get(self, key: MatchKey) -> Optional[dict]:
+        """Resultado vigente o None"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[MatchKey]) -> Dict[MatchKey, dict]:
+        """
+        Varias keys con un solo lock y un solo commit (solo devuelve los hits)
+
+        Las filas vencidas que aparezcan se borran en la misma transacción.
+        """
+        if not self.enabled or not keys:
+            return {}
+
+        now = time.time()
+        found, stale = {}, []
+        with self._lock:
+            for key in keys:
+                row = self._db.execute(
+                    "SELECT expires_at, payload FROM match_cache "
+                    "WHERE job_hash = ? AND profile_hash = ? AND prompt_version = ?",
+                    key,
+                ).fetchone()
+                if row is not None and row[0] > now:
+                    found[key] = json.loads(row[1])
+                elif row is not None:
+                    stale.append(key)
+            if stale:
+                self._db.executemany(
+                    "DELETE FROM match_cache "
+                    "WHERE job_hash = ? AND profile_hash = ? AND prompt_version = ?",
+                    stale,
+                )
+                self._db.commit()
+                self.expired += len(stale)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, key: MatchKey, value: dict) -> None:
+        """Guardar resultado (best-effort: un error de disco solo se loguea)"""
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Sequence[Tuple[MatchKey, dict]]) -> None:
+        """Guardar varios resultados en UNA transacción (best-effort, como set())"""
+        if not self.enabled or not items:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        rows = [(*key, expires_at, json.dumps(value, ensure_ascii=False)) for key, value in items]
+        with self._lock:
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO match_cache "
+                    "(job_hash, profile_hash, prompt_version, expires_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ MatchCache: no se pudo escribir: {e}")
+                return
+            before, self.writes = self.writes, self.writes + len(rows)
+
+        if before // PURGE_EVERY != self.writes // PURGE_EVERY:
+            self.purge_expired()
+
+    async def aget_many(self, keys: Sequence[MatchKey]) -> Dict[MatchKey, dict]:
+        """get_many() en un thread: el event loop no espera al disco"""
+        if not self.enabled or not keys:
+            return {}
+        return await asyncio.to_thread(self.get_many, keys)
+
+    async def aset_many(self, items: Sequence[Tuple[MatchKey, dict]]) -> None:
+        """set_many() en un thread: el commit no bloquea el event loop"""
+        if not self.enabled or not items:
+            return
+        await asyncio.to_thread(self.set_many, items)
+
+    def purge_expired(self) -> int:
+        """Borrar filas vencidas; devuelve cuántas"""
+        with self._lock:
+            if self._db is None:
+                return 0
+            cursor = self._db.execute("DELETE FROM match_cache WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+            self.expired += cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM match_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """Contadores de hit/miss (hit_rate = llamadas a Gemini evitadas)"""
+        with self._lock:
+            size = 0
+            if self._db is not None:
+                size = self._db.execute("SELECT COUNT(*) FROM match_cache").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "writes": self.writes,
+                "expired": self.expired,
+                "size": size,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# ============================================================================
+# CACHÉ GLOBAL (una por proceso, compartida por todos los JobMatcher)
+# ============================================================================
+
+_cache: Optional[MatchCache] = None
+_cache_lock = threading.Lock()
+
+
+def init_match_cache(
+    path: str = ":memory:", ttl_seconds: float = MatchCache.DEFAULT_TTL_SECONDS
+) -> MatchCache:
+    """Crear la caché global (llamar una vez al arrancar el bot)"""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = MatchCache(path, ttl_seconds)
+        return _cache
+
+
+def get_match_cache() -> MatchCache:
+    """Obtener la caché global (en memoria, valores por defecto, si no existe)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = MatchCache()
+    return _cache
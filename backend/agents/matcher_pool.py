@@ -0,0 +1,281 @@
+"""
+Matcher Pool - JobMatchers compartidos y pre-calentados
+
+Propósito:
+- cmd_vacantes hacía JobMatcher() en cada comando: reconstruía el cliente
+  ChatGoogleGenerativeAI, los wrappers with_structured_output y el
+  FewShotPromptTemplate, y abría conexiones nuevas hacia Gemini
+- El pool crea `size` matchers UNA vez al arrancar el bot y los reparte;
+  cada matcher conserva su cliente (y sus conexiones keep-alive) toda la vida
+  del proceso
+- Todos comparten un semáforo: el límite de llamadas simultáneas a Gemini
+  es global (GEMINI_MAX_CONCURRENCY), no por matcher
+- Y el LLMScheduler del proceso (llm_scheduler.py): RPM, RPD y tokens se
+  cuentan para todos los matchers juntos
+
+Préstamo sin espera:
+- acquire() entrega el matcher con menos requests en curso (empates: por
+  turno). Un JobMatcher es seguro para uso concurrente en el event loop
+  (el semáforo hace de cola), así que un request nunca espera a que otro
+  devuelva el matcher
+- astream_jobs_batch() presta el matcher SOLO mientras Gemini produce
+  resultados: el consumidor (ej: /vacantes mandando tarjetas a Telegram con
+  pausas) los lee de una cola con el matcher ya devuelto
+
+Ciclo de vida:
+- bot/main.py llama init_matcher_pool() en post_init y close_matcher_pool()
+  en post_shutdown
+- Fuera del bot (scripts, tests) get_matcher_pool() crea el pool bajo demanda
+
+Ejemplo:
+    >>> pool = get_matcher_pool()
+    >>> async with pool.acquire() as matcher:
+    ...     results = await matcher.amatch_jobs_batch(top5, ["python"], "USA")
+    >>> pool.stats()    # {"size": 2, "acquisitions": 1, "in_flight": 0, ...}
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional
+
+from backend.agents.job_matcher import (
+    DESCRIPTION_TOKEN_BUDGET,
+    GEMINI_BACKEND,
+    GEMINI_CASSETTE,
+    GEMINI_MAX_CONCURRENCY,
+    JobMatcher,
+    JobMatchResult,
+    create_chat_model,
+)
+from backend.agents.llm_scheduler import USER, LLMScheduler, get_llm_scheduler
+from database.models import Job
+
+logger = logging.getLogger(__name__)
+
+# Job de muestra para el warm-up de templates (no llama a Gemini)
+_WARMUP_JOB = Job(
+    id="warmup",
+    title="Python Developer",
+    company="Warmup",
+    job_url="https://example.com/jobs/warmup",
+    description="Python developer",
+)
+
+
+class MatcherPool:
+    """
+    N JobMatchers construidos una sola vez y repartidos por carga
+
+    Ejemplo:
+        >>> pool = MatcherPool(size=2)
+        >>> async with pool.acquire() as matcher:
+        ...     await matcher.amatch_jobs_batch(jobs, keywords, location)
+    """
+
+    DEFAULT_SIZE = 2
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        max_concurrency: int = GEMINI_MAX_CONCURRENCY,
+        factory: Optional[Callable[..., JobMatcher]] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        description_tokens: int = DESCRIPTION_TOKEN_BUDGET,
+        backend: str = GEMINI_BACKEND,
+        cassette: str = GEMINI_CASSETTE,
+    ):
+        """
+        Args:
+            size: Cantidad de matchers (clientes de Gemini) en el pool
+            max_concurrency: Llamadas simultáneas a Gemini entre TODOS los matchers
+            factory: Constructor de matchers (recibe semaphore=...);
+                     None = JobMatcher con el scheduler del pool
+            scheduler: Cuota de Gemini compartida (None = get_llm_scheduler())
+            description_tokens: Tokens de descripción por job (matchers de la factory por defecto)
+            backend: "live", "record" o "replay" (create_chat_model de la factory por defecto)
+            cassette: Cassette JSONL de los backends record / replay
+        """
+        if size < 1:
+            raise ValueError("size debe ser >= 1")
+
+        self.size = size
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.scheduler = scheduler if scheduler is not None else get_llm_scheduler()
+        if factory is None:
+
+            def factory(semaphore: asyncio.Semaphore) -> JobMatcher:
+                return JobMatcher(
+                    llm=create_chat_model(backend, cassette),
+                    semaphore=semaphore,
+                    scheduler=self.scheduler,
+                    description_tokens=description_tokens,
+                )
+
+
+        start = time.perf_counter()
+        self._matchers: List[JobMatcher] = [factory(semaphore=self._semaphore) for _ in range(size)]
+        for matcher in self._matchers:
+            self._warm(matcher)
+        self.warmup_seconds = time.perf_counter() - start
+
+        self._in_flight = [0] * size
+        self._next_slot = 0
+        self.acquisitions = 0
+        self.peak_in_flight = 0
+        self.closed = False
+
+        logger.info(
+            f"✅ MatcherPool: {size} matchers listos en {self.warmup_seconds * 1000:.0f}ms "
+            f"(máx. {max_concurrency} llamadas simultáneas a Gemini)"
+        )
+
+    @staticmethod
+    def _warm(matcher: JobMatcher) -> None:
+        """Formatear una vez cada template para que el primer request no pague el costo"""
+        matcher.build_prompt(_WARMUP_JOB, ["python"], "USA")
+        matcher.build_batch_prompt([_WARMUP_JOB, _WARMUP_JOB], ["python"], "USA")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[JobMatcher]:
+        """Prestar el matcher con menos requests en curso (sin esperar)"""
+        if self.closed:
+            raise RuntimeError("MatcherPool cerrado")
+
+        # Empates por turno rotativo: se usan todos los clientes (y sus conexiones)
+        candidates = [(self._next_slot + i) % self.size for i in range(self.size)]
+        slot = min(candidates, key=self._in_flight.__getitem__)
+        self._next_slot = (slot + 1) % self.size
+        self._in_flight[slot] += 1
+        self.acquisitions += 1
+        self.peak_in_flight = max(self.peak_in_flight, sum(self._in_flight))
+        try:
+            yield self._matchers[slot]
+        finally:
+            self._in_flight[slot] -= 1
+
+    async def astream_jobs_batch(
+        self,
+        jobs: List[Job],
+        user_keywords: List[str],
+        user_location: str,
+        batched: bool = True,
+        priority: int = USER,
+    ) -> AsyncIterator[JobMatchResult]:
+        """
+        JobMatcher.astream_jobs_batch() con un matcher prestado solo mientras produce
+
+        Una tarea aparte consume el stream dentro de acquire() y deja cada
+        resultado en una cola; lo que haga el consumidor entre resultados no
+        retiene el matcher. Cerrar el generador cancela esa tarea.
+
+        Ejemplo:
+            >>> async with aclosing(pool.astream_jobs_batch(top5, ["python"], "USA")) as results:
+            ...     async for result in results:
+            ...         await send_card(result)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async with self.acquire() as matcher:
+                    stream = matcher.astream_jobs_batch(jobs, user_keywords, user_location, batched, priority)
+                    async with aclosing(stream) as results:
+                        async for result in results:
+                            queue.put_nowait(result)
+            except Exception as e:
+                queue.put_nowait(e)
+            else:
+                queue.put_nowait(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    def stats(self) -> dict:
+        """Uso del pool + tokens acumulados (Gemini y descripciones) de todos los matchers"""
+        usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+        descriptions = {"calls": 0, "original_tokens": 0, "condensed_tokens": 0}
+        for matcher in self._matchers:
+            for key in usage:
+                usage[key] += matcher.usage.get(key, 0)
+            condenser_stats = matcher.condenser.stats()
+            for key in descriptions:
+                descriptions[key] += condenser_stats[key]
+        return {
+            "size": self.size,
+            "acquisitions": self.acquisitions,
+            "in_flight": sum(self._in_flight),
+            "peak_in_flight": self.peak_in_flight,
+            "warmup_ms": round(self.warmup_seconds * 1000, 1),
+            "usage": usage,
+            "descriptions": descriptions,
+        }
+
+    async def aclose(self) -> None:
+        """Cerrar los clientes de todos los matchers"""
+        self.closed = True
+        for matcher in self._matchers:
+            await matcher.aclose()
+
+
+# ============================================================================
+# POOL GLOBAL (uno por proceso, compartido por todos los handlers)
+# ============================================================================
+
+_pool: Optional[MatcherPool] = None
+_pool_lock = threading.Lock()
+
+
+def init_matcher_pool(
+    size: int = MatcherPool.DEFAULT_SIZE,
+    max_concurrency: int = GEMINI_MAX_CONCURRENCY,
+    description_tokens: int = DESCRIPTION_TOKEN_BUDGET,
+    backend: str = GEMINI_BACKEND,
+    cassette: str = GEMINI_CASSETTE,
+) -> MatcherPool:
+    """
+    Crear el pool global (llamar una vez al arrancar el bot)
+
+    Si ya existía uno, se reemplaza (el anterior debe cerrarse con close_matcher_pool()).
+    """
+    global _pool
+    with _pool_lock:
+        _pool = MatcherPool(
+            size=size,
+            max_concurrency=max_concurrency,
+            description_tokens=description_tokens,
+            backend=backend,
+            cassette=cassette,
+        )
+        return _pool
+
+
+def get_matcher_pool() -> MatcherPool:
+    """Obtener el pool global (lo crea con valores por defecto si no existe)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = MatcherPool()
+    return _pool
+
+
+async def close_matcher_pool() -> None:
+    """Cerrar el pool global (llamar al apagar el bot)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        await pool.aclose()
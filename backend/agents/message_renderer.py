@@ -0,0 +1,126 @@
+"""
+Message Renderer - Mensajes de Telegram armados localmente con Markdown escapado
+
+Propósito:
+- Gemini escribía el telegram_message completo (emojis, empresa, remoto y un
+  link de ejemplo) y cmd_vacantes borraba los links con una regex. Todo eso
+  son datos que ya están en el Job
+- Gemini devuelve solo match_score + reason (MatchVerdict); el mensaje sale
+  de un template local
+- Cada valor (título, empresa, reason de Gemini...) se escapa para el
+  Markdown de Telegram (parse_mode="Markdown", v1): un "_" o "*" en un título
+  ya no hace que Telegram rechace el mensaje ("Can't parse entities")
+
+Template precompilado:
+- MessageTemplate parte el template UNA vez (al importar el módulo) en
+  literales + campos; render() solo escapa los valores y une las partes
+
+Ejemplo:
+    >>> render_job_message(job, 85, "Matches porque: ✅ Python", rank=1)
+    '*#1*\\n✅ Senior Python Developer\\n🏢 Acme Corp\\n...🔗 [*Aplicar Ahora →*](https://...)'
+"""
+
+import re
+from typing import Iterable, Optional
+
+from database.models import Job
+
+# Caracteres con significado en Markdown v1 de Telegram (fuera de una entidad)
+MARKDOWN_SPECIAL_RE = re.compile(r"([_*`\[])")
+
+# Campos del template: {nombre}
+FIELD_RE = re.compile(r"\{(\w+)\}")
+
+
+def escape_markdown(text: object) -> str:
+    """'senior_dev *remote*' → 'senior\\_dev \\*remote\\*'"""
+    return MARKDOWN_SPECIAL_RE.sub(r"\\\1", str(text))
+
+
+def escape_url(url: str) -> str:
+    """URL dentro de (...) de un link: ')' o un espacio la cortarían"""
+    return url.strip().replace(" ", "%20").replace(")", "%29")
+
+
+class MessageTemplate:
+    """
+    Template con campos {nombre}, parseado una sola vez
+
+    Los valores se escapan para Markdown salvo los campos de `raw`
+    (markup o URLs que ya vienen preparados).
+
+    Ejemplo:
+        >>> template = MessageTemplate("🏢 {company}")
+        >>> template.render(company="Acme_Corp")
+        '🏢 Acme\\_Corp'
+    """
+
+    def __init__(self, template: str, raw: Iterable[str] = ()):
+        # split con grupo: [literal, campo, literal, campo, ..., literal]
+        self._parts = FIELD_RE.split(template)
+        self.fields = self._parts[1::2]
+        self.raw = frozenset(raw)
+
+    def render(self, **values: object) -> str:
+        """
+        Raises:
+            KeyError: Si falta el valor de un campo
+        """
+        parts = list(self._parts)
+        for i in range(1, len(parts), 2):
+            value = values[parts[i]]
+            parts[i] = str(value) if parts[i] in self.raw else escape_markdown(value)
+        return "".join(parts)
+
+
+JOB_TEMPLATE = MessageTemplate(
+    "{icon} {title}\n"
+    "🏢 {company}\n"
+    "📍 {where} | 💼 {job_type}\n"
+    "⭐ Score: {score}/100\n\n"
+    "🤖 {reason}",
+    raw={"icon", "where", "score"},
+)
+RANK_TEMPLATE = MessageTemplate("*#{rank}*\n", raw={"rank"})
+SOURCE_LINK_TEMPLATE = MessageTemplate("\n\n🔗 [Ver en {source}]({url})", raw={"url"})
+APPLY_LINK_TEMPLATE = MessageTemplate("\n\n🔗 [*Aplicar Ahora →*]({url})", raw={"url"})
+
+
+def render_job_message(
+    job: Job,
+    match_score: float,
+    reason: str,
+    rank: Optional[int] = None,
+) -> str:
+    """
+    Mensaje de Telegram de un job (Markdown v1, listo para reply_text)
+
+    Args:
+        job: Job con los datos del mensaje
+        match_score: Score 0-100
+        reason: Motivo en 1 línea (de Gemini o del score local)
+        rank: Posición en el TOP (None = sin encabezado "#N" y link "Ver en <fuente>";
+              con rank = encabezado + link "Aplicar Ahora →", como en cmd_vacantes)
+
+    Returns:
+        str: Mensaje con todos los valores escapados (sin link si el job no tiene URL)
+    """
+    message = JOB_TEMPLATE.render(
+        icon="✅" if match_score >= 50 else "❌",
+        title=job.title,
+        company=job.company or "N/A",
+        where="Remote" if job.is_remote else "On-site",
+        job_type=job.job_type or "N/A",
+        score=f"{match_score:.0f}",
+        reason=" ".join(reason.split()),
+    )
+    if rank is not None:
+        message = RANK_TEMPLATE.render(rank=rank) + message
+
+    if job.job_url:
+        url = escape_url(job.job_url)
+        if rank is not None:
+            message += APPLY_LINK_TEMPLATE.render(url=url)
+        else:
+            message += SOURCE_LINK_TEMPLATE.render(source=(job.source or "oferta").capitalize(), url=url)
+    return message
@@ -0,0 +1,160 @@
+"""
+Pre-Ranker - Ranking léxico local (BM25) antes de Gemini
+
+Propósito:
+- cmd_vacantes mandaba jobs[:5] a JobMatcher: los 5 primeros en orden de
+  plataforma, no los 5 más relevantes
+- BM25 sobre título + descripción contra las keywords del usuario ordena
+  TODOS los jobs en milisegundos y sin llamadas a la API
+- Solo el top-N real va al LLM: mejor relevancia, mismas llamadas a Gemini
+
+Cómo:
+- Matriz de frecuencias jobs × términos de la query con un loop Python por
+  job: tokenize() + Counter (en C) y solo len(terms) lookups por fila. La
+  tokenización domina; mapear cada token a su columna con np.bincount resultó
+  ~4x más lento que el Counter (300 jobs × 400 tokens: 13 ms vs 3 ms)
+- Scoring vectorizado con NumPy: IDF, normalización por largo y saturación k1
+  se calculan sobre la matriz entera, sin loops por job
+- BM25F simplificado: el título pesa title_weight veces más que la descripción
+
+Ejemplo:
+    >>> top5 = rank_jobs(jobs, ["python", "django"], top_n=5)
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from database.models import Job
+
+
+# Tokens tipo "python", "c++", "c#", "k8s" (los puntos separan: "node.js" → node, js)
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Palabras vacías (inglés + español) que aparecen en keywords y no discriminan
+STOPWORDS = frozenset(
+    "a an and the of for in on at to with or by from as is are be we you our your "
+    "y o de del la el los las en con para por un una que al se su sus lo es".split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """'Senior Python/Django Developer' → ['senior', 'python', 'django', 'developer']"""
+    if not text:
+        return []
+    text = text.lower()
+    if not text.isascii():
+        # Quitar tildes a velocidad C ("ingeniería" → "ingenieria")
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return [t for t in TOKEN_RE.findall(text) if t not in STOPWORDS]
+
+
+def query_terms(keywords: Sequence[str]) -> List[str]:
+    """Keywords del usuario → términos únicos (en orden)"""
+    terms: List[str] = []
+    for keyword in keywords:
+        for token in tokenize(keyword):
+            if token not in terms:
+                terms.append(token)
+    return terms
+
+
+class BM25Ranker:
+    """
+    Ranking BM25 de jobs contra keywords
+
+    Ejemplo:
+        >>> ranker = BM25Ranker()
+        >>> scores = ranker.score(jobs, ["python"])   # np.ndarray, 1 score por job
+        >>> ranked = ranker.rank(jobs, ["python"], top_n=5)
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, title_weight: float = 3.0):
+        """
+        Args:
+            k1: Saturación de frecuencia (más alto = repetir un término pesa más)
+            b: Normalización por largo (0 = ninguna, 1 = total)
+            title_weight: Cuántas veces cuenta un término en el título vs descripción
+        """
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+
+    def score(self, jobs: Sequence[Job], keywords: Sequence[str]) -> np.ndarray:
+        """Score BM25 de cada job (0 si ningún término aparece)"""
+        terms = query_terms(keywords)
+        if not jobs or not terms:
+            return np.zeros(len(jobs))
+
+        tf, lengths = self._term_matrix(jobs, terms)
+
+        n_docs = len(jobs)
+        df = np.count_nonzero(tf, axis=0)                                # (terms,)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))                 # siempre > 0
+        avg_length = lengths.mean() or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)    # (jobs,)
+        saturated = tf * (self.k1 + 1) / (tf + norm[:, None])            # (jobs, terms)
+        return saturated @ idf
+
+    def rank(
+        self, jobs: Sequence[Job], keywords: Sequence[str], top_n: Optional[int] = None
+    ) -> List[Job]:
+        """
+        Jobs ordenados por score DESC (empates: orden original)
+
+        Args:
+            jobs: Jobs scrapeados
+            keywords: Keywords del usuario
+            top_n: Devolver solo los N mejores (None = todos)
+        """
+        return [job for job, _ in self.rank_with_scores(jobs, keywords, top_n)]
+
+    def rank_with_scores(
+        self, jobs: Sequence[Job], keywords: Sequence[str], top_n: Optional[int] = None
+    ) -> List[Tuple[Job, float]]:
+        """Igual que rank() pero con el score de cada job"""
+        scores = self.score(jobs, keywords)
+        order = np.argsort(-scores, kind="stable")
+        if top_n is not None:
+            order = order[:top_n]
+        return [(jobs[i], float(scores[i])) for i in order]
+
+    def _term_matrix(
+        self, jobs: Sequence[Job], terms: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Frecuencias ponderadas (título × title_weight + descripción) por término
+
+        Loop por job a propósito: Counter cuenta en C y solo se leen los
+        términos de la query (ver docstring del módulo)
+
+        Returns:
+            (tf: jobs × terms, lengths: largo ponderado de cada job)
+        """
+        tf = np.zeros((len(jobs), len(terms)))
+        lengths = np.zeros(len(jobs))
+
+        for row, job in enumerate(jobs):
+            title = tokenize(job.title)
+            description = tokenize(job.description)
+            title_counts = Counter(title)
+            description_counts = Counter(description)
+            tf[row] = [
+                self.title_weight * title_counts[t] + description_counts[t] for t in terms
+            ]
+            lengths[row] = self.title_weight * len(title) + len(description)
+
+        return tf, lengths
+
+
+_default_ranker = BM25Ranker()
+
+
+def rank_jobs(
+    jobs: Sequence[Job], keywords: Sequence[str], top_n: Optional[int] = None
+) -> List[Job]:
+    """Atajo: BM25Ranker() con parámetros por defecto"""
+    return _default_ranker.rank(jobs, keywords, top_n)
@@ -0,0 +1,165 @@
+"""
+Token Ledger - Cuenta de tokens de Gemini por llamada y por día
+
+Propósito:
+- JobMatcher manda un prefijo estático (instrucciones + few-shot EXAMPLES,
+  como system instruction) y un delta por llamada (job + perfil). El ledger
+  registra cuánto pesa cada parte y cuánto del input Gemini sirvió desde su
+  caché de prefijos (usage_metadata.input_token_details.cache_read)
+- report() resume por llamada (promedios) y por día (UTC): la fuente para
+  ver cuánto del input es prefijo reutilizable y cuánto se ahorró
+
+Campos:
+- prefix_tokens / delta_tokens: estimación local (condenser.estimate_tokens)
+  de la system instruction y del mensaje de la llamada
+- input_tokens / cached_tokens / output_tokens: lo que reporta Gemini
+  (sin usage_metadata: input = prefix + delta, cached = 0)
+
+Ejemplo:
+    >>> ledger = get_token_ledger()
+    >>> ledger.record("batch", n_jobs=5, prefix_tokens=140, delta_tokens=450, usage=usage)
+    >>> ledger.report()["today"]   # {"calls": 1, "input_tokens": 590, "cached_tokens": 0, ...}
+"""
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Días que se conservan en el reporte (el proceso puede vivir semanas)
+MAX_DAYS = 30
+
+_FIELDS = ("calls", "jobs", "prefix_tokens", "delta_tokens", "input_tokens", "cached_tokens", "output_tokens")
+
+
+@dataclass
+class CallTokens:
+    """Tokens de UNA llamada a Gemini"""
+
+    kind: str  # "single" | "batch"
+    jobs: int
+    prefix_tokens: int
+    delta_tokens: int
+    input_tokens: int
+    cached_tokens: int
+    output_tokens: int
+
+
+class TokenLedger:
+    """Acumula CallTokens por día (thread-safe)"""
+
+    def __init__(self, max_days: int = MAX_DAYS, clock: Callable[[], float] = time.time):
+        self.max_days = max_days
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict[str, int]] = {}
+        self.last_call: Optional[CallTokens] = None
+
+    def record(
+        self,
+        kind: str,
+        n_jobs: int,
+        prefix_tokens: int,
+        delta_tokens: int,
+        usage: Optional[dict] = None,
+    ) -> CallTokens:
+        """
+        Registrar una llamada
+
+        Args:
+            kind: "single" (1 job) o "batch" (N jobs en 1 llamada)
+            n_jobs: Jobs puntuados en la llamada
+            prefix_tokens / delta_tokens: Estimación local de cada parte del prompt
+            usage: usage_metadata de la respuesta (None/{} si el modelo no lo trae)
+        """
+        usage = usage or {}
+        details = usage.get("input_token_details") or {}
+        call = CallTokens(
+            kind=kind,
+            jobs=n_jobs,
+            prefix_tokens=prefix_tokens,
+            delta_tokens=delta_tokens,
+            input_tokens=usage.get("input_tokens", prefix_tokens + delta_tokens),
+            cached_tokens=details.get("cache_read", 0) or 0,
+            output_tokens=usage.get("output_tokens", 0),
+        )
+
+        day = time.strftime("%Y-%m-%d", time.gmtime(self._clock()))
+        with self._lock:
+            totals = self._days.setdefault(day, dict.fromkeys(_FIELDS, 0))
+            totals["calls"] += 1
+            for field, value in asdict(call).items():
+                if field in totals:
+                    totals[field] += value
+            while len(self._days) > self.max_days:
+                self._days.pop(min(self._days))
+            self.last_call = call
+
+        logger.info(
+            f"🧮 Tokens {kind} ({n_jobs} jobs): prefijo {prefix_tokens} "
+            f"(caché {call.cached_tokens}) + delta {delta_tokens} "
+            f"→ entrada {call.input_tokens}, salida {call.output_tokens}"
+        )
+        return call
+
+    def report(self) -> dict:
+        """
+        Resumen por llamada y por día
+
+        Returns:
+            {"per_call": promedios de todas las llamadas,
+             "today": totales de hoy (UTC), "days": {fecha: totales}}
+            Cada bloque incluye prefix_share (parte del input que es prefijo
+            reutilizable) y cached_share (parte que Gemini sirvió de caché)
+        """
+        with self._lock:
+            days = {day: self._with_shares(dict(totals)) for day, totals in sorted(self._days.items())}
+
+        overall = dict.fromkeys(_FIELDS, 0)
+        for totals in days.values():
+            for field in _FIELDS:
+                overall[field] += totals[field]
+        calls = overall["calls"]
+        per_call = {"calls": calls}
+        for field in _FIELDS[2:]:
+            per_call[f"avg_{field}"] = round(overall[field] / calls, 1) if calls else 0.0
+        per_call["tokens_per_job"] = (
+            round((overall["input_tokens"] + overall["output_tokens"]) / overall["jobs"], 1)
+            if overall["jobs"]
+            else 0.0
+        )
+
+        today = time.strftime("%Y-%m-%d", time.gmtime(self._clock()))
+        return {
+            "per_call": self._with_shares(per_call, prefix="avg_"),
+            "today": days.get(today, self._with_shares(dict.fromkeys(_FIELDS, 0))),
+            "days": days,
+        }
+
+    @staticmethod
+    def _with_shares(totals: dict, prefix: str = "") -> dict:
+        input_tokens = totals.get(f"{prefix}input_tokens", 0)
+        totals["prefix_share"] = round(totals[f"{prefix}prefix_tokens"] / input_tokens, 3) if input_tokens else 0.0
+        totals["cached_share"] = round(totals[f"{prefix}cached_tokens"] / input_tokens, 3) if input_tokens else 0.0
+        return totals
+
+
+# ============================================================================
+# LEDGER GLOBAL (uno por proceso, compartido por todos los JobMatcher)
+# ============================================================================
+
+_ledger: Optional[TokenLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_token_ledger() -> TokenLedger:
+    """Obtener el ledger global (lo crea si no existe)"""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = TokenLedger()
+    return _ledger
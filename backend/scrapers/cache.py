@@ -0,0 +1,244 @@
+"""
+Search Cache - Caché de resultados de JobSpy (TTL + LRU + disco opcional)
+
+Propósito:
+- Muchos usuarios comparten keywords + país → misma búsqueda upstream
+- Guardar la respuesta cruda de jobspy-api por (keywords, país, plataforma, filtros)
+- Un hit evita la llamada HTTP, el throttle y el scraping
+
+Niveles:
+1. Memoria: OrderedDict con TTL y desalojo LRU (max_entries)
+2. Disco (opcional): SQLite, para que los hits sobrevivan reinicios del bot
+
+Qué se guarda:
+- El JSON de la API ({count, jobs, cached}), NO objetos Job
+  (así el valor es serializable y se parsea igual que una respuesta fresca)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str, Optional[str], Optional[bool], int]
+
+
+def make_cache_key(
+    keywords: str,
+    country: str,
+    platform: str,
+    job_type: Optional[str] = None,
+    is_remote: Optional[bool] = None,
+    results_wanted: int = 25,
+) -> CacheKey:
+    """
+    Construir key normalizada de una búsqueda
+
+    Normalización: minúsculas y espacios colapsados, para que
+    "Python  Remote" y "python remote" compartan entrada.
+    """
+    return (
+        " ".join(keywords.lower().split()),
+        country.lower().strip(),
+        platform.lower().strip(),
+        job_type.lower() if job_type else None,
+        is_remote,
+        int(results_wanted),
+    )
+
+
+class SearchCache:
+    """
+    Caché TTL + LRU thread-safe con nivel de disco opcional
+
+    Ejemplo:
+        >>> cache = SearchCache(ttl_seconds=900, max_entries=512)
+        >>> key = make_cache_key("python", "USA", "indeed")
+        >>> cache.get(key)              # None (miss)
+        >>> cache.set(key, {"count": 1, "jobs": [...]})
+        >>> cache.get(key)              # {"count": 1, ...} (hit)
+        >>> cache.stats()               # {"hits": 1, "misses": 1, ...}
+    """
+
+    DEFAULT_TTL_SECONDS = 15 * 60
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_path: Optional[str] = None,
+    ):
+        """
+        Inicializar caché
+
+        Args:
+            ttl_seconds: Vida de cada entrada (0 = caché desactivada)
+            max_entries: Entradas máximas en memoria (LRU)
+            disk_path: Archivo SQLite para el nivel persistente (None = solo memoria)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._db.commit()
+            logger.info(f"✅ SearchCache con nivel de disco: {disk_path}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Obtener valor vigente (memoria → disco) o None"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            value = self._disk_get(key, now)
+            if value is not None:
+                # Promover a memoria
+                self._store(key, value, now)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+            self.misses += 1
+            return None
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Guardar valor (memoria + disco si está activo)"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._store(key, value, now)
+            self._disk_set(key, value, now + self.ttl_seconds)
+
+    def clear(self) -> None:
+        """Vaciar ambos niveles"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """Contadores de hit/miss y tamaño actual"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "size": len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Cerrar conexión SQLite (si existe)"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    # Internos (llamar con self._lock tomado)
+    # ------------------------------------------------------------------
+
+    def _store(self, key: CacheKey, value: Any, now: float) -> None:
+        self._entries[key] = (now + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key: CacheKey, now: float) -> Optional[Any]:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT expires_at, payload FROM search_cache WHERE key = ?",
+            (json.dumps(key),),
+        ).fetchone()
+        if row is None:
+            return None
+        expires_at, payload = row
+        if expires_at <= now:
+            self._db.execute("DELETE FROM search_cache WHERE key = ?", (json.dumps(key),))
+            self._db.commit()
+            return None
+        return json.loads(payload)
+
+    def _disk_set(self, key: CacheKey, value: Any, expires_at: float) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache (key, expires_at, payload) VALUES (?, ?, ?)",
+                (json.dumps(key), expires_at, json.dumps(value, default=str)),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            # El disco es best-effort: si falla, la memoria sigue funcionando
+            logger.warning(f"⚠️ SearchCache: no se pudo escribir en disco: {e}")
+
+
+# ============================================================================
+# CACHÉ GLOBAL (una por proceso, compartida por todos los JobSpyClient)
+# ============================================================================
+
+_cache: Optional[SearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def init_search_cache(
+    ttl_seconds: float = SearchCache.DEFAULT_TTL_SECONDS,
+    max_entries: int = SearchCache.DEFAULT_MAX_ENTRIES,
+    disk_path: Optional[str] = None,
+) -> SearchCache:
+    """Crear la caché global (llamar una vez al arrancar el bot)"""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = SearchCache(ttl_seconds, max_entries, disk_path)
+        return _cache
+
+
+def get_search_cache() -> SearchCache:
+    """Obtener la caché global (solo memoria, valores por defecto, si no existe)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SearchCache()
+    return _cache
@@ -0,0 +1,215 @@
+"""
+Circuit Breaker - Saltar plataformas que están fallando
+
+Propósito:
+- Glassdoor es poco confiable (HALLAZGOS_CONSOLIDADOS.md): si está caída,
+  cada usuario pagaba el timeout completo antes de seguir
+- Con el breaker abierto la plataforma se salta al instante
+
+Estados:
+- CLOSED: normal. Se guarda el resultado de las últimas `window` llamadas;
+  si hay >= min_calls y la tasa de fallos >= failure_rate_threshold → OPEN
+- OPEN: toda llamada falla al instante (CircuitOpenError) durante `cooldown` segundos
+- HALF_OPEN: pasado el cooldown se deja pasar 1 llamada de prueba.
+  Éxito → CLOSED (ventana limpia). Fallo → OPEN otra vez.
+  before_call() devuelve True solo a la llamada de prueba: únicamente ella
+  (pasando ese token a record_*/release) decide el estado o suelta el turno.
+  Un request que entró con CLOSED y termina tarde no libera una prueba ajena.
+
+Qué cuenta como fallo:
+- Timeouts, errores de conexión, HTTP 5xx y 429
+- NO: HTTP 4xx por parámetros (la plataforma respondió, el request estaba mal)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """La plataforma tiene el circuito abierto: no se hizo el request"""
+
+    def __init__(self, platform: str, retry_in: float):
+        self.platform = platform
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuito abierto para {platform} (reintento en {retry_in:.0f}s)"
+        )
+
+
+class CircuitBreaker:
+    """
+    Breaker thread-safe de una plataforma
+
+    Ejemplo:
+        >>> breaker = CircuitBreaker("glassdoor")
+        >>> trial = breaker.before_call()   # lanza CircuitOpenError si está abierto
+        >>> breaker.record_success(trial)   # o record_failure(trial) / release(trial)
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        failure_rate_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        cooldown: float = 60.0,
+    ):
+        """
+        Args:
+            platform: Nombre de la plataforma (para logs)
+            failure_rate_threshold: Fracción de fallos (0-1) que abre el circuito
+            window: Cuántos resultados recientes considerar
+            min_calls: Mínimo de llamadas en la ventana antes de poder abrir
+            cooldown: Segundos en OPEN antes de probar (HALF_OPEN)
+        """
+        self.platform = platform
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+
+        self.state = CLOSED
+        self._outcomes: deque = deque(maxlen=window)  # True = fallo
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """
+        Pedir permiso para llamar a la plataforma
+
+        Returns:
+            bool: True si esta llamada es la prueba de HALF_OPEN (pasarlo a
+                  record_success / record_failure / release)
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto (o ya hay una prueba en curso)
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+
+            elapsed = time.monotonic() - self._opened_at
+            if self.state == OPEN and elapsed >= self.cooldown:
+                self.state = HALF_OPEN
+                logger.info(f"🟡 Circuito {self.platform}: HALF_OPEN (probando)")
+
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            raise CircuitOpenError(self.platform, max(0.0, self.cooldown - elapsed))
+
+    def record_success(self, trial: bool = False) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN and trial:
+                logger.info(f"🟢 Circuito {self.platform}: CLOSED (se recuperó)")
+                self.state = CLOSED
+                self._outcomes.clear()
+                self._trial_in_flight = False
+            self._outcomes.append(False)
+
+    def record_failure(self, trial: bool = False) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN and trial:
+                self._open()
+                return
+
+            self._outcomes.append(True)
+            if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+                if self._failure_rate() >= self.failure_rate_threshold:
+                    self._open()
+
+    def release(self, trial: bool = False) -> None:
+        """
+        La llamada terminó sin veredicto (cancelada, error 4xx):
+        liberar el turno de prueba de HALF_OPEN sin cambiar de estado
+
+        Args:
+            trial: Lo que devolvió before_call(); sin él no hay turno que soltar
+        """
+        if not trial:
+            return
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = round(max(0.0, self.cooldown - (time.monotonic() - self._opened_at)), 1)
+            return {
+                "state": self.state,
+                "failure_rate": round(self._failure_rate(), 3),
+                "calls": len(self._outcomes),
+                "retry_in": retry_in,
+            }
+
+    # Internos (llamar con self._lock tomado)
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+        logger.warning(
+            f"🔴 Circuito {self.platform}: OPEN por {self.cooldown:.0f}s "
+            f"(fallos: {self._failure_rate():.0%})"
+        )
+
+
+class CircuitBreakerRegistry:
+    """Un CircuitBreaker por plataforma (creados bajo demanda)"""
+
+    def __init__(self, **breaker_kwargs):
+        self._kwargs = breaker_kwargs
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform: str) -> CircuitBreaker:
+        with self._lock:
+            if platform not in self._breakers:
+                self._breakers[platform] = CircuitBreaker(platform, **self._kwargs)
+            return self._breakers[platform]
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {platform: breaker.stats() for platform, breaker in breakers.items()}
+
+
+def counts_as_failure(error: BaseException) -> bool:
+    """¿El error indica que la plataforma está mal? (ver docstring del módulo)"""
+    status: Optional[int] = None
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+    elif isinstance(error, aiohttp.ClientResponseError):
+        status = error.status
+
+    if status is not None:
+        return status >= 500 or status == 429
+    return True
+
+
+_registry = CircuitBreakerRegistry()
+
+
+def get_breaker_registry() -> CircuitBreakerRegistry:
+    """Obtener el registry global de breakers"""
+    return _registry
@@ -0,0 +1,379 @@
+"""
+Dedup - Eliminar vacantes duplicadas entre plataformas
+
+Propósito:
+- La misma vacante suele venir de LinkedIn, Indeed y Glassdoor
+- Los duplicados gastan los 5 slots de Gemini y engordan el CSV
+
+Etapas (todas O(n), near-duplicates ~O(n) con buckets LSH):
+1. URL canónica: sin tracking params (utm_*, trk, refId...), sin fragment, sin www
+2. Fingerprint exacto: título + empresa normalizados (minúsculas, sin acentos,
+   sin puntuación, sin sufijos legales tipo "Inc", "S.A.S")
+   Sin empresa no hay fingerprint ni near-duplicates: "Python Developer" sin
+   empresa en 2 plataformas pueden ser 2 vacantes distintas → solo URL
+3. Near-duplicates: MinHash (32 hashes) sobre las palabras de título + empresa,
+   con LSH de 8 bandas x 4 filas. Solo se comparan candidatos que comparten
+   banda (máximo MAX_CANDIDATES), y se confirman con Jaccard exacto >= threshold.
+   Ej: "Senior Python Developer - Remote" vs "Sr. Python Developer" (misma empresa)
+
+Nota: se probó SimHash sobre trigramas, pero con títulos cortos (~30 caracteres)
+2 trigramas extra cambian ~10 bits → inservible para umbrales bajos.
+
+Política de merge:
+- Se conserva la PRIMERA aparición (orden de plataformas: Indeed primero, más fiable)
+- Campos vacíos de la primera se completan con los del duplicado
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from database.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+# Query params que solo sirven para tracking (no identifican la vacante)
+TRACKING_PARAMS = {
+    "trk", "trkinfo", "refid", "trackingid", "lipi", "midtoken", "midsig", "eid",
+    "from", "src", "source", "ref", "referer", "referrer", "sid", "campaign",
+    "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_ga", "cmp", "guid",
+    "advn", "adid", "tk", "vjs", "pos", "ao", "jrtk", "jsguid", "ctt", "srs",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hs_")
+
+# Sufijos legales que varían entre plataformas ("Acme Corp" vs "Acme Corporation")
+COMPANY_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "llc", "ltd",
+    "limited", "plc", "gmbh", "sa", "sas", "sl", "srl", "ltda", "de", "cv",
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+MINHASH_PERMUTATIONS = 32
+LSH_BANDS = 8
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+# Tope de candidatos verificados por job: mantiene el peor caso ~lineal
+MAX_CANDIDATES = 64
+_MERSENNE_PRIME = (1 << 61) - 1
+# Coeficientes fijos (a, b) de las permutaciones: h_i(x) = (a*x + b) mod p
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME | 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME)
+    for i in range(MINHASH_PERMUTATIONS)
+]
+
+# Variantes frecuentes en títulos que significan lo mismo
+TITLE_SYNONYMS = {
+    "sr": "senior", "jr": "junior", "dev": "developer", "eng": "engineer",
+    "ssr": "semisenior", "mid": "semisenior",
+}
+
+
+# ============================================================================
+# NORMALIZACIÓN
+# ============================================================================
+
+
+def canonicalize_url(url: Optional[str]) -> Optional[str]:
+    """
+    URL canónica para comparar vacantes
+
+    Ej: "https://www.linkedin.com/jobs/view/123/?trk=abc&refId=x#top"
+        → "https://linkedin.com/jobs/view/123"
+    """
+    if not url:
+        return None
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=False)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Minúsculas, sin acentos, solo alfanuméricos separados por un espacio"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text)
+    text = text.encode("ascii", "ignore").decode("ascii").lower()
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def normalize_company(company: Optional[str]) -> str:
+    """Empresa normalizada sin sufijos legales"""
+    tokens = [t for t in normalize_text(company).split() if t not in COMPANY_SUFFIXES]
+    return " ".join(tokens)
+
+
+def job_fingerprint(job: Job) -> Optional[str]:
+    """
+    Fingerprint exacto: hash de título + empresa normalizados
+
+    None si el job no trae empresa: el título solo no identifica la vacante
+    """
+    company = normalize_company(job.company)
+    if not company:
+        return None
+    key = f"{normalize_text(job.title)}|{company}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# MINHASH
+# ============================================================================
+
+
+def title_tokens(job: Job) -> FrozenSet[str]:
+    """Palabras de título + empresa normalizadas (con sinónimos)"""
+    words = normalize_text(job.title).split() + normalize_company(job.company).split()
+    return frozenset(TITLE_SYNONYMS.get(w, w) for w in words)
+
+
+@lru_cache(maxsize=65536)
+def _token_signature(token: str) -> Tuple[int, ...]:
+    """Las 32 permutaciones de una palabra (cacheado: el vocabulario se repite mucho)"""
+    h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+    return tuple((a * h + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+
+def minhash(tokens: FrozenSet[str]) -> Tuple[int, ...]:
+    """Firma MinHash de un conjunto de palabras (mínimo por permutación)"""
+    if not tokens:
+        return (0,) * MINHASH_PERMUTATIONS
+    return tuple(map(min, zip(*(_token_signature(t) for t in tokens))))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+# ============================================================================
+# DEDUPLICADOR
+# ============================================================================
+
+
+@dataclass
+class DedupStats:
+    """Cuántos duplicados se quitaron en cada etapa"""
+
+    total: int = 0
+    by_url: int = 0
+    by_fingerprint: int = 0
+    by_minhash: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.by_url + self.by_fingerprint + self.by_minhash
+
+
+@dataclass
+class _Kept:
+    """Vacante conservada + sus firmas"""
+
+    index: int
+    tokens: FrozenSet[str]
+    company_tokens: Set[str] = field(default_factory=set)
+
+
+def _merge_missing(primary: Job, duplicate: Job) -> Job:
+    """Completar campos vacíos de primary con los de duplicate"""
+    updates = {
+        name: getattr(duplicate, name)
+        for name in ("company", "company_url", "location", "description", "job_type",
+                     "job_function", "job_level", "salary", "company_industry",
+                     "date_posted", "emails")
+        if getattr(primary, name) in (None, "", []) and getattr(duplicate, name) not in (None, "", [])
+    }
+    return primary.model_copy(update=updates) if updates else primary
+
+
+class JobDeduplicator:
+    """
+    Deduplicador incremental: se le pueden pasar los jobs por lotes
+
+    Útil en streaming (una plataforma a la vez): add() devuelve solo los
+    jobs NUEVOS de cada lote. Los campos completados por merge quedan en
+    .jobs (los ya entregados por add() no se modifican).
+
+    Ejemplo:
+        >>> dedup = JobDeduplicator()
+        >>> nuevos_indeed = dedup.add(indeed_jobs)
+        >>> nuevos_linkedin = dedup.add(linkedin_jobs)   # sin los de Indeed
+        >>> dedup.jobs                                   # todos, únicos y mergeados
+    """
+
+    def __init__(self, near_duplicates: bool = True, threshold: float = 0.75):
+        """
+        Args:
+            near_duplicates: Activar etapa MinHash
+            threshold: Jaccard mínimo (palabras de título + empresa) para near-duplicate
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold debe estar en (0, 1]")
+
+        self.near_duplicates = near_duplicates
+        self.threshold = threshold
+        self.stats = DedupStats()
+
+        self._kept: List[Job] = []
+        self._seen_urls: Dict[str, int] = {}
+        self._seen_fingerprints: Dict[str, int] = {}
+        self._buckets: Dict[tuple, List[_Kept]] = defaultdict(list)
+
+    @property
+    def jobs(self) -> List[Job]:
+        """Jobs únicos vistos hasta ahora (en orden de llegada)"""
+        return list(self._kept)
+
+    def add(self, jobs: List[Job]) -> List[Job]:
+        """
+        Agregar un lote y devolver los jobs que NO eran duplicados
+        """
+        added: List[Job] = []
+        self.stats.total += len(jobs)
+
+        for job in jobs:
+            idx = self._add_one(job)
+            if idx is not None:
+                added.append(job)
+
+        return added
+
+    def _add_one(self, job: Job) -> Optional[int]:
+        """Procesar un job: índice si es nuevo, None si era duplicado"""
+        kept = self._kept
+        url = canonicalize_url(job.job_url)
+        if url and url in self._seen_urls:
+            idx = self._seen_urls[url]
+            kept[idx] = _merge_missing(kept[idx], job)
+            self.stats.by_url += 1
+            return None
+
+        fingerprint = job_fingerprint(job)
+        if fingerprint is None:
+            # Sin empresa: solo la URL canónica identifica la vacante
+            idx = len(kept)
+            kept.append(job)
+            if url:
+                self._seen_urls[url] = idx
+            return idx
+
+        if fingerprint in self._seen_fingerprints:
+            idx = self._seen_fingerprints[fingerprint]
+            kept[idx] = _merge_missing(kept[idx], job)
+            self.stats.by_fingerprint += 1
+            if url:
+                self._seen_urls[url] = idx
+            return None
+
+        company_tokens = set(normalize_company(job.company).split())
+        tokens = title_tokens(job)
+        band_keys: List[tuple] = []
+
+        if self.near_duplicates:
+            signature = minhash(tokens)
+            band_keys = [
+                (band, signature[band * LSH_ROWS : (band + 1) * LSH_ROWS])
+                for band in range(LSH_BANDS)
+            ]
+            match = _find_near_duplicate(
+                self._buckets, band_keys, tokens, company_tokens, self.threshold
+            )
+            if match is not None:
+                kept[match] = _merge_missing(kept[match], job)
+                self.stats.by_minhash += 1
+                if url:
+                    self._seen_urls[url] = match
+                self._seen_fingerprints[fingerprint] = match
+                return None
+
+        idx = len(kept)
+        kept.append(job)
+        if url:
+            self._seen_urls[url] = idx
+        self._seen_fingerprints[fingerprint] = idx
+
+        entry = _Kept(index=idx, tokens=tokens, company_tokens=company_tokens)
+        for band_key in band_keys:
+            self._buckets[band_key].append(entry)
+
+        return idx
+
+
+def deduplicate_jobs(
+    jobs: List[Job],
+    near_duplicates: bool = True,
+    threshold: float = 0.75,
+    stats: Optional[DedupStats] = None,
+) -> List[Job]:
+    """
+    Quitar duplicados de una lista de jobs (conserva el orden)
+
+    Args:
+        jobs: Jobs de todas las plataformas
+        near_duplicates: Activar etapa MinHash
+        threshold: Jaccard mínimo (palabras de título + empresa) para near-duplicate
+        stats: DedupStats a llenar (opcional)
+
+    Returns:
+        List[Job]: Jobs únicos
+    """
+    deduplicator = JobDeduplicator(near_duplicates=near_duplicates, threshold=threshold)
+    if stats is not None:
+        deduplicator.stats = stats
+
+    deduplicator.add(jobs)
+    kept = deduplicator.jobs
+
+    if deduplicator.stats.removed:
+        s = deduplicator.stats
+        logger.info(
+            f"🧹 Dedup: {s.total} → {len(kept)} "
+            f"(url={s.by_url}, fingerprint={s.by_fingerprint}, minhash={s.by_minhash})"
+        )
+
+    return kept
+
+
+def _find_near_duplicate(
+    buckets: Dict[tuple, List[_Kept]],
+    band_keys: List[tuple],
+    tokens: FrozenSet[str],
+    company_tokens: Set[str],
+    threshold: float,
+) -> Optional[int]:
+    """Buscar un job conservado con Jaccard >= threshold (solo en buckets compartidos)"""
+    checked: Set[int] = set()
+    for band_key in band_keys:
+        for candidate in buckets.get(band_key, ()):
+            if candidate.index in checked:
+                continue
+            if len(checked) >= MAX_CANDIDATES:
+                return None
+            checked.add(candidate.index)
+            # Mismo título en empresas distintas NO es duplicado
+            if not (company_tokens & candidate.company_tokens):
+                continue
+            if jaccard(tokens, candidate.tokens) >= threshold:
+                return candidate.index
+    return None
@@ -0,0 +1,265 @@
+"""
+HTTP Pool - Transporte HTTP compartido (keep-alive) hacia jobspy-api
+
+Propósito:
+- Reutilizar conexiones TCP entre requests (antes: requests.get() suelto → handshake cada vez)
+- Un solo pool por proceso, compartido por TODOS los JobSpyClient
+- Variante sync (requests.Session) y async (aiohttp.ClientSession)
+- Respuestas comprimidas (zstd/br/gzip) y msgpack opcional (ver wire.py)
+
+Ciclo de vida:
+- bot/main.py llama init_transport() en post_init de la Application
+- bot/main.py llama close_transport() en post_shutdown
+- Fuera del bot (scripts, tests) get_transport() crea el pool bajo demanda
+
+Ejemplo:
+    >>> transport = get_transport()
+    >>> response = transport.get("http://localhost:8000/health", timeout=5)
+    >>> data, elapsed = transport.get_json("http://localhost:8000/api/v1/search_jobs", params={...})
+    >>> data, elapsed = await transport.aget_json("http://localhost:8000/api/v1/search_jobs", params={...})
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from backend.scrapers.wire import WireStats, decode_response, negotiation_headers
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPTransport:
+    """Pool de conexiones keep-alive (sync + async) hacia jobspy-api"""
+
+    # Valores por defecto (sobrescribibles desde bot/config.py)
+    DEFAULT_POOL_SIZE = 20
+    DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        compression: bool = True,
+        binary: bool = False,
+    ):
+        """
+        Inicializar transporte
+
+        Args:
+            pool_size: Conexiones máximas abiertas por host
+            keepalive_timeout: Segundos que una conexión ociosa sigue abierta (async)
+            compression: Pedir respuestas comprimidas (zstd/br/gzip según lo instalado)
+            binary: Pedir msgpack en vez de JSON (si msgpack está instalado)
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size debe ser >= 1")
+
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.negotiation_headers = negotiation_headers(compression, binary)
+        self.wire_stats = WireStats()
+
+        # Sync: requests.Session mantiene keep-alive por defecto
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Async: se crea bajo demanda (aiohttp necesita un event loop corriendo)
+        self._async_session: Optional[aiohttp.ClientSession] = None
+
+        logger.info(
+            f"✅ HTTPTransport inicializado (pool={pool_size}, keepalive={keepalive_timeout}s, "
+            f"encoding={self.negotiation_headers['Accept-Encoding']})"
+        )
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET usando el pool sync (mismos kwargs que requests.get)"""
+        return self.session.get(url, **kwargs)
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, float]:
+        """
+        GET sync con compresión negociada y parsear JSON/msgpack
+
+        Returns:
+            Tuple[Any, float]: (datos parseados, segundos transcurridos)
+
+        Raises:
+            requests.HTTPError: Si status != 2xx
+        """
+        start = time.perf_counter()
+
+        # stream=True + decode_content=False: bytes tal cual llegaron (decodifica wire.py)
+        with self.session.get(
+            url,
+            params=params,
+            headers=self._request_headers(headers),
+            timeout=timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            raw = response.raw.read(decode_content=False)
+            data = self._decode(raw, response.headers)
+
+        return data, time.perf_counter() - start
+
+    # ------------------------------------------------------------------
+    # Async
+    # ------------------------------------------------------------------
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Obtener (o crear) la sesión aiohttp del pool"""
+        if self._async_session is None or self._async_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            # auto_decompress=False: decodifica wire.py (zstd/br aunque aiohttp no los soporte)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector, auto_decompress=False
+            )
+        return self._async_session
+
+    async def aget_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, float]:
+        """
+        GET async con compresión negociada y parsear JSON/msgpack
+
+        Args:
+            url: URL a consultar
+            params: Query params (bool se convierte a "true"/"false")
+            timeout: Timeout total en segundos
+            headers: Headers extra
+
+        Returns:
+            Tuple[Any, float]: (datos parseados, segundos transcurridos)
+
+        Raises:
+            aiohttp.ClientResponseError: Si status != 2xx
+            asyncio.TimeoutError: Si se excede el timeout
+        """
+        session = self._get_async_session()
+        start = time.perf_counter()
+
+        async with session.get(
+            url,
+            params=_encode_params(params),
+            headers=self._request_headers(headers),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response.raise_for_status()
+            raw = await response.read()
+            data = self._decode(raw, response.headers)
+
+        return data, time.perf_counter() - start
+
+    # ------------------------------------------------------------------
+    # Codificación
+    # ------------------------------------------------------------------
+
+    def _request_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        if not headers:
+            return self.negotiation_headers
+        return {**self.negotiation_headers, **headers}
+
+    def _decode(self, raw: bytes, headers) -> Any:
+        """Descomprimir + parsear, registrando bytes en la red vs decodificados"""
+        encoding = headers.get("Content-Encoding")
+        data, body_bytes, seconds = decode_response(raw, encoding, headers.get("Content-Type"))
+        self.wire_stats.record(encoding, len(raw), body_bytes, seconds)
+        return data
+
+    def stats(self) -> dict:
+        """Tráfico acumulado (ver wire.WireStats)"""
+        return self.wire_stats.stats()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    async def aclose(self) -> None:
+        """Cerrar ambos pools (sync y async)"""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self.session.close()
+        logger.info("✅ HTTPTransport cerrado")
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """aiohttp no acepta bool en query params → convertir a "true"/"false" """
+    if params is None:
+        return None
+    return {
+        key: (str(value).lower() if isinstance(value, bool) else value)
+        for key, value in params.items()
+    }
+
+
+# ============================================================================
+# TRANSPORTE GLOBAL (uno por proceso)
+# ============================================================================
+
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def init_transport(
+    pool_size: int = HTTPTransport.DEFAULT_POOL_SIZE,
+    keepalive_timeout: float = HTTPTransport.DEFAULT_KEEPALIVE_TIMEOUT,
+    compression: bool = True,
+    binary: bool = False,
+) -> HTTPTransport:
+    """
+    Crear el transporte global (llamar una vez al arrancar el bot)
+
+    Si ya existía uno, se reemplaza (el anterior debe cerrarse con close_transport()).
+    """
+    global _transport
+    with _transport_lock:
+        _transport = HTTPTransport(
+            pool_size=pool_size,
+            keepalive_timeout=keepalive_timeout,
+            compression=compression,
+            binary=binary,
+        )
+        return _transport
+
+
+def get_transport() -> HTTPTransport:
+    """Obtener el transporte global (lo crea con valores por defecto si no existe)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
+
+
+async def close_transport() -> None:
+    """Cerrar el transporte global (llamar al apagar el bot)"""
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        await transport.aclose()
@@ -12,18 +12,82 @@ Consideraciones (de tests/pruebasApi/HALLAZGOS_CONSOLIDADOS.md):
 - LinkedIn: 0.6-1s, ignora country_indeed, job_type=null
 - Glassdoor: 0.3s, requiere country_indeed, poco confiable
 - Rate limiting: 2-5s entre búsquedas (no hay 429, pero timeouts)
+  → token bucket adaptativo por plataforma (ver throttle.py)
+- Concurrencia: máximo 2-3 búsquedas simultáneas (ráfagas → timeouts)
+
+Modos de búsqueda:
+- search_jobs(): síncrono, una plataforma tras otra
+- asearch_jobs(): async, todas las plataformas a la vez (fan-out acotado)
+- astream_jobs(): async generator, entrega cada plataforma apenas termina
+
+Conexiones: pool keep-alive compartido por proceso (ver http_pool.py)
+Caché: respuestas por (keywords, país, plataforma, filtros) con TTL (ver cache.py)
+Coalescing: búsquedas idénticas en curso comparten 1 request (ver singleflight.py)
+Deadline: presupuesto total por búsqueda, con resultados parciales y hedging (ver latency.py)
+Circuit breaker: plataformas que fallan seguido se saltan al instante (ver circuit_breaker.py)
+Ubicación: el string de la API ("ANT, CO") se parsea a JobLocation (ver location.py)
 """
 
+import asyncio
 import logging
 import time
-import requests
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
-from database.models import Job
+from pydantic import TypeAdapter, ValidationError
+
+from database.models import Job, JobLocation
+from backend.scrapers.cache import SearchCache, get_search_cache, make_cache_key
+from backend.scrapers.circuit_breaker import (
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    counts_as_failure,
+    get_breaker_registry,
+)
+from backend.scrapers.dedup import JobDeduplicator, deduplicate_jobs
+from backend.scrapers.http_pool import HTTPTransport, get_transport
+from backend.scrapers.latency import LatencyRegistry, get_latency_registry
+from backend.scrapers.location import location_fields, parse_location
+from backend.scrapers.singleflight import get_async_singleflight, get_singleflight
+from backend.scrapers.throttle import (
+    ThrottleRegistry,
+    get_throttle_registry,
+    is_backoff_error,
+)
 
 logger = logging.getLogger(__name__)
 
+# Validador de lotes: un solo paso por pydantic-core para toda la respuesta
+_JOB_LIST_ADAPTER = TypeAdapter(List[Job])
+
+
+@dataclass
+class PlatformBatch:
+    """Resultado de UNA plataforma en astream_jobs()"""
+
+    platform: str
+    jobs: List[Job]
+    elapsed: float  # segundos
+    error: Optional[str] = None  # None si la búsqueda terminó bien
+    timed_out: bool = False  # True si se descartó por el deadline
+
+
+@dataclass
+class SearchReport:
+    """Resultado de asearch_jobs_report(): jobs + qué plataformas respondieron"""
+
+    jobs: List[Job]
+    completed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # plataforma → error
+    dropped: List[str] = field(default_factory=list)  # no llegaron antes del deadline
+    elapsed: float = 0.0
+
+    @property
+    def partial(self) -> bool:
+        """True si faltó alguna plataforma (error o deadline)"""
+        return bool(self.failed or self.dropped)
+
 
 class JobSpyClient:
     """Cliente para JobSpy API (localhost:8000)"""
@@ -50,16 +114,62 @@ class JobSpyClient:
         "brazil": "Brazil",
     }
 
-    def __init__(self, api_url: str = "http://localhost:8000", timeout: int = 30):
+    # Columnas que lee _map_job_fields(): se piden con ?fields= para que la API
+    # no serialice el resto del DataFrame (salarios, logos, datos de empresa...).
+    # Una jobspy-api sin soporte de fields ignora el parámetro y devuelve todo.
+    RESPONSE_FIELDS = (
+        "id", "title", "company", "company_url", "job_url", "location",
+        "is_remote", "description", "job_type", "job_function", "job_level",
+        "company_industry", "date_posted",
+    )
+
+    # Máximo de plataformas consultadas a la vez en modo async
+    # (HALLAZGOS: "no hacer más de 2-3 en paralelo")
+    DEFAULT_MAX_CONCURRENCY = 3
+
+    def __init__(
+        self,
+        api_url: str = "http://localhost:8000",
+        timeout: int = 30,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport: Optional[HTTPTransport] = None,
+        throttles: Optional[ThrottleRegistry] = None,
+        cache: Optional[SearchCache] = None,
+        latencies: Optional[LatencyRegistry] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+    ):
         """
         Inicializar cliente JobSpy
 
         Args:
             api_url: URL base de API (default: localhost:8000)
             timeout: Timeout en segundos para requests
+            max_concurrency: Plataformas simultáneas en asearch_jobs() (default: 3)
+            transport: Pool HTTP a usar (default: el pool global del proceso)
+            throttles: Rate limiters por plataforma (default: los globales del proceso)
+            cache: Caché de resultados (default: la caché global del proceso)
+            latencies: Latencias por plataforma para hedging (default: las globales)
+            breakers: Circuit breakers por plataforma (default: los globales)
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser >= 1")
+
         self.api_url = api_url
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # Pool compartido: crear muchos JobSpyClient NO abre conexiones nuevas
+        self.transport = transport or get_transport()
+        # Throttle compartido: limita la tasa combinada de TODOS los usuarios
+        self.throttles = throttles or get_throttle_registry()
+        # Caché compartida: usuarios con el mismo perfil reutilizan resultados
+        self.cache = cache or get_search_cache()
+        # Single-flight compartido: búsquedas idénticas en curso → 1 request upstream
+        self.flights = get_singleflight()
+        self.async_flights = get_async_singleflight()
+        # Latencias compartidas: el p95 decide cuándo mandar un hedge
+        self.latencies = latencies or get_latency_registry()
+        # Breakers compartidos: una plataforma caída se salta para TODOS los usuarios
+        self.breakers = breakers or get_breaker_registry()
         self.endpoint = urljoin(api_url, "/api/v1/search_jobs")
 
         logger.info(f"✅ JobSpyClient inicializado: {self.api_url}")
@@ -72,6 +182,7 @@ class JobSpyClient:
         is_remote: Optional[bool] = None,
         platforms: Optional[List[str]] = None,
         results_wanted: int = 25,
+        dedupe: bool = True,
     ) -> List[Job]:
         """
         Buscar empleos en JobSpy API
@@ -83,6 +194,7 @@ class JobSpyClient:
             is_remote: Si es remoto (True/False/None)
             platforms: Lista de plataformas (default: todas)
             results_wanted: Cuántos resultados (default: 25)
+            dedupe: Quitar duplicados entre plataformas (default: True, ver dedup.py)
 
         Returns:
             List[Job]: Lista de modelos Job
@@ -119,12 +231,16 @@ class JobSpyClient:
                 )
                 all_jobs.extend(jobs)
 
+            except CircuitOpenError as e:
+                logger.info(f"⏭️ Saltando {platform}: {e}")
+                continue
+
             except Exception as e:
                 logger.error(f"❌ Error buscando en {platform}: {e}")
                 continue
 
-            # Rate limiting: esperar entre búsquedas (2-3 segundos)
-            time.sleep(2)
+        if dedupe:
+            all_jobs = deduplicate_jobs(all_jobs)
 
         logger.info(
             f"✅ Total de jobs encontrados: {len(all_jobs)} "
@@ -133,6 +249,241 @@ class JobSpyClient:
 
         return all_jobs
 
+    async def asearch_jobs(
+        self,
+        keywords: str,
+        country: str,
+        job_type: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        platforms: Optional[List[str]] = None,
+        results_wanted: int = 25,
+        dedupe: bool = True,
+        on_platform_done: Optional[Callable[[PlatformBatch], Awaitable[None]]] = None,
+        deadline: Optional[float] = None,
+        hedge: bool = False,
+    ) -> List[Job]:
+        """
+        Buscar empleos en todas las plataformas a la vez (fan-out async)
+
+        Mismos parámetros y resultado que search_jobs(), pero las plataformas
+        se consultan en paralelo (máximo self.max_concurrency a la vez), así
+        que la latencia total ≈ la plataforma más lenta en vez de la suma.
+
+        Los resultados se devuelven en el orden de `platforms` (no en orden
+        de llegada), igual que search_jobs().
+
+        Args:
+            on_platform_done: Callback async llamado con cada PlatformBatch
+                apenas llega (ej: mostrar progreso al usuario)
+            deadline: Presupuesto total en segundos (ver asearch_jobs_report)
+            hedge: Mandar request de respaldo si una plataforma supera su p95
+
+        Returns:
+            List[Job]: Lista de modelos Job
+
+        Raises:
+            ValueError: Si parámetros son inválidos
+        """
+        report = await self.asearch_jobs_report(
+            keywords=keywords,
+            country=country,
+            job_type=job_type,
+            is_remote=is_remote,
+            platforms=platforms,
+            results_wanted=results_wanted,
+            dedupe=dedupe,
+            on_platform_done=on_platform_done,
+            deadline=deadline,
+            hedge=hedge,
+        )
+        return report.jobs
+
+    async def asearch_jobs_report(
+        self,
+        keywords: str,
+        country: str,
+        job_type: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        platforms: Optional[List[str]] = None,
+        results_wanted: int = 25,
+        dedupe: bool = True,
+        on_platform_done: Optional[Callable[[PlatformBatch], Awaitable[None]]] = None,
+        deadline: Optional[float] = None,
+        hedge: bool = False,
+    ) -> SearchReport:
+        """
+        Como asearch_jobs(), pero con presupuesto de tiempo y reporte
+
+        Con deadline, una plataforma lenta ya no retiene la respuesta hasta
+        el timeout de 30s: al vencer el plazo se devuelve lo que haya
+        terminado y las pendientes quedan en report.dropped. (Su request
+        sigue en single-flight y, si termina, calienta la caché.)
+
+        Con hedge=True, si una plataforma supera su p95 reciente se manda un
+        segundo request (pasa por el throttle) y gana el primero en responder.
+
+        Returns:
+            SearchReport: jobs + completed / failed / dropped
+
+        Raises:
+            ValueError: Si parámetros son inválidos
+        """
+        if platforms is None:
+            platforms = self.VALID_PLATFORMS
+
+        start = time.perf_counter()
+        report = SearchReport(jobs=[])
+        batches: Dict[str, List[Job]] = {}
+
+        async for batch in self.astream_jobs(
+            keywords=keywords,
+            country=country,
+            job_type=job_type,
+            is_remote=is_remote,
+            platforms=platforms,
+            results_wanted=results_wanted,
+            dedupe=False,  # Se deduplica abajo, ya en orden de plataformas
+            deadline=deadline,
+            hedge=hedge,
+        ):
+            batches[batch.platform] = batch.jobs
+            if batch.timed_out:
+                report.dropped.append(batch.platform)
+            elif batch.error:
+                report.failed[batch.platform] = batch.error
+            else:
+                report.completed.append(batch.platform)
+
+            if on_platform_done is not None:
+                await on_platform_done(batch)
+
+        all_jobs = [job for platform in platforms for job in batches.get(platform, [])]
+
+        if dedupe:
+            all_jobs = deduplicate_jobs(all_jobs)
+
+        report.jobs = all_jobs
+        report.elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"✅ Total de jobs encontrados: {len(all_jobs)} "
+            f"({', '.join(set(j.source for j in all_jobs))})"
+            + (f" | ⏱️ descartadas por deadline: {report.dropped}" if report.dropped else "")
+        )
+
+        return report
+
+    async def astream_jobs(
+        self,
+        keywords: str,
+        country: str,
+        job_type: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        platforms: Optional[List[str]] = None,
+        results_wanted: int = 25,
+        dedupe: bool = True,
+        deadline: Optional[float] = None,
+        hedge: bool = False,
+    ) -> AsyncIterator[PlatformBatch]:
+        """
+        Buscar en paralelo y entregar cada plataforma APENAS termina
+
+        A diferencia de asearch_jobs(), no espera a la más lenta: el
+        llamador puede empezar a procesar LinkedIn (0.6-1s) mientras
+        Indeed (1-2s) o un timeout (30s) siguen corriendo.
+
+        Con dedupe=True cada lote trae solo jobs que no llegaron antes
+        (ver JobDeduplicator).
+
+        Si el llamador deja de iterar, las búsquedas pendientes se cancelan.
+
+        Con deadline (segundos), al vencer el plazo las plataformas pendientes
+        se cancelan y se entregan como PlatformBatch(timed_out=True) vacíos.
+
+        Yields:
+            PlatformBatch: Jobs de una plataforma (en orden de llegada)
+
+        Raises:
+            ValueError: Si parámetros son inválidos
+
+        Ejemplo:
+            >>> async for batch in client.astream_jobs("python", "USA"):
+            ...     print(batch.platform, len(batch.jobs))
+        """
+        self._validate_params(keywords, country, job_type)
+
+        if platforms is None:
+            platforms = self.VALID_PLATFORMS
+
+        country_name = self._normalize_country(country)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        deduplicator = JobDeduplicator() if dedupe else None
+
+        async def search_one(platform: str) -> PlatformBatch:
+            async with semaphore:
+                logger.info(
+                    f"🔍 Buscando en {platform.upper()}: {keywords} ({country_name})"
+                )
+                start = time.perf_counter()
+                try:
+                    jobs = await self._asearch_platform(
+                        platform=platform,
+                        keywords=keywords,
+                        country=country_name,
+                        job_type=job_type,
+                        is_remote=is_remote,
+                        results_wanted=results_wanted,
+                        hedge=hedge,
+                    )
+                    return PlatformBatch(platform, jobs, time.perf_counter() - start)
+                except CircuitOpenError as e:
+                    logger.info(f"⏭️ Saltando {platform}: {e}")
+                    return PlatformBatch(platform, [], 0.0, error=str(e))
+                except Exception as e:
+                    logger.error(f"❌ Error buscando en {platform}: {e}")
+                    return PlatformBatch(
+                        platform, [], time.perf_counter() - start,
+                        error=str(e) or type(e).__name__,
+                    )
+
+        tasks = {asyncio.ensure_future(search_one(p)): p for p in platforms}
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        expires_at = started + deadline if deadline is not None else None
+
+        try:
+            while pending:
+                timeout = None if expires_at is None else max(0.0, expires_at - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Deadline vencido: entregar lo pendiente como descartado
+                    for task in pending:
+                        task.cancel()
+                        platform = tasks[task]
+                        logger.warning(
+                            f"⏱️ {platform.upper()}: descartada por deadline ({deadline}s)"
+                        )
+                        yield PlatformBatch(
+                            platform, [], loop.time() - started,
+                            error="deadline", timed_out=True,
+                        )
+                    return
+
+                # Orden estable si varias terminan en la misma vuelta
+                for task in sorted(done, key=lambda t: platforms.index(tasks[t])):
+                    batch = task.result()
+                    if deduplicator is not None:
+                        batch.jobs = deduplicator.add(batch.jobs)
+                    yield batch
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     def _search_platform(
         self,
         platform: str,
@@ -143,7 +494,207 @@ class JobSpyClient:
         results_wanted: int = 25,
     ) -> List[Job]:
         """
-        Buscar en una plataforma específica
+        Buscar en una plataforma específica (sync)
+
+        Orden: caché → single-flight (1 request por query en curso) → API
+        """
+        cache_key = make_cache_key(
+            keywords, country, platform, job_type, is_remote, results_wanted
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._parse_response(cached, platform, 0.0, from_cache=True, country=country)
+
+        params = self._build_params(
+            platform, keywords, country, job_type, is_remote, results_wanted
+        )
+
+        data, elapsed = self.flights.do(
+            cache_key, lambda: self._fetch_platform(platform, params, cache_key)
+        )
+
+        return self._parse_response(data, platform, elapsed, country=country)
+
+    async def _asearch_platform(
+        self,
+        platform: str,
+        keywords: str,
+        country: str,
+        job_type: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        results_wanted: int = 25,
+        hedge: bool = False,
+    ) -> List[Job]:
+        """
+        Buscar en una plataforma específica (async)
+
+        Orden: caché → single-flight (1 request por query en curso) → API
+        Con hedge=True: request de respaldo si se supera el p95 (ver _ahedged_fetch)
+        """
+        cache_key = make_cache_key(
+            keywords, country, platform, job_type, is_remote, results_wanted
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._parse_response(cached, platform, 0.0, from_cache=True, country=country)
+
+        params = self._build_params(
+            platform, keywords, country, job_type, is_remote, results_wanted
+        )
+
+        primary = self.async_flights.do(
+            cache_key, lambda: self._afetch_platform(platform, params, cache_key)
+        )
+
+        if hedge:
+            data, elapsed = await self._ahedged_fetch(primary, platform, params, cache_key)
+        else:
+            data, elapsed = await primary
+
+        return self._parse_response(data, platform, elapsed, country=country)
+
+    async def _ahedged_fetch(
+        self, primary: Awaitable, platform: str, params: Dict[str, Any], cache_key
+    ) -> Tuple[dict, float]:
+        """
+        Hedged request: si primary supera el p95 de la plataforma, lanzar
+        un respaldo (fuera de single-flight) y quedarse con el primero que
+        responda bien.
+
+        Sin suficientes mediciones (p95 = None) no hay hedge.
+        """
+        primary_task = asyncio.ensure_future(primary)
+        p95 = self.latencies.get(platform).p95()
+        if p95 is None:
+            return await primary_task
+
+        done, _ = await asyncio.wait({primary_task}, timeout=p95)
+        if done:
+            return primary_task.result()
+
+        logger.info(f"🪁 {platform.upper()}: > p95 ({p95:.2f}s), enviando hedge")
+        backup_task = asyncio.ensure_future(
+            self._afetch_platform(platform, params, cache_key)
+        )
+        pending = {primary_task, backup_task}
+        error: Optional[BaseException] = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _fetch_platform(
+        self, platform: str, params: Dict[str, Any], cache_key
+    ) -> Tuple[dict, float]:
+        """
+        Request real a jobspy-api (sync, pool keep-alive + throttle)
+
+        Returns:
+            Tuple[dict, float]: (JSON de la API, segundos)
+        """
+        logger.debug(f"Parámetros de búsqueda: {params}")
+
+        # Circuit breaker: si la plataforma viene fallando, no esperar el timeout
+        breaker = self.breakers.get(platform)
+        trial = breaker.before_call()
+
+        try:
+            # Rate limiting: esperar turno en el bucket de la plataforma
+            throttle = self.throttles.get(platform)
+            throttle.acquire()
+
+            try:
+                # Hacer request (conexión reutilizada del pool, respuesta comprimida)
+                data, elapsed = self.transport.get_json(
+                    self.endpoint,
+                    params=params,
+                    timeout=self.timeout,
+                )
+            except Exception as e:
+                if is_backoff_error(e):
+                    throttle.on_failure()
+                raise
+        except BaseException as e:
+            self._record_breaker_error(breaker, e, trial)
+            raise
+
+        throttle.on_success()
+        breaker.record_success(trial)
+        self.latencies.get(platform).record(elapsed)
+
+        self._cache_response(cache_key, data)
+
+        return data, elapsed
+
+    async def _afetch_platform(
+        self, platform: str, params: Dict[str, Any], cache_key
+    ) -> Tuple[dict, float]:
+        """
+        Request real a jobspy-api (async, pool keep-alive + throttle)
+
+        Returns:
+            Tuple[dict, float]: (JSON de la API, segundos)
+        """
+        logger.debug(f"Parámetros de búsqueda: {params}")
+
+        breaker = self.breakers.get(platform)
+        trial = breaker.before_call()
+
+        try:
+            throttle = self.throttles.get(platform)
+            await throttle.aacquire()
+
+            try:
+                data, elapsed = await self.transport.aget_json(
+                    self.endpoint,
+                    params=params,
+                    timeout=self.timeout,
+                )
+            except Exception as e:
+                if is_backoff_error(e):
+                    throttle.on_failure()
+                raise
+        except BaseException as e:
+            self._record_breaker_error(breaker, e, trial)
+            raise
+
+        throttle.on_success()
+        breaker.record_success(trial)
+        self.latencies.get(platform).record(elapsed)
+
+        self._cache_response(cache_key, data)
+
+        return data, elapsed
+
+    @staticmethod
+    def _record_breaker_error(breaker, error: BaseException, trial: bool) -> None:
+        """Fallo de plataforma → cuenta; cancelación o 4xx → solo liberar el turno"""
+        if isinstance(error, Exception) and counts_as_failure(error):
+            breaker.record_failure(trial)
+        else:
+            breaker.release(trial)
+
+    def _build_params(
+        self,
+        platform: str,
+        keywords: str,
+        country: str,
+        job_type: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        results_wanted: int = 25,
+    ) -> Dict[str, Any]:
+        """
+        Construir query params para una plataforma
 
         Consideraciones especiales:
         - Indeed: requiere country_indeed
@@ -154,6 +705,7 @@ class JobSpyClient:
             "search_term": keywords,
             "site_name": platform,
             "results_wanted": results_wanted,
+            "fields": ",".join(self.RESPONSE_FIELDS),
         }
 
         # LinkedIn NO requiere country_indeed (lo ignora)
@@ -169,66 +721,134 @@ class JobSpyClient:
         if is_remote is not None:
             params["is_remote"] = is_remote
 
-        logger.debug(f"Parámetros de búsqueda: {params}")
+        return params
 
-        # Hacer request
-        response = requests.get(
-            self.endpoint,
-            params=params,
-            timeout=self.timeout,
-        )
+    def _cache_response(self, cache_key, data: dict) -> None:
+        """
+        Guardar respuesta en caché
 
-        response.raise_for_status()  # Lanzar error si status != 200
+        Respuestas vacías NO se guardan: Glassdoor a veces devuelve 0
+        resultados aunque existan, y no queremos fijar ese fallo por el TTL.
+        """
+        if data.get("jobs"):
+            self.cache.set(cache_key, data)
 
-        # Parsear respuesta
-        data = response.json()
+    def _parse_response(
+        self,
+        data: dict,
+        platform: str,
+        elapsed: float,
+        from_cache: bool = False,
+        country: Optional[str] = None,
+    ) -> List[Job]:
+        """
+        Convertir respuesta JSON de la API ({count, jobs, cached}) a Jobs
+
+        country: País de la búsqueda (desempata ubicaciones ambiguas, ver location.py)
+        """
         jobs_data = data.get("jobs", [])
         count = data.get("count", 0)
 
-        logger.info(
-            f"✅ {platform.upper()}: {count} resultados en {response.elapsed.total_seconds():.2f}s"
-        )
+        if from_cache:
+            logger.info(f"💾 {platform.upper()}: {count} resultados (caché)")
+        else:
+            logger.info(f"✅ {platform.upper()}: {count} resultados en {elapsed:.2f}s")
 
         # Convertir a Job objects
-        jobs = [self._parse_job(job_data, platform) for job_data in jobs_data]
+        return self._parse_jobs_bulk(jobs_data, platform, country)
+
+    def _parse_jobs_bulk(
+        self, jobs_data: List[dict], platform: str, country: Optional[str] = None
+    ) -> List[Job]:
+        """
+        Parsear una respuesta completa con UNA sola validación Pydantic
+
+        Camino rápido para datos de la API (ya tipados del lado de jobspy):
+        - Los dicts se validan todos juntos con TypeAdapter(List[Job]): el loop
+          corre dentro de pydantic-core, sin Job(...) por registro
+        - La ubicación se parsea una vez por string distinto ("ANT, CO" se
+          repite en casi toda la respuesta) y va como JobLocation ya armado
+          (inmutable, compartido): pydantic no revalida instancias, así se
+          salta el sub-modelo, ~40% del costo de validar
+        - NO se usa Job.model_construct(): con pydantic 2.x es más lento que
+          validar en pydantic-core (2-10x, el default_factory de sent_to se
+          inspecciona en cada llamada). Ver scripts/bench_job_parsing.py
+
+        Si el lote trae registros inválidos (ej: sin title/job_url) se reparsea
+        uno a uno descartando solo esos, en vez de perder TODA la plataforma.
+        """
+        locations: Dict[Tuple[str, Optional[str]], Optional[JobLocation]] = {}
+        records = [
+            self._map_job_fields(job_data, platform, country, locations) for job_data in jobs_data
+        ]
+
+        try:
+            return _JOB_LIST_ADAPTER.validate_python(records)
+        except ValidationError:
+            jobs = []
+            for record in records:
+                try:
+                    jobs.append(Job.model_validate(record))
+                except ValidationError:
+                    pass
+            logger.warning(
+                f"⚠️ {platform.upper()}: {len(records) - len(jobs)} registros inválidos descartados"
+            )
+            return jobs
+
+    @staticmethod
+    def _map_job_fields(
+        job_data: dict,
+        platform: str,
+        country: Optional[str] = None,
+        locations: Optional[Dict[Tuple[str, Optional[str]], Optional[JobLocation]]] = None,
+    ) -> dict:
+        """
+        Mapear un registro de la API a los campos de Job
 
-        return jobs
+        locations: Memo (string, país) → JobLocation de la respuesta en curso;
+                   None = ubicación como dict (la valida Job)
+        """
+        get = job_data.get
+        raw_location = get("location")
+        if locations is not None and isinstance(raw_location, str):
+            key = (raw_location, country)
+            if key not in locations:
+                locations[key] = parse_location(raw_location, country)
+            location = locations[key]
+        else:
+            location = location_fields(raw_location, country)  # "ANT, CO" → dict
+        return {
+            "id": get("id"),
+            "title": get("title"),
+            "company": get("company"),
+            "company_url": get("company_url"),
+            "job_url": get("job_url"),
+            "location": location,
+            "is_remote": get("is_remote", False),
+            "description": get("description"),
+            "job_type": get("job_type"),
+            "job_function": get("job_function"),
+            "job_level": get("job_level"),
+            "company_industry": get("company_industry"),
+            "date_posted": get("date_posted"),
+            "source": platform,
+            "scraped_at": None,
+        }
 
-    def _parse_job(self, job_data: dict, platform: str) -> Job:
+    def _parse_job(self, job_data: dict, platform: str, country: Optional[str] = None) -> Job:
         """
         Parsear respuesta JSON a Job model (Pydantic)
 
         Args:
             job_data: Dict con datos del trabajo
             platform: Plataforma (indeed, linkedin, glassdoor)
+            country: País de la búsqueda (para parsear la ubicación)
 
         Returns:
             Job: Modelo Pydantic validado
         """
-        # Location viene como string ("ANT, CO") pero Job model espera None
-        # Para MVP, ignoramos location (se puede parsear luego)
-        location = None
-
-        # Mapear campos de la API a Job model
-        job = Job(
-            id=job_data.get("id"),
-            title=job_data.get("title"),
-            company=job_data.get("company"),
-            company_url=job_data.get("company_url"),
-            job_url=job_data.get("job_url"),
-            location=location,  # Ignorar por ahora (es string en API)
-            is_remote=job_data.get("is_remote", False),
-            description=job_data.get("description"),
-            job_type=job_data.get("job_type"),
-            job_function=job_data.get("job_function"),
-            job_level=job_data.get("job_level"),
-            company_industry=job_data.get("company_industry"),
-            date_posted=job_data.get("date_posted"),
-            source=platform,  # Marcar plataforma
-            scraped_at=None,  # Se puede llenar después
-        )
-
-        return job
+        return Job(**self._map_job_fields(job_data, platform, country))
 
     def _validate_params(
         self, keywords: str, country: str, job_type: Optional[str]
@@ -289,8 +909,30 @@ class JobSpyClient:
         """
         try:
             health_url = urljoin(self.api_url, "/health")
-            response = requests.get(health_url, timeout=5)
+            response = self.transport.get(health_url, timeout=5)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"❌ API no está disponible: {e}")
             return False
+
+    def platform_health(self) -> Dict[str, dict]:
+        """
+        Estado por plataforma: circuit breaker, throttle y latencias
+
+        Returns:
+            Dict[str, dict]: Ej: {"glassdoor": {"circuit": {"state": "open", ...},
+                                                "throttle": {"rate": 0.2, ...},
+                                                "latency": {"p95": 1.4, ...}}}
+        """
+        breakers = self.breakers.stats()
+        throttles = self.throttles.stats()
+        latencies = self.latencies.stats()
+
+        return {
+            platform: {
+                "circuit": breakers.get(platform, {"state": "closed"}),
+                "throttle": throttles.get(platform),
+                "latency": latencies.get(platform),
+            }
+            for platform in self.VALID_PLATFORMS
+        }
@@ -0,0 +1,86 @@
+"""
+Latency - Latencias recientes por plataforma (para hedged requests)
+
+Propósito:
+- Guardar las últimas N latencias exitosas de cada plataforma
+- Calcular p95: si una búsqueda lo supera, vale la pena mandar un
+  request de respaldo (hedge) en vez de esperar al timeout de 30s
+
+Ejemplo:
+    >>> tracker = get_latency_registry().get("indeed")
+    >>> tracker.record(1.27)
+    >>> tracker.p95()   # None hasta tener min_samples mediciones
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+class LatencyTracker:
+    """Ventana deslizante de latencias (thread-safe)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 10):
+        """
+        Args:
+            window: Cuántas mediciones recientes conservar
+            min_samples: Mínimo de mediciones para reportar percentiles
+        """
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Percentil q (0-100) por nearest-rank, o None si hay pocas mediciones"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def p95(self) -> Optional[float]:
+        return self.percentile(95)
+
+    def stats(self) -> dict:
+        with self._lock:
+            count = len(self._samples)
+        return {
+            "samples": count,
+            "p50": self.percentile(50),
+            "p95": self.p95(),
+        }
+
+
+class LatencyRegistry:
+    """Un LatencyTracker por plataforma (creados bajo demanda)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 10):
+        self._window = window
+        self._min_samples = min_samples
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform: str) -> LatencyTracker:
+        with self._lock:
+            if platform not in self._trackers:
+                self._trackers[platform] = LatencyTracker(self._window, self._min_samples)
+            return self._trackers[platform]
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            trackers = dict(self._trackers)
+        return {platform: tracker.stats() for platform, tracker in trackers.items()}
+
+
+_registry = LatencyRegistry()
+
+
+def get_latency_registry() -> LatencyRegistry:
+    """Obtener el registry global de latencias"""
+    return _registry
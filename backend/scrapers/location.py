@@ -0,0 +1,394 @@
+"""
+Location - Parsear ubicaciones de JobSpy ("ANT, CO") a JobLocation
+
+Propósito:
+- jobspy-api devuelve location como string libre: "ANT, CO",
+  "San Francisco, CA, US", "Medellín, Antioquia, Colombia", "Remote"
+- Antes se descartaba (location=None): no se podía filtrar por país/estado
+  antes de gastar llamadas a Gemini y la columna Ubicacion del CSV iba vacía
+
+Cómo:
+- Tablas de abreviaturas (países, estados/departamentos, ciudades grandes)
+  precompiladas al importar en índices dict por token normalizado
+  (minúsculas, sin tildes, sin puntos) → lookup O(1) por parte
+- parse_location_parts() memoizado con lru_cache: las mismas ~cientos de
+  ubicaciones se repiten en miles de jobs
+
+Ambigüedades ("CA" = Canadá o California, "CO" = Colombia o Colorado):
+- "ANT, CO"      → la parte anterior es un estado de Colombia → país
+- "Denver, CO"   → "Denver" no es estado/ciudad de Colombia   → estado (Colorado)
+- country_hint (país de la búsqueda) desempata a favor de ese país
+
+Ejemplo:
+    >>> parse_location("ANT, CO")
+    JobLocation(country='Colombia', city=None, state='Antioquia')
+    >>> filter_jobs_by_location(jobs, country="Colombia")
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from database.models import Job, JobLocation
+
+
+# ============================================================================
+# TABLAS (nombres canónicos de país = valores de JobSpyClient.VALID_COUNTRIES)
+# ============================================================================
+
+COUNTRY_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "USA": ("us", "usa", "united states", "united states of america", "estados unidos", "eeuu"),
+    "Colombia": ("co", "col", "colombia"),
+    "Canada": ("ca", "can", "canada"),
+    "UK": ("uk", "gb", "gbr", "united kingdom", "great britain", "reino unido"),
+    "Mexico": ("mx", "mex", "mexico"),
+    "Argentina": ("ar", "arg", "argentina"),
+    "Chile": ("cl", "chl", "chile"),
+    "Peru": ("pe", "per", "peru"),
+    "Spain": ("es", "esp", "spain", "espana"),
+    "Germany": ("de", "deu", "germany", "deutschland", "alemania"),
+    "France": ("fr", "fra", "france", "francia"),
+    "Brazil": ("br", "bra", "brazil", "brasil"),
+    # Fuera de VALID_COUNTRIES pero frecuentes en resultados de LinkedIn
+    "India": ("in", "ind", "india"),
+    "Australia": ("au", "aus", "australia"),
+    "Ireland": ("ie", "irl", "ireland"),
+    "Netherlands": ("nl", "nld", "netherlands"),
+    "Portugal": ("pt", "prt", "portugal"),
+    "Italy": ("it", "ita", "italy", "italia"),
+    "Poland": ("pl", "pol", "poland"),
+}
+
+# {país: {abreviatura: nombre}}. Abreviaturas como las usa Indeed en cada país.
+STATES: Dict[str, Dict[str, str]] = {
+    "USA": {
+        "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
+        "CA": "California", "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware",
+        "DC": "District of Columbia", "FL": "Florida", "GA": "Georgia", "HI": "Hawaii",
+        "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
+        "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine",
+        "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+        "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska",
+        "NV": "Nevada", "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico",
+        "NY": "New York", "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
+        "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania", "RI": "Rhode Island",
+        "SC": "South Carolina", "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas",
+        "UT": "Utah", "VT": "Vermont", "VA": "Virginia", "WA": "Washington",
+        "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming", "PR": "Puerto Rico",
+    },
+    "Canada": {
+        "AB": "Alberta", "BC": "British Columbia", "MB": "Manitoba", "NB": "New Brunswick",
+        "NL": "Newfoundland and Labrador", "NS": "Nova Scotia", "NT": "Northwest Territories",
+        "NU": "Nunavut", "ON": "Ontario", "PE": "Prince Edward Island", "QC": "Quebec",
+        "SK": "Saskatchewan", "YT": "Yukon",
+    },
+    "Colombia": {
+        "AMA": "Amazonas", "ANT": "Antioquia", "ARA": "Arauca", "ATL": "Atlántico",
+        "BOL": "Bolívar", "BOY": "Boyacá", "CAL": "Caldas", "CAQ": "Caquetá",
+        "CAS": "Casanare", "CAU": "Cauca", "CES": "Cesar", "CHO": "Chocó",
+        "COR": "Córdoba", "CUN": "Cundinamarca", "DC": "Bogotá D.C.", "GUA": "Guainía",
+        "GUV": "Guaviare", "HUI": "Huila", "LAG": "La Guajira", "MAG": "Magdalena",
+        "MET": "Meta", "NAR": "Nariño", "NSA": "Norte de Santander", "PUT": "Putumayo",
+        "QUI": "Quindío", "RIS": "Risaralda", "SAP": "San Andrés y Providencia",
+        "SAN": "Santander", "SUC": "Sucre", "TOL": "Tolima", "VAC": "Valle del Cauca",
+        "VAU": "Vaupés", "VID": "Vichada",
+    },
+    "Mexico": {
+        "AGU": "Aguascalientes", "BCN": "Baja California", "BCS": "Baja California Sur",
+        "CAM": "Campeche", "CHP": "Chiapas", "CHH": "Chihuahua", "CMX": "Ciudad de México",
+        "CDMX": "Ciudad de México", "COA": "Coahuila", "COL": "Colima", "DUR": "Durango",
+        "GUA": "Guanajuato", "GRO": "Guerrero", "HID": "Hidalgo", "JAL": "Jalisco",
+        "MEX": "Estado de México", "MIC": "Michoacán", "MOR": "Morelos", "NAY": "Nayarit",
+        "NLE": "Nuevo León", "NL": "Nuevo León", "OAX": "Oaxaca", "PUE": "Puebla",
+        "QUE": "Querétaro", "ROO": "Quintana Roo", "SLP": "San Luis Potosí",
+        "SIN": "Sinaloa", "SON": "Sonora", "TAB": "Tabasco", "TAM": "Tamaulipas",
+        "TLA": "Tlaxcala", "VER": "Veracruz", "YUC": "Yucatán", "ZAC": "Zacatecas",
+    },
+    "Brazil": {
+        "AC": "Acre", "AL": "Alagoas", "AP": "Amapá", "AM": "Amazonas", "BA": "Bahia",
+        "CE": "Ceará", "DF": "Distrito Federal", "ES": "Espírito Santo", "GO": "Goiás",
+        "MA": "Maranhão", "MT": "Mato Grosso", "MS": "Mato Grosso do Sul",
+        "MG": "Minas Gerais", "PA": "Pará", "PB": "Paraíba", "PR": "Paraná",
+        "PE": "Pernambuco", "PI": "Piauí", "RJ": "Rio de Janeiro",
+        "RN": "Rio Grande do Norte", "RS": "Rio Grande do Sul", "RO": "Rondônia",
+        "RR": "Roraima", "SC": "Santa Catarina", "SP": "São Paulo", "SE": "Sergipe",
+        "TO": "Tocantins",
+    },
+    "Argentina": {
+        "CABA": "Ciudad Autónoma de Buenos Aires", "BA": "Buenos Aires",
+        "CBA": "Córdoba", "SF": "Santa Fe", "MZA": "Mendoza",
+    },
+    "Chile": {"RM": "Región Metropolitana", "VS": "Valparaíso", "BI": "Biobío"},
+    "Peru": {"LIM": "Lima", "ARE": "Arequipa", "CUS": "Cusco"},
+    "Spain": {"MD": "Comunidad de Madrid", "CT": "Cataluña", "VC": "Comunidad Valenciana", "AN": "Andalucía"},
+    "UK": {"ENG": "England", "SCT": "Scotland", "WLS": "Wales", "NIR": "Northern Ireland"},
+}
+
+# Ciudades grandes: {ciudad: (país, estado)} para strings sin país ("Bogotá")
+CITIES: Dict[str, Tuple[str, Optional[str]]] = {
+    "Bogotá": ("Colombia", "Bogotá D.C."),
+    "Medellín": ("Colombia", "Antioquia"),
+    "Cali": ("Colombia", "Valle del Cauca"),
+    "Barranquilla": ("Colombia", "Atlántico"),
+    "Cartagena": ("Colombia", "Bolívar"),
+    "Bucaramanga": ("Colombia", "Santander"),
+    "Pereira": ("Colombia", "Risaralda"),
+    "Ciudad de México": ("Mexico", "Ciudad de México"),
+    "Guadalajara": ("Mexico", "Jalisco"),
+    "Monterrey": ("Mexico", "Nuevo León"),
+    "Buenos Aires": ("Argentina", "Buenos Aires"),
+    "Rosario": ("Argentina", "Santa Fe"),
+    "Santiago": ("Chile", "Región Metropolitana"),
+    "Lima": ("Peru", "Lima"),
+    "São Paulo": ("Brazil", "São Paulo"),
+    "Rio de Janeiro": ("Brazil", "Rio de Janeiro"),
+    "Madrid": ("Spain", "Comunidad de Madrid"),
+    "Barcelona": ("Spain", "Cataluña"),
+    "Valencia": ("Spain", "Comunidad Valenciana"),
+    "London": ("UK", "England"),
+    "Berlin": ("Germany", None),
+    "Munich": ("Germany", None),
+    "Paris": ("France", None),
+    "Toronto": ("Canada", "Ontario"),
+    "Vancouver": ("Canada", "British Columbia"),
+    "Montreal": ("Canada", "Quebec"),
+    "New York": ("USA", "New York"),
+    "San Francisco": ("USA", "California"),
+    "Austin": ("USA", "Texas"),
+    "Seattle": ("USA", "Washington"),
+}
+
+# Ubicaciones que NO son un lugar (el job es remoto)
+REMOTE_TOKENS = frozenset({"remote", "remoto", "anywhere", "worldwide", "work from home", "home office"})
+
+
+# ============================================================================
+# ÍNDICES PRECOMPILADOS (token normalizado → entradas)
+# ============================================================================
+
+def normalize_token(text: str) -> str:
+    """'Bogotá, D.C.' → 'bogota, dc' (minúsculas, sin tildes ni puntos)"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.replace(".", "").lower().split())
+
+
+def _build_country_index() -> Dict[str, str]:
+    index = {}
+    for country, aliases in COUNTRY_ALIASES.items():
+        for alias in aliases:
+            index[normalize_token(alias)] = country
+    return index
+
+
+def _build_state_index() -> Dict[str, List[Tuple[str, str]]]:
+    """Abreviatura y nombre completo → [(país, nombre), ...] (puede haber varios)"""
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for country, states in STATES.items():
+        for abbr, name in states.items():
+            for token in (abbr, name):
+                entries = index.setdefault(normalize_token(token), [])
+                if (country, name) not in entries:
+                    entries.append((country, name))
+    return index
+
+
+def _build_city_index() -> Dict[str, Tuple[str, str, Optional[str]]]:
+    return {
+        normalize_token(city): (city, country, state)
+        for city, (country, state) in CITIES.items()
+    }
+
+
+_COUNTRIES = _build_country_index()
+_STATES = _build_state_index()
+_CITIES = _build_city_index()
+
+
+# ============================================================================
+# PARSEO
+# ============================================================================
+
+LocationParts = Tuple[Optional[str], Optional[str], Optional[str]]  # (country, state, city)
+
+
+def _lookup_state(token: str, country: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Estado por token, prefiriendo el país dado"""
+    entries = _STATES.get(token)
+    if not entries:
+        return None
+    if country:
+        for entry in entries:
+            if entry[0] == country:
+                return entry
+        return None
+    return entries[0]
+
+
+def _is_place_in(token: str, country: str) -> bool:
+    """¿El token es un estado o ciudad conocida de ese país?"""
+    if _lookup_state(token, country):
+        return True
+    city = _CITIES.get(token)
+    return city is not None and city[1] == country
+
+
+@lru_cache(maxsize=4096)
+def parse_location_parts(raw: str, country_hint: Optional[str] = None) -> LocationParts:
+    """
+    Parsear string de ubicación a (country, state, city)
+
+    Memoizado: llamar con el string tal cual viene de la API.
+
+    Args:
+        raw: "ANT, CO", "San Francisco, CA, US", "Remote", ...
+        country_hint: País de la búsqueda (desempata abreviaturas ambiguas)
+
+    Returns:
+        Tupla (country, state, city); cada parte None si no se reconoce
+    """
+    # "Remote, US" → ["US"]
+    parts = [p.strip() for p in raw.split(",") if p.strip() and normalize_token(p) not in REMOTE_TOKENS]
+    tokens = [normalize_token(p) for p in parts]
+    if not parts:
+        return None, None, None
+
+    country = state = city = None
+
+    # 1. País: última parte (salvo que sea un estado, ver docstring del módulo)
+    candidate = _COUNTRIES.get(tokens[-1])
+    if candidate:
+        is_country = (
+            len(parts) == 1
+            or len(parts) >= 3
+            or candidate == country_hint
+            or _is_place_in(tokens[-2], candidate)
+            or _lookup_state(tokens[-1], None) is None
+        )
+        if is_country:
+            country = candidate
+            parts, tokens = parts[:-1], tokens[:-1]
+
+    # 2. Estado: la nueva última parte
+    if parts:
+        hit = _lookup_state(tokens[-1], country) or (
+            None if country else _lookup_state(tokens[-1], country_hint)
+        )
+        if hit:
+            country = country or hit[0]
+            state = hit[1]
+            parts, tokens = parts[:-1], tokens[:-1]
+
+    # 3. Ciudad: lo que queda al inicio
+    if parts:
+        known = _CITIES.get(tokens[0])
+        if known and (country is None or known[1] == country):
+            city = known[0]
+            country = country or known[1]
+            state = state or known[2]
+        else:
+            city = parts[0]
+    elif state and normalize_token(state) in _CITIES:
+        # "Lima, PE" / "Bogotá D.C." : la capital se llama igual que el estado
+        city = _CITIES[normalize_token(state)][0]
+
+    return country, state, city
+
+
+def parse_location(raw: Optional[str], country_hint: Optional[str] = None) -> Optional[JobLocation]:
+    """
+    Parsear string de la API a JobLocation (None si vacío o remoto)
+
+    Ejemplo:
+        >>> parse_location("Medellín, ANT, CO")
+        JobLocation(country='Colombia', city='Medellín', state='Antioquia')
+    """
+    fields = location_fields(raw, country_hint)
+    return JobLocation(**fields) if fields else None
+
+
+def location_fields(raw: Optional[str], country_hint: Optional[str] = None) -> Optional[dict]:
+    """Igual que parse_location() pero como dict (para validar en lote con Pydantic)"""
+    if not raw or not isinstance(raw, str):
+        return None
+    country, state, city = parse_location_parts(raw, country_hint)
+    if country is None and state is None and city is None:
+        return None
+    return {"country": country, "state": state, "city": city}
+
+
+def format_location(location: Optional[JobLocation]) -> str:
+    """JobLocation → 'Medellín, Antioquia, Colombia' (para CSV / mensajes)"""
+    if location is None:
+        return ""
+    parts = [location.city, location.state, location.country]
+    # Sin repetir ("Lima, Lima, Peru" → "Lima, Peru")
+    seen = []
+    for part in parts:
+        if part and part not in seen:
+            seen.append(part)
+    return ", ".join(seen)
+
+
+# ============================================================================
+# FILTRADO (antes de gastar llamadas a Gemini)
+# ============================================================================
+
+def normalize_country(country: str) -> Optional[str]:
+    """'co' / 'Colombia' / 'COLOMBIA' → 'Colombia' (None si no se conoce)"""
+    return _COUNTRIES.get(normalize_token(country))
+
+
+def matches_location(
+    location: Optional[JobLocation],
+    country: Optional[str] = None,
+    state: Optional[str] = None,
+    city: Optional[str] = None,
+) -> bool:
+    """
+    ¿La ubicación cumple los filtros dados? (filtros None = no filtrar)
+
+    Los filtros aceptan abreviaturas o nombres ("CO"/"Colombia", "ANT"/"Antioquia").
+    Una ubicación desconocida (None) NO cumple ningún filtro.
+    """
+    if country:
+        wanted = normalize_country(country) or country
+        if location is None or location.country != wanted:
+            return False
+    if state:
+        hit = _lookup_state(normalize_token(state), location.country if location else None)
+        wanted_state = hit[1] if hit else state
+        if location is None or not location.state or normalize_token(location.state) != normalize_token(wanted_state):
+            return False
+    if city:
+        if location is None or not location.city or normalize_token(location.city) != normalize_token(city):
+            return False
+    return True
+
+
+def filter_jobs_by_location(
+    jobs: List[Job],
+    country: Optional[str] = None,
+    state: Optional[str] = None,
+    city: Optional[str] = None,
+    keep_remote: bool = True,
+    keep_unknown: bool = True,
+) -> List[Job]:
+    """
+    Quedarse con los jobs de una ubicación (orden preservado)
+
+    Args:
+        jobs: Jobs con location ya parseada
+        country, state, city: Filtros (abreviatura o nombre)
+        keep_remote: Conservar jobs remotos aunque estén en otro lugar
+        keep_unknown: Conservar jobs sin ubicación (LinkedIn a veces no la trae)
+    """
+    kept = []
+    for job in jobs:
+        if job.location is None and keep_unknown:
+            kept.append(job)
+        elif keep_remote and job.is_remote:
+            kept.append(job)
+        elif matches_location(job.location, country, state, city):
+            kept.append(job)
+    return kept
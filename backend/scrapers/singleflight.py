@@ -0,0 +1,116 @@
+"""
+Single-flight - Coalescer búsquedas idénticas que están en curso
+
+Propósito:
+- Tras un anuncio, muchos usuarios con el mismo perfil hacen /vacantes a la vez
+- La caché (cache.py) no ayuda: todos fallan antes de que llegue la 1ra respuesta
+- Single-flight: el 1er llamador (líder) hace el request, los demás esperan
+  su resultado → 1 scrape por query distinta, no 1 por usuario
+
+Variantes:
+- SingleFlight: sync (threading), para search_jobs()
+- AsyncSingleFlight: async (asyncio), para asearch_jobs()
+
+Ejemplo:
+    >>> flights = AsyncSingleFlight()
+    >>> data = await flights.do(key, lambda: fetch(key))  # fetch corre 1 vez por key
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """Llamada en curso (sync): resultado compartido con los que esperan"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalescer de llamadas sync por key"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Ejecutar fn() una sola vez por key en curso
+
+        Los que llegan mientras el líder trabaja reciben su mismo
+        resultado (o su misma excepción).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"in_flight": len(self._calls), "coalesced": self.coalesced}
+
+
+class AsyncSingleFlight:
+    """Coalescer de corrutinas por key"""
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Ejecutar await fn() una sola vez por key en curso
+
+        El trabajo corre en un Task propio: si el líder se cancela
+        (ej: usuario abandona), los demás siguen recibiendo el resultado.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {"in_flight": len(self._tasks), "coalesced": self.coalesced}
+
+
+# Grupos globales: coalescen entre TODOS los JobSpyClient del proceso
+_sync_flights = SingleFlight()
+_async_flights = AsyncSingleFlight()
+
+
+def get_singleflight() -> SingleFlight:
+    return _sync_flights
+
+
+def get_async_singleflight() -> AsyncSingleFlight:
+    return _async_flights
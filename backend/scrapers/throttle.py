@@ -0,0 +1,191 @@
+"""
+Throttle - Rate limiting adaptativo por plataforma (token bucket + AIMD)
+
+Propósito:
+- Reemplazar el time.sleep(2) fijo entre plataformas
+- Limitar la tasa COMBINADA de todos los usuarios (un bucket por plataforma, por proceso)
+- Carga baja: el burst deja pasar búsquedas sin esperar
+- Carga alta: las búsquedas se espacian según la tasa del bucket
+
+Adaptación (AIMD):
+- Éxito: la tasa sube de a poco (additive increase) hasta max_rate
+- Timeout o 429: la tasa se reduce a la mitad (multiplicative decrease) hasta min_rate
+
+Límites iniciales (de tests/pruebasApi/HALLAZGOS_CONSOLIDADOS.md):
+- Intervalo seguro: 3-4s entre búsquedas → rate inicial 1/3 req/s
+- Máximo 2-3 búsquedas simultáneas → burst 3
+- Docker aguanta 1 req/s máximo → max_rate 1.0
+- Ráfagas causan "Read timed out" (NO 429) → timeouts también reducen la tasa
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ThrottleLimits:
+    """Parámetros de un bucket (tasas en requests/segundo)"""
+
+    rate: float
+    burst: int
+    min_rate: float
+    max_rate: float
+    increase_step: float = 0.02
+    decrease_factor: float = 0.5
+
+
+# Límites por plataforma (ver HALLAZGOS_CONSOLIDADOS.md, secciones 5 y 7)
+DEFAULT_LIMITS = ThrottleLimits(rate=1 / 3, burst=3, min_rate=1 / 30, max_rate=1.0)
+
+PLATFORM_LIMITS: Dict[str, ThrottleLimits] = {
+    "indeed": DEFAULT_LIMITS,
+    "linkedin": DEFAULT_LIMITS,
+    # Glassdoor: poco confiable → arranca más conservador
+    "glassdoor": ThrottleLimits(rate=1 / 5, burst=2, min_rate=1 / 60, max_rate=0.5),
+}
+
+
+class PlatformThrottle:
+    """
+    Token bucket thread-safe con tasa adaptativa (AIMD)
+
+    Cada búsqueda consume 1 token. Si no hay tokens, se "reserva" uno a
+    futuro (tokens negativos) y el llamador espera lo necesario. Así los
+    que llegan primero salen primero, sin bucles de reintento.
+
+    Ejemplo:
+        >>> throttle = PlatformThrottle("indeed", PLATFORM_LIMITS["indeed"])
+        >>> throttle.acquire()          # sync: bloquea lo necesario
+        >>> await throttle.aacquire()   # async: no bloquea el event loop
+        >>> throttle.on_success()       # o throttle.on_failure()
+    """
+
+    def __init__(self, platform: str, limits: ThrottleLimits = DEFAULT_LIMITS):
+        self.platform = platform
+        self.limits = limits
+        self.rate = limits.rate
+        self._tokens = float(limits.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Tomar un token y devolver cuántos segundos hay que esperar por él"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.limits.burst, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Esperar turno (sync)
+
+        Returns:
+            float: Segundos esperados
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"⏳ Throttle {self.platform}: esperando {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """
+        Esperar turno (async)
+
+        Returns:
+            float: Segundos esperados
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"⏳ Throttle {self.platform}: esperando {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Additive increase: subir la tasa un paso"""
+        with self._lock:
+            self.rate = min(self.limits.max_rate, self.rate + self.limits.increase_step)
+
+    def on_failure(self) -> None:
+        """Multiplicative decrease: bajar la tasa (timeout o 429)"""
+        with self._lock:
+            old_rate = self.rate
+            self.rate = max(self.limits.min_rate, self.rate * self.limits.decrease_factor)
+        logger.warning(
+            f"⚠️ Throttle {self.platform}: backoff {old_rate:.3f} → {self.rate:.3f} req/s"
+        )
+
+    def stats(self) -> dict:
+        """Estado actual del bucket (para logs / health)"""
+        with self._lock:
+            return {
+                "platform": self.platform,
+                "rate": round(self.rate, 4),
+                "tokens": round(self._tokens, 2),
+                "burst": self.limits.burst,
+            }
+
+
+class ThrottleRegistry:
+    """Un PlatformThrottle por plataforma (creados bajo demanda)"""
+
+    def __init__(self, limits: Optional[Dict[str, ThrottleLimits]] = None):
+        self._limits = limits if limits is not None else PLATFORM_LIMITS
+        self._throttles: Dict[str, PlatformThrottle] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform: str) -> PlatformThrottle:
+        """Obtener el throttle de una plataforma"""
+        with self._lock:
+            if platform not in self._throttles:
+                limits = self._limits.get(platform, DEFAULT_LIMITS)
+                self._throttles[platform] = PlatformThrottle(platform, limits)
+            return self._throttles[platform]
+
+    def stats(self) -> Dict[str, dict]:
+        """Estado de todos los throttles creados"""
+        with self._lock:
+            throttles = list(self._throttles.values())
+        return {t.platform: t.stats() for t in throttles}
+
+
+def is_backoff_error(error: BaseException) -> bool:
+    """
+    ¿El error indica sobrecarga upstream? (timeout o HTTP 429)
+
+    Otros errores (400 por parámetros, 500, conexión rechazada) NO reducen la tasa.
+    """
+    if isinstance(error, (requests.Timeout, asyncio.TimeoutError, aiohttp.ServerTimeoutError)):
+        return True
+
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code == 429
+
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429
+
+    return False
+
+
+# Registry global: todos los JobSpyClient del proceso comparten los buckets
+_registry = ThrottleRegistry()
+
+
+def get_throttle_registry() -> ThrottleRegistry:
+    """Obtener el registry global de throttles"""
+    return _registry
@@ -0,0 +1,155 @@
+"""
+Wire - Compresión y codificación de respuestas de jobspy-api
+
+Propósito:
+- Las listas de jobs (con descripciones) son texto grande y repetitivo:
+  comprimido ocupan ~5-10x menos en la red (bot y API en hosts distintos)
+- El transporte anuncia lo que sabe decodificar y decodifica él mismo
+  (no depende de qué soporte trae cada versión de aiohttp/urllib3)
+
+Codificaciones (según lo instalado):
+- Content-Encoding: zstd (paquete zstandard), br (paquete brotli), gzip (siempre)
+- Content-Type: application/json (siempre), application/msgpack (paquete msgpack, opt-in)
+
+Métricas (WireStats): bytes en la red vs bytes decodificados y tiempo de
+decodificación → el trade-off ancho de banda / CPU de cada despliegue.
+Para comparar codecs offline: scripts/bench_compression.py
+"""
+
+import json
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depende del entorno
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depende del entorno
+    msgpack = None
+
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+JSON_CONTENT_TYPE = "application/json"
+
+
+def available_encodings() -> List[str]:
+    """Content-Encodings decodificables, en orden de preferencia"""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def negotiation_headers(compression: bool = True, binary: bool = False) -> Dict[str, str]:
+    """
+    Headers Accept / Accept-Encoding para pedir a la API
+
+    Args:
+        compression: Anunciar zstd/br/gzip (False = identity)
+        binary: Preferir msgpack (si está instalado), con JSON como respaldo
+    """
+    headers = {
+        "Accept-Encoding": ", ".join(available_encodings()) if compression else "identity",
+        "Accept": JSON_CONTENT_TYPE,
+    }
+    if binary and msgpack_available():
+        headers["Accept"] = f"{MSGPACK_CONTENT_TYPE}, {JSON_CONTENT_TYPE};q=0.9"
+    return headers
+
+
+def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """
+    Deshacer Content-Encoding
+
+    Raises:
+        ValueError: Si la codificación no es soportada
+    """
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding in ("", "identity"):
+        return body
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    if encoding == "zstd" and zstandard is not None:
+        # max_output_size: frames sin tamaño en el header (compresión por streaming)
+        return zstandard.ZstdDecompressor().decompress(body, max_output_size=1 << 30)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    raise ValueError(f"Content-Encoding no soportado: {encoding}")
+
+
+def decode_payload(body: bytes, content_type: Optional[str]) -> Any:
+    """Parsear el cuerpo (ya descomprimido) según Content-Type"""
+    if content_type and content_type.split(";")[0].strip().lower() == MSGPACK_CONTENT_TYPE:
+        if msgpack is None:
+            raise ValueError("Respuesta msgpack pero el paquete msgpack no está instalado")
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body)
+
+
+def decode_response(
+    raw: bytes, content_encoding: Optional[str], content_type: Optional[str]
+) -> Tuple[Any, int, float]:
+    """
+    Descomprimir + parsear
+
+    Returns:
+        Tuple[Any, int, float]: (datos, bytes descomprimidos, segundos de CPU)
+    """
+    start = time.perf_counter()
+    body = decompress(raw, content_encoding)
+    data = decode_payload(body, content_type)
+    return data, len(body), time.perf_counter() - start
+
+
+class WireStats:
+    """Contadores de tráfico por Content-Encoding (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_encoding: Dict[str, Dict[str, float]] = {}
+
+    def record(self, encoding: Optional[str], wire_bytes: int, body_bytes: int, decode_seconds: float) -> None:
+        key = (encoding or "identity").lower()
+        with self._lock:
+            entry = self._by_encoding.setdefault(
+                key, {"responses": 0, "wire_bytes": 0, "body_bytes": 0, "decode_seconds": 0.0}
+            )
+            entry["responses"] += 1
+            entry["wire_bytes"] += wire_bytes
+            entry["body_bytes"] += body_bytes
+            entry["decode_seconds"] += decode_seconds
+
+    def stats(self) -> dict:
+        with self._lock:
+            by_encoding = {k: dict(v) for k, v in self._by_encoding.items()}
+
+        wire = sum(e["wire_bytes"] for e in by_encoding.values())
+        body = sum(e["body_bytes"] for e in by_encoding.values())
+        for entry in by_encoding.values():
+            entry["decode_seconds"] = round(entry["decode_seconds"], 4)
+        return {
+            "responses": sum(int(e["responses"]) for e in by_encoding.values()),
+            "wire_bytes": wire,
+            "body_bytes": body,
+            "ratio": round(body / wire, 2) if wire else 0.0,
+            "by_encoding": by_encoding,
+        }
@@ -17,6 +17,15 @@ if not TELEGRAM_BOT_TOKEN:
 # JobSpy API
 JOBSPY_API_URL = os.getenv("JOBSPY_API_URL", "http://localhost:8000")
 JOBSPY_API_KEY = os.getenv("JOBSPY_API_KEY", "test-key-12345")
+JOBSPY_POOL_SIZE = int(os.getenv("JOBSPY_POOL_SIZE", "20"))
+JOBSPY_KEEPALIVE_TIMEOUT = float(os.getenv("JOBSPY_KEEPALIVE_TIMEOUT", "30"))
+JOBSPY_CACHE_TTL = float(os.getenv("JOBSPY_CACHE_TTL", "900"))  # segundos (0 = desactivada)
+JOBSPY_CACHE_SIZE = int(os.getenv("JOBSPY_CACHE_SIZE", "512"))
+JOBSPY_CACHE_PATH = os.getenv("JOBSPY_CACHE_PATH", "")  # SQLite opcional (vacío = solo memoria)
+JOBSPY_SEARCH_DEADLINE = float(os.getenv("JOBSPY_SEARCH_DEADLINE", "20"))  # segundos por /vacantes
+JOBSPY_HEDGE = os.getenv("JOBSPY_HEDGE", "True").lower() == "true"
+JOBSPY_COMPRESSION = os.getenv("JOBSPY_COMPRESSION", "True").lower() == "true"  # zstd/br/gzip
+JOBSPY_MSGPACK = os.getenv("JOBSPY_MSGPACK", "False").lower() == "true"  # requiere paquete msgpack
 
 # Google Sheets
 GOOGLE_SHEETS_CREDENTIALS = os.getenv("GOOGLE_SHEETS_CREDENTIALS", "./credentials.json")
@@ -24,6 +33,18 @@ GOOGLE_SHEETS_ID = os.getenv("GOOGLE_SHEETS_ID", "")
 
 # Gemini API
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+GEMINI_POOL_SIZE = int(os.getenv("GEMINI_POOL_SIZE", "2"))  # JobMatchers compartidos
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "5"))  # llamadas simultáneas (free tier: 5 RPM)
+GEMINI_DESCRIPTION_TOKENS = int(os.getenv("GEMINI_DESCRIPTION_TOKENS", "75"))  # tokens de descripción por job
+GEMINI_BACKEND = os.getenv("GEMINI_BACKEND", "live")  # live, record (graba el cassette) o replay (offline)
+GEMINI_CASSETTE = os.getenv("GEMINI_CASSETTE", "gemini.cassette.jsonl")
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "5"))  # cuota global del proceso (free tier)
+GEMINI_RPD = int(os.getenv("GEMINI_RPD", "20"))
+GEMINI_TPM = int(os.getenv("GEMINI_TPM", "250000"))
+GEMINI_TPD = int(os.getenv("GEMINI_TPD", "0"))  # 0 = sin límite diario de tokens
+GEMINI_MAX_WAIT = float(os.getenv("GEMINI_MAX_WAIT", "8"))  # segundos en cola antes del score local
+MATCH_CACHE_TTL = float(os.getenv("MATCH_CACHE_TTL", "86400"))  # segundos (0 = desactivada)
+MATCH_CACHE_PATH = os.getenv("MATCH_CACHE_PATH", "match_cache.sqlite3")  # ":memory:" = no persistente
 
 # Notificaciones
 NOTIFICATION_TIMEZONE = os.getenv("NOTIFICATION_TIMEZONE", "America/Bogota")
@@ -11,22 +11,27 @@ Propósito:
 
 Flujo:
 1. get_user_profile(telegram_id) → obtiene keywords, país
-2. JobSpyClient.search_jobs(keywords, country) → 25+ empleos
-3. JobMatcher.match_jobs_batch(jobs[:5], keywords) → personaliza solo TOP 5 (respeta límite Gemini)
-4. Ordena por match_score DESC
-5. Genera CSV con TODOS los empleos (para descargar si quiere más)
-6. Envía TOP 5 con resultado.telegram_message
+2. JobSpyClient.asearch_jobs(keywords, country) → 25+ empleos (plataformas en paralelo)
+3. JobMatcher.astream_jobs_batch(top5, keywords) → personaliza solo TOP 5 en 1 llamada batch (respeta límite Gemini)
+   (antes: filtra por país con la ubicación parseada, ver backend/scrapers/location.py,
+   y elige el TOP 5 con BM25 local, ver backend/agents/prerank.py)
+4. Envía cada job del TOP 5 apenas Gemini termina de puntuarlo (stream de tokens),
+   armado con el template local (backend/agents/message_renderer.py)
+5. Ordena por match_score DESC y edita las tarjetas con su #N y el link para aplicar
+6. Genera CSV con TODOS los empleos (para descargar si quiere más)
 7. Envía CSV por Telegram (archivo descargable)
 
-Tiempo estimado: 6-12 segundos (búsqueda + personalización TOP 5)
+Tiempo estimado: 6-12 segundos (búsqueda + personalización TOP 5);
+la primera tarjeta llega antes de que Gemini termine con las 5
 
 Nota sobre Gemini API:
 - Free tier: 20 requests/día, 5 requests/minuto
-- Solución: Procesar solo TOP 5 jobs con Gemini, resto en CSV
+- Solución: Procesar solo TOP 5 jobs con Gemini (1 request por /vacantes), resto en CSV
 """
 
 import logging
 import csv
+from contextlib import aclosing
 from io import StringIO, BytesIO
 from typing import Optional, List
 
@@ -35,9 +40,18 @@ from telegram.ext import ContextTypes, ConversationHandler
 
 from database.queries import get_user_profile, can_make_query, add_query_log
 from database.db import get_connection, close_connection
-from bot.config import TELEGRAM_BOT_TOKEN, JOBSPY_API_URL
+from bot.config import (
+    TELEGRAM_BOT_TOKEN,
+    JOBSPY_API_URL,
+    JOBSPY_SEARCH_DEADLINE,
+    JOBSPY_HEDGE,
+)
 from backend.scrapers.jobspy_client import JobSpyClient
-from backend.agents.job_matcher import JobMatcher
+from backend.scrapers.location import filter_jobs_by_location, format_location
+from backend.agents.llm_scheduler import ADMIN, USER
+from backend.agents.matcher_pool import get_matcher_pool
+from backend.agents.message_renderer import escape_markdown, render_job_message
+from backend.agents.prerank import rank_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +90,7 @@ def generate_jobs_csv(jobs: List) -> BytesIO:
         writer.writerow([
             job.title or "",
             job.company or "",
-            job.location or "",
+            format_location(job.location),
             job.job_type or "",
             "Sí" if job.is_remote else "No",
             job.job_url or "",
@@ -101,8 +115,8 @@ async def cmd_vacantes(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     2. Verificar que usuario configuró /perfil
     3. Mostrar "Buscando empleos... espera un momento"
     4. Buscar empleos (JobSpyClient)
-    5. Personalizar TOP 5 (JobMatcher)
-    6. Enviar TOP 5 a Telegram
+    5. Personalizar TOP 5 (JobMatcher), enviando cada uno apenas está listo
+    6. Ordenar el TOP 5 (editar las tarjetas con su ranking)
     7. Generar y enviar CSV con todos
     8. 📊 Registrar consulta en query_logs
     """
@@ -156,11 +170,12 @@ async def cmd_vacantes(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         import asyncio
 
         # Mensaje inicial
-        searching_msg = await message_obj.reply_text(
+        searching_text = (
             f"🔍 *{user_name}*, buscamos en todas las plataformas por ti\n"
             f"para encontrar el match ideal para tu perfil...\n\n"
             f"⏳ Un momento, por favor..."
         )
+        searching_msg = await message_obj.reply_text(searching_text)
 
         # FLAG INTELIGENTE: Indica si ya se mandaron los resultados finales
         results_sent = False
@@ -211,11 +226,38 @@ async def cmd_vacantes(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         search_term = " ".join(user.keywords)
         client = JobSpyClient(api_url=JOBSPY_API_URL)
 
-        jobs = client.search_jobs(
+        # Progreso: editar el mensaje apenas termina cada plataforma
+        # (LinkedIn suele llegar en <1s, Indeed en 1-2s, un timeout hasta 30s)
+        progress_lines = []
+
+        async def show_platform_progress(batch) -> None:
+            if results_sent:
+                return
+            if batch.timed_out:
+                progress_lines.append(f"⏱️ {batch.platform.capitalize()}: no respondió a tiempo")
+            elif batch.error:
+                progress_lines.append(f"⚠️ {batch.platform.capitalize()}: sin respuesta")
+            else:
+                progress_lines.append(
+                    f"✅ {batch.platform.capitalize()}: {len(batch.jobs)} vacantes"
+                )
+            try:
+                await searching_msg.edit_text(
+                    searching_text + "\n\n" + "\n".join(progress_lines)
+                )
+            except Exception as e:
+                logger.warning(f"No se pudo actualizar progreso: {e}")
+
+        # Fan-out async: todas las plataformas a la vez, sin bloquear el event loop
+        jobs = await client.asearch_jobs(
             keywords=search_term,
             country=user.location_preference,
             job_type=None,  # Usuario no filtró por tipo
             platforms=["indeed", "linkedin", "glassdoor"],
+            on_platform_done=show_platform_progress,
+            # Plataforma lenta no retiene la respuesta: al vencer se usa lo que haya
+            deadline=JOBSPY_SEARCH_DEADLINE,
+            hedge=JOBSPY_HEDGE,
         )
 
         if not jobs:
@@ -234,61 +276,74 @@ async def cmd_vacantes(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         # 4️⃣ Personalizar con Gemini (SOLO TOP 5 para respetar límite Gemini)
         logger.info("🤖 Personalizando TOP 5 con Gemini...")
 
-        # Limitar a TOP 5 antes de pasar a Gemini (respeta límite de 20 requests/día free tier)
-        jobs_to_match = jobs[:5]
+        # Descartar jobs de otro país ANTES de gastar llamadas a Gemini
+        # (LinkedIn ignora country_indeed). Remotos y sin ubicación se conservan.
+        candidates = filter_jobs_by_location(jobs, country=user.location_preference) or jobs
+        if len(candidates) < len(jobs):
+            logger.info(f"📍 {len(jobs) - len(candidates)} empleos fuera de {user.location_preference} no van a Gemini")
 
-        matcher = JobMatcher()
-        results = matcher.match_jobs_batch(
+        # Limitar a TOP 5 antes de pasar a Gemini (respeta límite de 20 requests/día free tier)
+        # El TOP 5 es por relevancia léxica (BM25 local), no por orden de plataforma
+        jobs_to_match = rank_jobs(candidates, user.keywords, top_n=5)
+
+        # Matcher compartido (creado en post_init): sin reconstruir cliente ni templates
+        # async: mientras Gemini responde el bot sigue atendiendo a otros usuarios
+        # El admin pasa primero en la cola de cuota; sin cuota → score local
+        # Streaming: cada tarjeta se manda apenas su score está listo (no al final
+        # de los 5); el orden por score llega después, editando las tarjetas.
+        # El pool presta el matcher solo mientras Gemini responde: los envíos a
+        # Telegram y las pausas no lo retienen
+        cards = []  # (JobMatchResult, mensaje enviado)
+        stream = get_matcher_pool().astream_jobs_batch(
             jobs=jobs_to_match,
             user_keywords=user.keywords,
             user_location=user.location_preference,
+            priority=ADMIN if admin_chat_id and telegram_id == str(admin_chat_id) else USER,
         )
-
-        # 5️⃣ Ordenar por score DESC
-        results_sorted = sorted(
-            results, key=lambda r: r.match_score, reverse=True
-        )
-        top_results = results_sorted  # Ya son solo 5
-
-        logger.info(
-            f"✅ Top {len(top_results)} empleos personalizados. Enviando a Telegram..."
-        )
-
-        # 6️⃣ Enviar resultados a Telegram
-        if top_results:
-            await message_obj.reply_text(
-                f"🎯 *TOP {len(top_results)} empleos personalizados*\n\n"
-                f"Basado en: {', '.join(user.keywords)}\n"
-                f"País: {user.location_preference}",
-                parse_mode="Markdown",
-            )
-
-            for i, result in enumerate(top_results, 1):
-                # Remover links de ejemplo del mensaje de Gemini (dejar solo el real)
-                import re
-                telegram_msg_clean = re.sub(r'\[.*?\]\(https?://.*?\)', '', result.telegram_message)
-
-                # Agregar SOLO el link real de aplicación
-                job_url = result.job.job_url or "https://www.ejemplo.com"
-                message_with_link = (
-                    f"*#{i}*\n"
-                    f"{telegram_msg_clean}\n\n"
-                    f"🔗 [*Aplicar Ahora →*]({job_url})"
-                )
-
-                # Enviar mensaje personalizado con link real
-                await message_obj.reply_text(
-                    message_with_link,
+        # aclosing: si Telegram falla a mitad, el stream se cierra ya (no al GC)
+        async with aclosing(stream) as results:
+            async for result in results:
+                if not cards:
+                    # ✅ BANDERA: ya llegan resultados, las tareas de progreso salen
+                    results_sent = True
+                    await message_obj.reply_text(
+                        f"🎯 *TOP {len(jobs_to_match)} empleos personalizados*\n\n"
+                        f"Basado en: {escape_markdown(', '.join(user.keywords))}\n"
+                        f"País: {escape_markdown(user.location_preference)}",
+                        parse_mode="Markdown",
+                    )
+
+                # Mensaje armado localmente (Markdown escapado) con el link real del job
+                sent = await message_obj.reply_text(
+                    render_job_message(result.job, result.match_score, result.personalized_message),
                     parse_mode="Markdown",
                     disable_web_page_preview=True,
                 )
+                cards.append((result, sent))
 
                 # Pequeña pausa entre mensajes para no flood
                 await asyncio.sleep(0.5)
 
-            # ✅ BANDERA: Ya se mandó la información final
-            # Las tareas de actualización verán esto y saldrán gracefully
-            results_sent = True
+        # 5️⃣ Ordenar por score DESC
+        cards.sort(key=lambda card: card[0].match_score, reverse=True)
+        top_results = [result for result, _ in cards]  # Ya son solo 5
+
+        logger.info(f"✅ Top {len(top_results)} empleos personalizados enviados a Telegram")
+
+        # 6️⃣ Ranking final: cada tarjeta recibe su #N y el link para aplicar
+        if top_results:
+            for i, (result, sent) in enumerate(cards, 1):
+                try:
+                    await sent.edit_text(
+                        render_job_message(
+                            result.job, result.match_score, result.personalized_message, rank=i
+                        ),
+                        parse_mode="Markdown",
+                        disable_web_page_preview=True,
+                    )
+                except Exception as e:
+                    logger.warning(f"No se pudo actualizar la tarjeta #{i}: {e}")
+                await asyncio.sleep(0.3)
 
             # 7️⃣ Generar y enviar CSV con TODOS los empleos
             logger.info(f"📊 Generando CSV con {len(jobs)} empleos...")
@@ -22,10 +22,37 @@ from telegram.ext import (
 )
 from telegram import Update
 
-from bot.config import TELEGRAM_BOT_TOKEN
+from bot.config import (
+    TELEGRAM_BOT_TOKEN,
+    JOBSPY_POOL_SIZE,
+    JOBSPY_KEEPALIVE_TIMEOUT,
+    JOBSPY_CACHE_TTL,
+    JOBSPY_CACHE_SIZE,
+    JOBSPY_CACHE_PATH,
+    JOBSPY_COMPRESSION,
+    JOBSPY_MSGPACK,
+    MATCH_CACHE_TTL,
+    MATCH_CACHE_PATH,
+    GEMINI_POOL_SIZE,
+    GEMINI_MAX_CONCURRENCY,
+    GEMINI_DESCRIPTION_TOKENS,
+    GEMINI_BACKEND,
+    GEMINI_CASSETTE,
+    GEMINI_RPM,
+    GEMINI_RPD,
+    GEMINI_TPM,
+    GEMINI_TPD,
+    GEMINI_MAX_WAIT,
+)
 from bot.handlers.commands import cmd_start, cmd_help
 from bot.handlers.profile import get_profile_handler
 from bot.handlers.jobs import cmd_vacantes
+from backend.agents.llm_scheduler import init_llm_scheduler
+from backend.agents.match_cache import init_match_cache
+from backend.agents.matcher_pool import init_matcher_pool, close_matcher_pool
+from backend.agents.token_ledger import get_token_ledger
+from backend.scrapers.cache import init_search_cache
+from backend.scrapers.http_pool import init_transport, close_transport
 from database.db import init_db
 
 # Configurar logging
@@ -57,6 +84,76 @@ async def handle_vacantes_button(update: Update, context) -> int:
     return await cmd_vacantes(update, context)
 
 
+async def on_startup(application: Application) -> None:
+    """
+    post_init: crear recursos compartidos que viven lo mismo que la Application
+
+    - Pool HTTP keep-alive hacia jobspy-api (compartido por todos los JobSpyClient)
+    - Caché de búsquedas (memoria + SQLite opcional para sobrevivir reinicios)
+    - Caché de scores de Gemini (SQLite, compartida por todos los JobMatcher)
+    - Cuota global de Gemini (RPM / RPD / tokens, con prioridad para el admin)
+    - Pool de JobMatchers pre-calentados (cliente Gemini + templates, una sola vez)
+    """
+    application.bot_data["http_transport"] = init_transport(
+        pool_size=JOBSPY_POOL_SIZE,
+        keepalive_timeout=JOBSPY_KEEPALIVE_TIMEOUT,
+        compression=JOBSPY_COMPRESSION,
+        binary=JOBSPY_MSGPACK,
+    )
+    application.bot_data["search_cache"] = init_search_cache(
+        ttl_seconds=JOBSPY_CACHE_TTL,
+        max_entries=JOBSPY_CACHE_SIZE,
+        disk_path=JOBSPY_CACHE_PATH or None,
+    )
+    application.bot_data["match_cache"] = init_match_cache(
+        path=MATCH_CACHE_PATH or ":memory:",
+        ttl_seconds=MATCH_CACHE_TTL,
+    )
+    application.bot_data["llm_scheduler"] = init_llm_scheduler(
+        rpm=GEMINI_RPM,
+        rpd=GEMINI_RPD,
+        tpm=GEMINI_TPM,
+        tpd=GEMINI_TPD,
+        max_wait=GEMINI_MAX_WAIT,
+    )
+    # Después de la caché y el scheduler: los matchers toman los globales
+    application.bot_data["matcher_pool"] = init_matcher_pool(
+        size=GEMINI_POOL_SIZE,
+        max_concurrency=GEMINI_MAX_CONCURRENCY,
+        description_tokens=GEMINI_DESCRIPTION_TOKENS,
+        backend=GEMINI_BACKEND,
+        cassette=GEMINI_CASSETTE,
+    )
+
+
+async def on_shutdown(application: Application) -> None:
+    """post_shutdown: liberar recursos compartidos"""
+    transport = application.bot_data.pop("http_transport", None)
+    if transport is not None:
+        logger.info(f"📊 Tráfico jobspy-api: {transport.stats()}")
+    await close_transport()
+
+    search_cache = application.bot_data.pop("search_cache", None)
+    if search_cache is not None:
+        logger.info(f"📊 Caché de búsquedas: {search_cache.stats()}")
+        search_cache.close()
+
+    matcher_pool = application.bot_data.pop("matcher_pool", None)
+    if matcher_pool is not None:
+        logger.info(f"📊 Pool de JobMatchers: {matcher_pool.stats()}")
+    await close_matcher_pool()
+
+    llm_scheduler = application.bot_data.pop("llm_scheduler", None)
+    if llm_scheduler is not None:
+        logger.info(f"📊 Cuota de Gemini: {llm_scheduler.stats()}")
+    logger.info(f"📊 Tokens de Gemini: {get_token_ledger().report()}")
+
+    match_cache = application.bot_data.pop("match_cache", None)
+    if match_cache is not None:
+        logger.info(f"📊 Caché de scores Gemini: {match_cache.stats()}")
+        match_cache.close()
+
+
 def setup_application() -> Application:
     """
     Configura y retorna la Application del bot
@@ -79,7 +176,14 @@ def setup_application() -> Application:
         raise
 
     # Paso 1: Crear Application
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # post_init/post_shutdown: ciclo de vida de recursos compartidos (pool HTTP)
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
 
     # Paso 2: Registrar CommandHandlers
     application.add_handler(CommandHandler("start", cmd_start))
@@ -63,11 +63,19 @@ class User(BaseModel):
 
 
 class JobLocation(BaseModel):
-    """Ubicación del trabajo"""
+    """
+    Ubicación del trabajo
+
+    Inmutable: el parseo por lotes de jobspy_client comparte una instancia
+    entre todos los jobs con el mismo string de ubicación
+    """
     country: Optional[str] = None
     city: Optional[str] = None
     state: Optional[str] = None
 
+    class Config:
+        frozen = True
+
 
 class SalaryRange(BaseModel):
     """Rango salarial"""
@@ -81,6 +81,14 @@ class Settings:
             "CACHE_EXPIRY", "3600", int
         )
         
+        # Response compression (zstd/brotli when installed, gzip always)
+        self.ENABLE_COMPRESSION, self.ENABLE_COMPRESSION_SOURCE = self._get_setting_with_source(
+            "ENABLE_COMPRESSION", "true", self._parse_bool
+        )
+        self.COMPRESSION_MINIMUM_SIZE, self.COMPRESSION_MINIMUM_SIZE_SOURCE = self._get_setting_with_source(
+            "COMPRESSION_MINIMUM_SIZE", "1024", int
+        )
+        
         # Logging
         self.LOG_LEVEL, self.LOG_LEVEL_SOURCE = self._get_setting_with_source(
             "LOG_LEVEL", "INFO"
@@ -18,6 +18,7 @@ from app.cache import cache
 from app.config import settings
 from app.core import config_bridge
 from app.core.logging_config import get_logger, setup_logging
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.rate_limiter import RateLimitMiddleware
 from app.middleware.request_logger import RequestLoggerMiddleware, log_request_middleware
 from app.routes import api, health
@@ -144,6 +145,9 @@ app.add_middleware(RateLimitMiddleware)
 # Add request logging middleware
 app.add_middleware(RequestLoggerMiddleware)
 
+# Add response compression middleware (outermost: compresses every response body)
+app.add_middleware(CompressionMiddleware)
+
 # Add exception handlers
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
@@ -0,0 +1,149 @@
+"""Response compression middleware (zstd, brotli and gzip) for the JobSpy Docker API.
+
+Job search responses are large, repetitive JSON (full descriptions), so they
+compress very well. The codec is negotiated from the client's Accept-Encoding:
+zstd and brotli are used when their packages are installed, gzip is always
+available. Responses smaller than COMPRESSION_MINIMUM_SIZE are sent as-is.
+"""
+import gzip
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from app.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Fast levels: the API is latency-bound, not bandwidth-bound, on the server side
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+BROTLI_QUALITY = 4
+
+# Already compressed or streamed content is passed through untouched
+SKIP_CONTENT_TYPES = ("image/", "video/", "audio/", "text/event-stream", "application/zip")
+
+
+def available_encodings() -> List[str]:
+    """Encodings this server can produce, in order of preference."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {encoding: q-value}."""
+    accepted = {}
+    for item in header.split(","):
+        parts = item.strip().split(";")
+        name = parts[0].strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def negotiate_encoding(header: Optional[str]) -> Optional[str]:
+    """
+    Pick the best encoding both sides support.
+
+    Highest client q-value wins; ties go to the server preference order.
+    Returns None when the response should not be compressed.
+    """
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+
+    best: Optional[Tuple[float, int, str]] = None
+    for rank, encoding in enumerate(available_encodings()):
+        q = accepted.get(encoding, wildcard)
+        if q <= 0:
+            continue
+        candidate = (q, -rank, encoding)
+        if best is None or candidate > best:
+            best = candidate
+    return best[2] if best else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a response body with the negotiated encoding."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, minimum_size: Optional[int] = None):
+        super().__init__(app)
+        self.enabled = settings.ENABLE_COMPRESSION
+        self.minimum_size = (
+            minimum_size if minimum_size is not None else settings.COMPRESSION_MINIMUM_SIZE
+        )
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if not self.enabled:
+            return response
+
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        content_type = response.headers.get("content-type", "")
+        if (
+            encoding is None
+            or "content-encoding" in response.headers
+            or content_type.startswith(SKIP_CONTENT_TYPES)
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        content_encoding = None
+        if len(body) >= self.minimum_size:
+            compressed = compress(body, encoding)
+            if len(compressed) < len(body):
+                logger.debug(
+                    f"Compressed {request.url.path} with {encoding}: "
+                    f"{len(body)} -> {len(compressed)} bytes"
+                )
+                body, content_encoding = compressed, encoding
+
+        # Rebuild the response keeping the original raw headers (e.g. repeated set-cookie)
+        new_response = Response(
+            content=body, status_code=response.status_code, background=response.background
+        )
+        new_response.raw_headers = [
+            (key, value) for key, value in response.raw_headers if key.lower() != b"content-length"
+        ]
+        headers = new_response.headers
+        headers["content-length"] = str(len(body))
+        # Vary even when not compressing: proxies must not serve a cached
+        # uncompressed copy to a client that asked for zstd (or vice versa)
+        headers.add_vary_header("Accept-Encoding")
+        if content_encoding:
+            headers["content-encoding"] = content_encoding
+        return new_response
@@ -25,6 +25,7 @@ class JobSearchParams(BaseModel):
     country_indeed: Optional[str] = Field(default=None, description="Country filter for Indeed & Glassdoor")
     enforce_annual_salary: Optional[bool] = Field(default=False, description="Convert wages to annual salary")
     ca_cert: Optional[str] = Field(default=None, description="Path to CA Certificate file for proxies")
+    fields: Optional[List[str]] = Field(default=None, description="Only return these job fields (e.g. ['title', 'job_url'])")
 
 class JobResponse(BaseModel):
     count: int
@@ -9,6 +9,7 @@ from app.models import JobSearchParams, JobResponse, PaginatedJobResponse
 from app.config import settings
 from app.middleware.api_key_auth import get_api_key
 from app.services.job_service import JobService
+from app.utils.response_format import format_response
 from app.utils.validation_helpers import VALID_PARAMETERS, get_parameter_suggestion, generate_error_suggestions
 
 router = APIRouter()
@@ -24,6 +25,24 @@ SUPPORTED_COUNTRIES_INDEED = {
     "United Arab Emirates", "UK", "USA", "Uruguay", "Venezuela", "Vietnam"
 }
 
+def parse_fields_param(fields: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Normalize the `fields` projection parameter.
+
+    Accepts repeated values (`fields=title&fields=job_url`), comma-separated
+    values (`fields=title,job_url`) or a mix of both. Returns lowercase names
+    in request order without duplicates, or None when no projection was asked.
+    """
+    if not fields:
+        return None
+    selected = []
+    for value in fields:
+        for name in value.split(","):
+            name = name.strip().lower()
+            if name and name not in selected:
+                selected.append(name)
+    return selected or None
+
 def validate_job_search_params(
     site_name,
     country_indeed,
@@ -168,6 +187,7 @@ async def search_jobs(
     linkedin_company_ids: Optional[List[int]] = Query(None, description="LinkedIn company IDs to filter by"),
     country_indeed: Optional[str] = Query(None, description="Country filter for Indeed & Glassdoor"),
     enforce_annual_salary: bool = Query(None, description="Convert wages to annual salary"),
+    fields: Optional[List[str]] = Query(None, description="Only return these job fields (comma-separated or repeated)"),
 ):
     """
     Search for jobs across multiple platforms with optional pagination.
@@ -262,6 +282,9 @@ async def search_jobs(
         # Execute the search
         jobs_df, is_cached = JobService.search_jobs(params.dict(exclude_none=True))
         
+        # Project onto the requested columns before serializing
+        jobs_df = JobService.select_fields(jobs_df, parse_fields_param(fields))
+        
         # Return results - either paginated or all at once
         if paginate:
             # Calculate pagination
@@ -304,7 +327,7 @@ async def search_jobs(
             end_time = time.time()
             logger.info(f"Request {request_id}: Completed in {end_time - start_time:.2f} seconds. Found {total_items} jobs, returning page {page}/{total_pages}")
             
-            return {
+            return format_response(request, {
                 "count": total_items,
                 "total_pages": total_pages,
                 "current_page": page,
@@ -313,7 +336,7 @@ async def search_jobs(
                 "cached": is_cached,
                 "next_page": next_page,
                 "previous_page": previous_page
-            }
+            })
         else:
             # Return all results without pagination
             jobs_list = jobs_df.to_dict('records') if not jobs_df.empty else []
@@ -321,11 +344,11 @@ async def search_jobs(
             end_time = time.time()
             logger.info(f"Request {request_id}: Completed in {end_time - start_time:.2f} seconds. Found {len(jobs_list)} jobs")
             
-            return {
+            return format_response(request, {
                 "count": len(jobs_list),
                 "jobs": jobs_list,
                 "cached": is_cached
-            }
+            })
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -378,11 +401,17 @@ async def search_jobs_post(
         paginate=getattr(params, "paginate", None),
     )
     
-    logger.info(f"Request {request_id}: Starting job search with parameters: {params.dict(exclude_none=True)}")
+    # `fields` shapes the response only: keep it out of the scrape/cache parameters
+    search_params = params.dict(exclude_none=True, exclude={"fields"})
+    
+    logger.info(f"Request {request_id}: Starting job search with parameters: {search_params}")
     
     try:
         # Execute the search
-        jobs_df, is_cached = JobService.search_jobs(params.dict(exclude_none=True))
+        jobs_df, is_cached = JobService.search_jobs(search_params)
+        
+        # Project onto the requested columns before serializing
+        jobs_df = JobService.select_fields(jobs_df, parse_fields_param(params.fields))
         
         # Return all results without pagination
         jobs_list = jobs_df.to_dict('records') if not jobs_df.empty else []
@@ -390,11 +419,11 @@ async def search_jobs_post(
         end_time = time.time()
         logger.info(f"Request {request_id}: Completed in {end_time - start_time:.2f} seconds. Found {len(jobs_list)} jobs")
         
-        return {
+        return format_response(request, {
             "count": len(jobs_list),
             "jobs": jobs_list,
             "cached": is_cached
-        }
+        })
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -1,5 +1,5 @@
 """Job search service layer."""
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
 import pandas as pd
 from jobspy import scrape_jobs
 import logging
@@ -83,6 +83,22 @@ class JobService:
             
         return filtered_df
     
+    @staticmethod
+    def select_fields(jobs_df: pd.DataFrame, fields: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Project job results onto the requested columns.
+
+        Matching is case-insensitive and unknown fields are ignored (columns
+        vary by provider). Returns a new frame: the cached DataFrame is never
+        mutated, so other requests still see every column.
+        """
+        if not fields:
+            return jobs_df
+
+        columns_by_name = {str(column).lower(): column for column in jobs_df.columns}
+        selected = [columns_by_name[f] for f in fields if f in columns_by_name]
+        return jobs_df.loc[:, selected]
+
     @staticmethod
     def sort_jobs(jobs_df: pd.DataFrame, sort_by: str, sort_order: str = 'desc') -> pd.DataFrame:
         """Sort job results by specified field."""
@@ -0,0 +1,43 @@
+"""Optional binary (msgpack) encoding for job search responses."""
+from typing import Any
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def wants_msgpack(request: Request) -> bool:
+    """True if msgpack is installed and the client listed it in Accept."""
+    if msgpack is None:
+        return False
+    accept = request.headers.get("accept", "")
+    return any(
+        part.split(";")[0].strip().lower() in (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+        for part in accept.split(",")
+    )
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(jsonable_encoder(content), use_bin_type=True)
+
+
+def format_response(request: Request, payload: dict):
+    """
+    Return the payload as msgpack when negotiated, otherwise unchanged.
+
+    Returning the plain dict keeps FastAPI's regular JSON path (and the
+    response_model validation) for every client that did not opt in.
+    """
+    if wants_msgpack(request):
+        return MsgPackResponse(payload)
+    return payload
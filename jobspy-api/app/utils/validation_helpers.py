@@ -31,6 +31,7 @@ PARAMETER_TYPES = {
     "page": "integer",
     "page_size": "integer",
     "paginate": "boolean",
+    "fields": "comma-separated string or list",
 }
 
 # Parameter descriptions for helpful error messages
@@ -53,6 +54,7 @@ PARAMETER_DESCRIPTIONS = {
     "page": "Page number for paginated results",
     "page_size": "Number of results per page",
     "paginate": "Enable pagination",
+    "fields": "Only return these job fields (e.g., title,job_url,location)",
 }
 
 # Parameter limitations and notes
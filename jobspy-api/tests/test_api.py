@@ -37,3 +37,64 @@ def test_search_jobs(mock_scrape_jobs, client):
     assert response.json()["count"] == 2
     assert not response.json()["cached"]
     assert len(response.json()["jobs"]) == 2
+
+@patch('app.services.job_service.scrape_jobs')
+def test_search_jobs_fields_projection(mock_scrape_jobs, client):
+    """Test that `fields` limits the returned job columns on GET and POST."""
+    mock_df = pd.DataFrame({
+        'site': ['indeed'],
+        'title': ['Software Engineer'],
+        'job_url': ['https://indeed.com/viewjob?jk=1'],
+        'description': ['A very long markdown description'],
+    })
+    mock_scrape_jobs.return_value = mock_df
+    
+    with patch('app.config.settings.ENABLE_API_KEY_AUTH', False):
+        get_response = client.get(
+            "/api/v1/search_jobs",
+            params={
+                "site_name": "indeed",
+                "search_term": "fields test",
+                "country_indeed": "USA",
+                "fields": "title,job_url,unknown_field",
+            },
+        )
+        post_response = client.post(
+            "/api/v1/search_jobs",
+            json={
+                "site_name": ["indeed"],
+                "search_term": "fields test",
+                "country_indeed": "USA",
+                "fields": ["title"],
+            },
+        )
+    
+    assert get_response.status_code == 200
+    assert get_response.json()["jobs"] == [
+        {"title": "Software Engineer", "job_url": "https://indeed.com/viewjob?jk=1"}
+    ]
+    assert post_response.status_code == 200
+    assert post_response.json()["jobs"] == [{"title": "Software Engineer"}]
+    # The projection must not leak into the scrape parameters
+    assert "fields" not in mock_scrape_jobs.call_args.kwargs
+
+@patch('app.services.job_service.scrape_jobs')
+def test_search_jobs_compressed_response(mock_scrape_jobs, client):
+    """Test that large responses are gzip-compressed when the client accepts it."""
+    mock_df = pd.DataFrame({
+        'title': [f'Software Engineer {i}' for i in range(50)],
+        'description': ['We are hiring a Python developer. ' * 20] * 50,
+    })
+    mock_scrape_jobs.return_value = mock_df
+    
+    with patch('app.config.settings.ENABLE_API_KEY_AUTH', False):
+        response = client.get(
+            "/api/v1/search_jobs",
+            params={"site_name": "indeed", "search_term": "compression test", "country_indeed": "USA"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+    
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["count"] == 50
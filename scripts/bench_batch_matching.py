@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JobMatcher.match_jobs_batch en modo loop (1 llamada por job) vs batch (1 llamada)
+
+Mide por modo:
+- Llamadas a Gemini (lo que cuenta contra 5 RPM / 20 RPD)
+- Latencia total
+- Tokens de entrada / salida (y cuánto del input es prefijo estático, ver
+  backend/agents/token_ledger.py)
+
+Por defecto usa un LLM simulado (sin API key ni red): latencia = base + ms por
+token de salida, tokens ≈ caracteres / 4. Con --live usa Gemini de verdad
+(necesita GOOGLE_API_KEY y gasta cuota: 2 × N + 1 requests aprox).
+
+Uso:
+    python scripts/bench_batch_matching.py               # 5 jobs simulados
+    python scripts/bench_batch_matching.py -n 10 --base-latency 1.2
+    python scripts/bench_batch_matching.py --live -n 3
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.agents.job_matcher import BatchMatchResponse, JobMatcher  # noqa: E402
+from backend.agents.match_cache import MatchCache  # noqa: E402
+from backend.agents.token_ledger import TokenLedger  # noqa: E402
+from database.models import Job  # noqa: E402
+
+
+def make_jobs(n: int) -> list:
+    descriptions = [
+        "We are a fast-growing fintech. Looking for a Python developer with FastAPI, "
+        "PostgreSQL and AWS experience. Remote-first, contract role, 6 months. ",
+        "Join our enterprise team in New York. Java 17, Spring Boot, Oracle. "
+        "On-site five days a week, full-time with benefits. ",
+    ]
+    return [
+        Job(
+            id=f"in-{i}",
+            title=["Senior Python Developer", "Java Backend Engineer"][i % 2] + f" {i}",
+            company=f"Company {i}",
+            job_url=f"https://indeed.com/viewjob?jk={i:016x}",
+            is_remote=i % 2 == 0,
+            job_type=["contract", "fulltime"][i % 2],
+            description=descriptions[i % 2] * 4,
+            source="indeed",
+        )
+        for i in range(n)
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class SimulatedLLM:
+    """
+    Chat model falso con la interfaz que usa JobMatcher
+    (with_structured_output(schema, method, include_raw) → .invoke(messages))
+    """
+
+    def __init__(self, base_latency: float, per_output_token: float):
+        self.base_latency = base_latency
+        self.per_output_token = per_output_token
+
+    def with_structured_output(self, schema, method=None, include_raw=False):
+        return SimpleNamespace(invoke=lambda messages: self._invoke(schema, messages, include_raw))
+
+    def _invoke(self, schema, messages: list, include_raw: bool):
+        prompt = "\n".join(message.content for message in messages)
+        if schema is BatchMatchResponse:
+            indices = [int(i) for i in re.findall(r"^\[(\d+)\]", prompt, re.MULTILINE)]
+            parsed = BatchMatchResponse(
+                results=[
+                    {"index": i, "match_score": 80 if i % 2 else 20, "reason": "Matches porque: ✅ Python, ✅ Remote"}
+                    for i in indices
+                ]
+            )
+        else:
+            parsed = schema(match_score=80, reason="Matches porque: ✅ Python, ✅ Remote")
+
+        output_tokens = estimate_tokens(json.dumps(parsed.model_dump(mode="json"), ensure_ascii=False))
+        time.sleep(self.base_latency + output_tokens * self.per_output_token)
+        raw = SimpleNamespace(
+            usage_metadata={"input_tokens": estimate_tokens(prompt), "output_tokens": output_tokens}
+        )
+        if include_raw:
+            return {"raw": raw, "parsed": parsed, "parsing_error": None}
+        return parsed
+
+
+def run(matcher: JobMatcher, jobs: list, batched: bool) -> dict:
+    matcher.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+    start = time.perf_counter()
+    results = matcher.match_jobs_batch(jobs, ["python", "remote", "contract"], "USA", batched=batched)
+    elapsed = time.perf_counter() - start
+    return {"results": len(results), "seconds": elapsed, **matcher.usage}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--jobs", type=int, default=5, help="Jobs por búsqueda (default: 5, el TOP de /vacantes)")
+    parser.add_argument("--base-latency", type=float, default=0.8, help="Simulado: segundos fijos por llamada")
+    parser.add_argument("--per-token", type=float, default=0.004, help="Simulado: segundos por token de salida")
+    parser.add_argument("--live", action="store_true", help="Usar Gemini real (GOOGLE_API_KEY)")
+    args = parser.parse_args()
+
+    llm = None if args.live else SimulatedLLM(args.base_latency, args.per_token)
+    # Sin caché: si no, el modo batch reusaría los scores del loop
+    ledger = TokenLedger()
+    matcher = JobMatcher(llm=llm, cache=MatchCache(ttl_seconds=0), ledger=ledger)
+    jobs = make_jobs(args.jobs)
+
+    print(f"JobMatcher: {args.jobs} jobs, LLM {'Gemini (live)' if args.live else 'simulado'}\n")
+    print(f"{'modo':<8} {'llamadas':>9} {'segundos':>9} {'tokens in':>10} {'tokens out':>11} {'results':>8}")
+    rows = {}
+    for label, batched in (("loop", False), ("batch", True)):
+        rows[label] = row = run(matcher, jobs, batched)
+        print(
+            f"{label:<8} {row['calls']:>9} {row['seconds']:>9.2f} "
+            f"{row['input_tokens']:>10} {row['output_tokens']:>11} {row['results']:>8}"
+        )
+
+    loop, batch = rows["loop"], rows["batch"]
+    if batch["seconds"] and batch["input_tokens"] + batch["output_tokens"]:
+        print(
+            f"\nbatch vs loop: {loop['seconds'] / batch['seconds']:.1f}x más rápido, "
+            f"{(loop['input_tokens'] + loop['output_tokens']) / (batch['input_tokens'] + batch['output_tokens']):.1f}x "
+            f"menos tokens, {loop['calls'] - batch['calls']} llamadas menos"
+        )
+
+    per_call = ledger.report()["per_call"]
+    print(
+        f"por llamada: prefijo estático {per_call['avg_prefix_tokens']:.0f} + delta "
+        f"{per_call['avg_delta_tokens']:.0f} tokens ({per_call['prefix_share']:.0%} del input reutilizable, "
+        f"{per_call['cached_share']:.0%} servido desde caché)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compresión y codificación de respuestas jobspy-api
+
+Para cada combinación (json/msgpack × identity/gzip/zstd/br, según lo instalado):
+- Tamaño en la red
+- CPU para comprimir (servidor) y para descomprimir + parsear (bot)
+- Tiempo total estimado = CPU + transferencia al ancho de banda dado
+
+Uso:
+    python scripts/bench_compression.py                # 25 jobs, 10 Mbps
+    python scripts/bench_compression.py -n 100 --mbps 2
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.scrapers import wire  # noqa: E402
+
+DESCRIPTION = (
+    "**About the role**\n\nWe are looking for a Senior Python Developer to join our "
+    "remote team. You will design, build and maintain backend services using Django, "
+    "FastAPI and PostgreSQL.\n\n**Requirements**\n\n* 5+ years with Python\n"
+    "* Experience with AWS, Docker and CI/CD\n* English B2 or higher\n\n"
+)
+
+
+def make_payload(n: int) -> dict:
+    """Respuesta con la forma real de la API ({count, jobs, cached})"""
+    jobs = [
+        {
+            "id": f"in-{i:08x}",
+            "title": f"Senior Python Developer {i}",
+            "company": f"Company {i % 40}",
+            "company_url": f"https://indeed.com/cmp/company-{i % 40}",
+            "job_url": f"https://indeed.com/viewjob?jk={i:016x}",
+            "location": "Medellín, ANT, CO",
+            "is_remote": i % 3 == 0,
+            "description": DESCRIPTION * (2 + i % 4) + f"Ref {i}",
+            "job_type": "fulltime",
+            "date_posted": "2026-02-15",
+        }
+        for i in range(n)
+    ]
+    return {"count": n, "jobs": jobs, "cached": False}
+
+
+def encoders():
+    yield "json", "application/json", lambda p: json.dumps(p).encode()
+    if wire.msgpack is not None:
+        yield "msgpack", wire.MSGPACK_CONTENT_TYPE, lambda p: wire.msgpack.packb(p, use_bin_type=True)
+
+
+def compressors():
+    yield "identity", lambda b: b
+    yield "gzip", lambda b: gzip.compress(b, compresslevel=6)
+    if wire.zstandard is not None:
+        yield "zstd", lambda b: wire.zstandard.ZstdCompressor(level=3).compress(b)
+    if wire.brotli is not None:
+        yield "br", lambda b: wire.brotli.compress(b, quality=4)
+
+
+def timed(fn, rounds):
+    times = []
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-n", "--jobs", type=int, default=25, help="Jobs por respuesta")
+    parser.add_argument("--mbps", type=float, default=10.0, help="Ancho de banda bot↔API")
+    parser.add_argument("-r", "--rounds", type=int, default=20, help="Rondas por medición")
+    args = parser.parse_args()
+
+    payload = make_payload(args.jobs)
+    bytes_per_second = args.mbps * 1_000_000 / 8
+
+    print(f"📊 {args.jobs} jobs por respuesta, {args.mbps:g} Mbps (mediana de {args.rounds} rondas)")
+    print(f"   {'formato':<18} {'bytes':>9} {'comprimir':>10} {'decodificar':>12} {'total est.':>11}")
+
+    for fmt, content_type, encode in encoders():
+        body = encode(payload)
+        for name, compress in compressors():
+            raw, compress_s = timed(lambda: compress(body), args.rounds)
+            encoding = None if name == "identity" else name
+            _, decode_s = timed(
+                lambda: wire.decode_response(raw, encoding, content_type), args.rounds
+            )
+            total = compress_s + decode_s + len(raw) / bytes_per_second
+            print(
+                f"   {fmt + '+' + name:<18} {len(raw):>9,} {compress_s * 1000:>8.2f}ms "
+                f"{decode_s * 1000:>10.2f}ms {total * 1000:>9.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
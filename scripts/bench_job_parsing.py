@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parseo de respuestas de jobspy-api a Job models
+
+Compara:
+- Por registro: JobSpyClient._parse_job() (un Job(...) por job)
+- Bulk: JobSpyClient._parse_jobs_bulk() (TypeAdapter(List[Job]), una validación por
+  lote, ubicaciones parseadas una vez por string y pasadas como JobLocation)
+- model_construct: referencia SIN validación, con TODOS los campos (sin defaults).
+  Con pydantic 2.x es MÁS lento que validar en pydantic-core, por eso el bulk no lo usa
+
+Uso:
+    python scripts/bench_job_parsing.py            # 10k jobs, 5 rondas
+    python scripts/bench_job_parsing.py -n 50000 -r 3
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.scrapers.jobspy_client import JobSpyClient  # noqa: E402
+from backend.scrapers.location import parse_location  # noqa: E402
+from database.models import Job  # noqa: E402
+
+
+def make_payload(n: int) -> list:
+    """Registros con la forma real de la API (ver HALLAZGOS_CONSOLIDADOS.md)"""
+    return [
+        {
+            "id": f"in-{i:08x}",
+            "site": "indeed",
+            "title": f"Senior Python Developer {i}",
+            "company": f"Company {i % 300}",
+            "company_url": f"https://indeed.com/cmp/company-{i % 300}",
+            "job_url": f"https://indeed.com/viewjob?jk={i:016x}",
+            "location": "ANT, CO",
+            "is_remote": i % 3 == 0,
+            "description": "We are looking for a Python developer. " * 20,
+            "job_type": "fulltime" if i % 2 else "contract",
+            "job_function": None,
+            "job_level": None,
+            "company_industry": "Software",
+            "date_posted": "2026-02-15",
+        }
+        for i in range(n)
+    ]
+
+
+def bench(fn, rounds: int) -> list:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-n", "--jobs", type=int, default=10_000, help="Jobs por payload")
+    parser.add_argument("-r", "--rounds", type=int, default=5, help="Rondas por método")
+    args = parser.parse_args()
+
+    payload = make_payload(args.jobs)
+    client = JobSpyClient()
+
+    validated = bench(lambda: [client._parse_job(d, "indeed") for d in payload], args.rounds)
+    bulk = bench(lambda: client._parse_jobs_bulk(payload, "indeed"), args.rounds)
+
+    def construct(d: dict) -> Job:
+        fields = client._map_job_fields(d, "indeed")
+        fields.update(location=parse_location(d["location"]), salary=None, emails=None, sent_to=[])
+        return Job.model_construct(**fields)
+
+    constructed = bench(lambda: [construct(d) for d in payload], args.rounds)
+
+    # Sanity check: mismo contenido
+    a = [client._parse_job(d, "indeed") for d in payload[:100]]
+    b = client._parse_jobs_bulk(payload[:100], "indeed")
+    assert [j.model_dump() for j in a] == [j.model_dump() for j in b]
+
+    v = statistics.median(validated)
+    print(f"📊 Parseo de {args.jobs:,} jobs (mediana de {args.rounds} rondas)")
+    for name, times in (
+        ("Por registro (_parse_job)", validated),
+        ("Bulk (_parse_jobs_bulk)", bulk),
+        ("model_construct (sin validar)", constructed),
+    ):
+        t = statistics.median(times)
+        print(f"   {name:<30} {t * 1000:8.1f} ms  ({t / args.jobs * 1e6:5.1f} µs/job)  {v / t:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
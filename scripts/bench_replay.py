@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Benchmark: throughput y latencia de /vacantes (MatcherPool + JobMatcher) sin red
+
+Corre N búsquedas concurrentes (como N usuarios haciendo /vacantes) contra
+un MatcherPool cuyos matchers usan ReplayLLM (backend/agents/llm_replay.py):
+respuestas grabadas de Gemini con latencia y errores configurables.
+
+Mide:
+- Throughput: búsquedas/s y jobs puntuados/s
+- Latencia por búsqueda: p50 / p95 / p99 / máx
+- Con --stream (astream_jobs_batch, como /vacantes): latencia hasta el
+  primer resultado, la que percibe el usuario
+- Llamadas al modelo, resultados con error, con score local (sin cuota) y
+  hits de MatchCache / del cassette
+
+Cassette:
+- --record: corre la misma carga contra Gemini real y graba el cassette
+  (necesita GOOGLE_API_KEY y gasta cuota: usar pocas búsquedas)
+- Sin cassette (o prompts no grabados): respuestas sintetizadas con la
+  latencia mediana del cassette (1s si está vacío)
+
+Uso:
+    python scripts/bench_replay.py                                  # 50 búsquedas, sintético
+    python scripts/bench_replay.py --record --searches 4 --cassette vacantes.cassette.jsonl
+    python scripts/bench_replay.py --cassette vacantes.cassette.jsonl --concurrency 20
+    python scripts/bench_replay.py --error-rate 0.2 --no-batch --latency-scale 0.5
+    python scripts/bench_replay.py --stream                          # 1er resultado vs búsqueda completa
+    python scripts/bench_replay.py --cache --rpm 5 --rpd 20          # con caché y cuota real
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from contextlib import aclosing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.agents.job_matcher import JobMatcher, create_chat_model  # noqa: E402
+from backend.agents.llm_replay import ReplayLLM  # noqa: E402
+from backend.agents.llm_scheduler import LLMScheduler  # noqa: E402
+from backend.agents.match_cache import MatchCache  # noqa: E402
+from backend.agents.matcher_pool import MatcherPool  # noqa: E402
+from backend.agents.token_ledger import TokenLedger  # noqa: E402
+from database.models import Job  # noqa: E402
+
+PROFILES = [
+    (["python", "remote", "contract"], "USA"),
+    (["java", "spring"], "USA"),
+    (["react", "frontend", "typescript"], "Colombia"),
+    (["data", "sql", "python"], "Mexico"),
+]
+
+ROLES = [
+    ("Senior Python Developer", "Python, FastAPI and PostgreSQL. Remote-first, contract role."),
+    ("Java Backend Engineer", "Java 17, Spring Boot and Oracle. On-site, full-time."),
+    ("Frontend Developer", "React, TypeScript and CSS. Hybrid team, full-time."),
+    ("Data Analyst", "SQL, Python and dashboards. Remote within LATAM."),
+    ("DevOps Engineer", "AWS, Terraform and Kubernetes. On-call rotation."),
+]
+
+JOB_POOL_SIZE = 40
+
+
+def make_job_pool() -> list:
+    jobs = []
+    for i in range(JOB_POOL_SIZE):
+        title, description = ROLES[i % len(ROLES)]
+        jobs.append(
+            Job(
+                id=f"bench-{i}",
+                title=f"{title} {i}",
+                company=f"Company {i}",
+                job_url=f"https://indeed.com/viewjob?jk={i:016x}",
+                is_remote=i % 3 == 0,
+                job_type=["contract", "fulltime"][i % 2],
+                description=("We are hiring. " + description + " ") * 3,
+                source="indeed",
+            )
+        )
+    return jobs
+
+
+def workload(n_searches: int, jobs_per_search: int) -> list:
+    """Búsquedas determinísticas: (keywords, ubicación, jobs); se repiten perfiles y jobs"""
+    pool = make_job_pool()
+    searches = []
+    for i in range(n_searches):
+        keywords, location = PROFILES[i % len(PROFILES)]
+        start = (i * 3) % JOB_POOL_SIZE
+        jobs = [pool[(start + k) % JOB_POOL_SIZE] for k in range(jobs_per_search)]
+        searches.append((keywords, location, jobs))
+    return searches
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def run(args, llm) -> dict:
+    cache = MatchCache() if args.cache else MatchCache(ttl_seconds=0)
+    scheduler = LLMScheduler(rpm=args.rpm, rpd=args.rpd, max_wait=args.max_wait) if args.rpm or args.rpd else None
+    ledger = TokenLedger()
+
+    def factory(semaphore):
+        return JobMatcher(llm=llm, cache=cache, semaphore=semaphore, scheduler=scheduler, ledger=ledger)
+
+    pool = MatcherPool(size=args.pool_size, max_concurrency=args.max_concurrency, factory=factory)
+    users = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    first_latencies = []
+    results = []
+
+    async def one_search(keywords, location, jobs):
+        async with users:
+            start = time.perf_counter()
+            if args.stream:
+                # Como /vacantes: el pool presta el matcher solo mientras Gemini responde
+                found = []
+                stream = pool.astream_jobs_batch(jobs, keywords, location, batched=not args.no_batch)
+                async with aclosing(stream) as stream:
+                    async for result in stream:
+                        if not found:
+                            first_latencies.append(time.perf_counter() - start)
+                        found.append(result)
+            else:
+                async with pool.acquire() as matcher:
+                    found = await matcher.amatch_jobs_batch(jobs, keywords, location, batched=not args.no_batch)
+            latencies.append(time.perf_counter() - start)
+            results.extend(found)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_search(*search) for search in workload(args.searches, args.jobs)))
+    elapsed = time.perf_counter() - start
+    await pool.aclose()
+
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "first_latencies": first_latencies,
+        "results": results,
+        "pool": pool.stats(),
+        "cache": cache.stats(),
+        "scheduler": scheduler.stats() if scheduler else None,
+        "tokens": ledger.report()["per_call"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassette", default="", help="Cassette JSONL (RecordingLLM)")
+    parser.add_argument("--record", action="store_true", help="Gemini real: grabar el cassette")
+    parser.add_argument("--searches", type=int, default=50, help="Búsquedas /vacantes (default: 50)")
+    parser.add_argument("--concurrency", type=int, default=5, help="Usuarios simultáneos (default: 5)")
+    parser.add_argument("-n", "--jobs", type=int, default=5, help="Jobs por búsqueda (default: 5)")
+    parser.add_argument("--no-batch", action="store_true", help="1 llamada por job en vez de batch")
+    parser.add_argument("--stream", action="store_true", help="astream_jobs_batch (resultado por resultado)")
+    parser.add_argument("--pool-size", type=int, default=MatcherPool.DEFAULT_SIZE)
+    parser.add_argument("--max-concurrency", type=int, default=5, help="Llamadas simultáneas al modelo")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="× latencia grabada (0 = sin espera)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Segundos aleatorios extra por llamada")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probabilidad de error por llamada")
+    parser.add_argument("--error-kind", choices=["server", "quota"], default="server")
+    parser.add_argument("--cache", action="store_true", help="Activar MatchCache (en memoria)")
+    parser.add_argument("--rpm", type=int, default=0, help="LLMScheduler: requests/min (0 = sin scheduler)")
+    parser.add_argument("--rpd", type=int, default=0, help="LLMScheduler: requests/día")
+    parser.add_argument("--max-wait", type=float, default=8.0, help="LLMScheduler: espera máx. por turno")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.cassette:
+            parser.error("--record necesita --cassette")
+        llm = create_chat_model("record", args.cassette)
+        label = f"Gemini (grabando en {args.cassette})"
+    else:
+        llm = ReplayLLM(
+            args.cassette if args.cassette and os.path.exists(args.cassette) else None,
+            latency_scale=args.latency_scale,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            error_kind=args.error_kind,
+            on_miss="synthesize",
+            seed=args.seed,
+        )
+        label = f"replay ({len(llm)} grabadas)"
+
+    print(
+        f"{args.searches} búsquedas × {args.jobs} jobs, {args.concurrency} usuarios simultáneos, "
+        f"{'1 llamada por job' if args.no_batch else 'batch'}{' (stream)' if args.stream else ''}, modelo: {label}\n"
+    )
+    stats = asyncio.run(run(args, llm))
+
+    latencies, results, elapsed = stats["latencies"], stats["results"], stats["elapsed"]
+    errors = sum(1 for r in results if r.personalized_message.startswith("⚠️"))
+    heuristic = sum(1 for r in results if r.personalized_message.startswith("⚡"))
+    print(f"throughput   {len(latencies) / elapsed:.2f} búsquedas/s, {len(results) / elapsed:.2f} jobs/s ({elapsed:.2f}s)")
+    print(
+        f"latencia     p50 {percentile(latencies, 0.5):.2f}s  p95 {percentile(latencies, 0.95):.2f}s  "
+        f"p99 {percentile(latencies, 0.99):.2f}s  máx {max(latencies, default=0):.2f}s  "
+        f"media {statistics.fmean(latencies) if latencies else 0:.2f}s"
+    )
+    if args.stream:
+        first = stats["first_latencies"]
+        print(
+            f"1er result.  p50 {percentile(first, 0.5):.2f}s  p95 {percentile(first, 0.95):.2f}s  "
+            f"p99 {percentile(first, 0.99):.2f}s  máx {max(first, default=0):.2f}s"
+        )
+    print(
+        f"resultados   {len(results)} jobs: {errors} con error, {heuristic} con score local, "
+        f"{stats['cache']['hits']} desde MatchCache"
+    )
+    usage = stats["pool"]["usage"]
+    print(
+        f"modelo       {usage['calls']} llamadas, {usage['input_tokens']} tokens in, "
+        f"{usage['output_tokens']} tokens out, {stats['tokens']['tokens_per_job']} tokens/job"
+    )
+    if isinstance(llm, ReplayLLM):
+        print(f"replay       {llm.stats()}")
+    if stats["scheduler"]:
+        print(f"scheduler    {stats['scheduler']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests para FASE 10: Performance (scrapers + matcher)"""
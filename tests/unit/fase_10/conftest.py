@@ -0,0 +1,134 @@
+"""
+Fixtures compartidas de fase_10 (JobMatcher sin API key ni red)
+
+Propósito: Una sola definición de los jobs de prueba, de la salida de
+with_structured_output(include_raw=True) y del chat model mock con
+batch_llm / structured_llm separados, en vez de una copia por archivo.
+Las fixtures devuelven factories: cada test arma los objetos que necesita.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from database.models import Job
+from backend.agents.job_matcher import BatchMatchResponse, JobMatcher
+from backend.agents.match_cache import MatchCache
+from backend.agents.token_ledger import TokenLedger
+
+
+def _job(n, **fields) -> Job:
+    """Job n ("Python Developer n" @ "Company n"); fields pisa cualquier campo"""
+    defaults = dict(
+        id=f"in-{n}",
+        title=f"Python Developer {n}",
+        company=f"Company {n}",
+        job_url=f"https://indeed.com/jobs/{n}",
+        description="Python and Django.",
+    )
+    return Job(**{**defaults, **fields})
+
+
+def _raw_output(parsed, parsing_error=None, input_tokens=100, output_tokens=20, cache_read=None) -> dict:
+    """Salida de with_structured_output(include_raw=True) con su usage_metadata"""
+    usage = {"input_tokens": input_tokens, "output_tokens": output_tokens}
+    if cache_read is not None:
+        usage["input_token_details"] = {"cache_read": cache_read}
+    return {"raw": SimpleNamespace(usage_metadata=usage), "parsed": parsed, "parsing_error": parsing_error}
+
+
+def _batch_response(*scores) -> BatchMatchResponse:
+    """(index, score), ... → BatchMatchResponse ("razón {index}")"""
+    return BatchMatchResponse(
+        results=[{"index": i, "match_score": s, "reason": f"razón {i}"} for i, s in scores]
+    )
+
+
+def _score_every_job(score, reason="gemini", **usage):
+    """side_effect del batch: `score` a cada job del delta ("[1] ...", "[2] ...")"""
+
+    def respond(messages):
+        n = messages[-1].content.count("\n[")
+        return _raw_output(
+            BatchMatchResponse(
+                results=[{"index": i, "match_score": score, "reason": reason} for i in range(1, n + 1)]
+            ),
+            **usage,
+        )
+
+    return respond
+
+
+def _fake_llm(batch=None, single=None):
+    """
+    Chat model mock como el que recibe JobMatcher(llm=...)
+
+    with_structured_output(BatchMatchResponse) → batch_llm; cualquier otro
+    schema → structured_llm. batch / single configuran invoke y ainvoke: una
+    excepción se lanza, un callable o una lista son el side_effect, el resto
+    se devuelve tal cual.
+
+    Returns:
+        (llm, batch_llm, structured_llm)
+    """
+    structured_llm, batch_llm = MagicMock(), MagicMock()
+    llm = MagicMock()
+    llm.with_structured_output.side_effect = lambda schema, **_: (
+        batch_llm if schema is BatchMatchResponse else structured_llm
+    )
+    for runnable, output in ((batch_llm, batch), (structured_llm, single)):
+        runnable.ainvoke = AsyncMock()
+        if isinstance(output, (Exception, list)) or callable(output):
+            runnable.invoke.side_effect = runnable.ainvoke.side_effect = output
+        else:
+            runnable.invoke.return_value = runnable.ainvoke.return_value = output
+    return llm, batch_llm, structured_llm
+
+
+def _make_matcher(llm, **kwargs) -> JobMatcher:
+    """JobMatcher sin caché ni ledger globales (salvo que se pasen)"""
+    kwargs.setdefault("cache", MatchCache(ttl_seconds=0))
+    kwargs.setdefault("ledger", TokenLedger())
+    return JobMatcher(llm=llm, **kwargs)
+
+
+def _mock_matcher(batch=None, single=None, **kwargs):
+    """JobMatcher sobre _fake_llm() → (matcher, batch_llm, structured_llm)"""
+    llm, batch_llm, structured_llm = _fake_llm(batch, single)
+    return _make_matcher(llm, **kwargs), batch_llm, structured_llm
+
+
+@pytest.fixture
+def make_job():
+    return _job
+
+
+@pytest.fixture
+def raw_output():
+    return _raw_output
+
+
+@pytest.fixture
+def batch_response():
+    return _batch_response
+
+
+@pytest.fixture
+def score_every_job():
+    return _score_every_job
+
+
+@pytest.fixture
+def fake_llm():
+    return _fake_llm
+
+
+@pytest.fixture
+def make_matcher():
+    return _make_matcher
+
+
+@pytest.fixture
+def mock_matcher():
+    return _mock_matcher
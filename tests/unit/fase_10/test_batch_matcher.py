@@ -0,0 +1,268 @@
+"""
+Tests para el modo batch de JobMatcher (backend/agents/job_matcher.py)
+
+Propósito: Verificar que N jobs se puntúan en UNA llamada a Gemini y que el
+fallback job por job funciona cuando el batch falla
+Framework: pytest + mocking (sin API key ni red)
+"""
+
+import asyncio
+
+import pytest
+
+from backend.agents.job_matcher import MatchVerdict, format_telegram_message
+
+
+# Jobs del prompt batch: descripción larga y repetida (se condensa)
+SENIOR_FIELDS = dict(
+    is_remote=True,
+    job_type="contract",
+    description="Python, FastAPI   and PostgreSQL. " * 50,
+    source="indeed",
+)
+
+
+def single_result(score=40):
+    """Respuesta de Gemini para UN job (el job no viaja: se adjunta localmente)"""
+    return MatchVerdict(match_score=score, reason="individual")
+
+
+class TestBatchMatching:
+    """Tests para match_jobs_batch(batched=True)"""
+
+    def test_scores_all_jobs_in_one_call(self, make_job, raw_output, batch_response, mock_matcher):
+        """
+        Escenario:
+        - 5 jobs, Gemini responde los 5 scores (desordenados)
+        - 1 sola llamada, resultados en el orden de los jobs, mensaje armado local
+        """
+        jobs = [make_job(i) for i in range(5)]
+        matcher, batch_llm, structured_llm = mock_matcher(
+            batch=raw_output(batch_response((3, 70), (1, 90), (2, 10), (5, 55), (4, 30)))
+        )
+
+        results = matcher.match_jobs_batch(jobs, ["python"], "USA")
+
+        assert batch_llm.invoke.call_count == 1
+        structured_llm.invoke.assert_not_called()
+        assert [r.job for r in results] == jobs
+        assert [r.match_score for r in results] == [90, 10, 70, 30, 55]
+        assert results[0].personalized_message == "razón 1"
+        assert "⭐ Score: 90/100" in results[0].telegram_message
+        assert "(https://indeed.com/jobs/0)" in results[0].telegram_message
+        assert matcher.usage == {"calls": 1, "input_tokens": 100, "output_tokens": 20}
+
+    def test_prompt_carries_profile_once_and_compact_summaries(self, make_job, mock_matcher):
+        jobs = [make_job(i, title=f"Senior Python Developer {i}", **SENIOR_FIELDS) for i in range(3)]
+        matcher, _, _ = mock_matcher()
+
+        prompt = matcher.build_batch_prompt(jobs, ["python", "remote"], "Colombia")
+
+        assert prompt.count("Keywords: ['python', 'remote']") == 1
+        assert prompt.count("Location: Colombia") == 1
+        assert "[3] Senior Python Developer 2 | Company 2 | Remote | contract" in prompt
+        # Descripción condensada: espacios colapsados, frases repetidas una sola vez
+        assert prompt.count("FastAPI and PostgreSQL") == 3
+        assert len(prompt) < 3000
+
+    def test_falls_back_per_job_when_batch_fails(self, make_job, raw_output, mock_matcher):
+        """
+        Escenario:
+        - La llamada batch lanza excepción → cada job pasa por match_job()
+        """
+        jobs = [make_job(i) for i in range(3)]
+        matcher, _, structured_llm = mock_matcher(
+            batch=RuntimeError("429 quota"),
+            single=[raw_output(single_result()) for _ in jobs],
+        )
+
+        results = matcher.match_jobs_batch(jobs, ["python"], "USA")
+
+        assert structured_llm.invoke.call_count == 3
+        assert [r.job for r in results] == jobs
+        assert all(r.personalized_message == "individual" for r in results)
+
+    def test_falls_back_per_job_when_batch_parse_fails(self, make_job, raw_output, mock_matcher):
+        jobs = [make_job(i) for i in range(2)]
+        matcher, _, structured_llm = mock_matcher(
+            batch=raw_output(None, parsing_error=ValueError("JSON inválido")),
+            single=[raw_output(single_result()) for _ in jobs],
+        )
+
+        results = matcher.match_jobs_batch(jobs, ["python"], "USA")
+
+        assert structured_llm.invoke.call_count == 2
+        assert [r.match_score for r in results] == [40, 40]
+
+    def test_only_missing_indices_fall_back(self, make_job, raw_output, batch_response, mock_matcher):
+        """
+        Escenario:
+        - Gemini omite el job 2 e inventa un índice 9 (fuera de rango)
+        - Solo el job 2 se analiza aparte; el 9 se ignora
+        """
+        jobs = [make_job(i) for i in range(3)]
+        matcher, _, structured_llm = mock_matcher(
+            batch=raw_output(batch_response((1, 80), (3, 60), (9, 99))),
+            single=[raw_output(single_result(score=25))],
+        )
+
+        results = matcher.match_jobs_batch(jobs, ["python"], "USA")
+
+        assert structured_llm.invoke.call_count == 1
+        assert [r.match_score for r in results] == [80, 25, 60]
+        assert [r.job for r in results] == jobs
+
+    def test_batched_false_keeps_one_call_per_job(self, make_job, raw_output, mock_matcher):
+        jobs = [make_job(i) for i in range(2)]
+        matcher, batch_llm, structured_llm = mock_matcher(
+            single=[raw_output(single_result()) for _ in jobs],
+        )
+
+        matcher.match_jobs_batch(jobs, ["python"], "USA", batched=False)
+
+        batch_llm.invoke.assert_not_called()
+        assert structured_llm.invoke.call_count == 2
+
+
+class TestAsyncMatching:
+    """Tests para amatch_job() / amatch_jobs_batch()"""
+
+    @pytest.mark.asyncio
+    async def test_async_batch_uses_one_ainvoke(self, make_job, raw_output, batch_response, mock_matcher):
+        jobs = [make_job(i) for i in range(3)]
+        matcher, batch_llm, structured_llm = mock_matcher(
+            batch=raw_output(batch_response((1, 80), (2, 20), (3, 50)))
+        )
+
+        results = await matcher.amatch_jobs_batch(jobs, ["python"], "USA")
+
+        batch_llm.ainvoke.assert_awaited_once()
+        batch_llm.invoke.assert_not_called()
+        structured_llm.ainvoke.assert_not_awaited()
+        assert [r.match_score for r in results] == [80, 20, 50]
+
+    @pytest.mark.asyncio
+    async def test_async_fallback_keeps_job_order(self, make_job, raw_output, mock_matcher):
+        """
+        Escenario:
+        - El batch falla → fallback con gather; el job 0 tarda más que el 1
+        - Los resultados igual salen en el orden de los jobs
+        """
+        jobs = [make_job(i) for i in range(2)]
+
+        async def slow_first(messages):
+            job = jobs[0] if "Developer 0" in messages[-1].content else jobs[1]
+            await asyncio.sleep(0.05 if job is jobs[0] else 0)
+            return raw_output(single_result(score=10 if job is jobs[0] else 90))
+
+        matcher, _, structured_llm = mock_matcher(batch=RuntimeError("500"))
+        structured_llm.ainvoke.side_effect = slow_first
+
+        results = await matcher.amatch_jobs_batch(jobs, ["python"], "USA")
+
+        assert [r.job for r in results] == jobs
+        assert [r.match_score for r in results] == [10, 90]
+
+    @pytest.mark.asyncio
+    async def test_semaphore_limits_concurrent_calls(self, make_job, raw_output, mock_matcher):
+        """
+        Escenario:
+        - 6 jobs en modo por job, max_concurrency=2
+        - Nunca hay más de 2 llamadas a Gemini en vuelo
+        """
+        jobs = [make_job(i) for i in range(6)]
+        in_flight = peak = 0
+
+        async def tracked(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return raw_output(single_result())
+
+        matcher, _, structured_llm = mock_matcher(max_concurrency=2)
+        structured_llm.ainvoke.side_effect = tracked
+
+        results = await matcher.amatch_jobs_batch(jobs, ["python"], "USA", batched=False)
+
+        assert len(results) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_llm_call(self, make_job, raw_output, mock_matcher):
+        """Mientras Gemini "piensa", otras corrutinas (otros usuarios) avanzan"""
+        ticks = []
+
+        async def slow_llm(prompt):
+            await asyncio.sleep(0.05)
+            return raw_output(single_result())
+
+        async def other_user():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        matcher, _, structured_llm = mock_matcher()
+        structured_llm.ainvoke.side_effect = slow_llm
+
+        result, _ = await asyncio.gather(
+            matcher.amatch_job(make_job(0), ["python"], "USA"), other_user()
+        )
+
+        assert result.match_score == 40
+        assert len(ticks) == 3
+
+    @pytest.mark.asyncio
+    async def test_amatch_job_error_returns_placeholder(self, make_job, mock_matcher):
+        matcher, _, structured_llm = mock_matcher()
+        structured_llm.ainvoke.side_effect = RuntimeError("timeout")
+
+        result = await matcher.amatch_job(make_job(0), ["python"], "USA")
+
+        assert result.match_score == 0
+        assert "Error" in result.personalized_message
+
+
+class TestMatchVerdictSchema:
+    """Gemini recibe el schema mínimo (MatchVerdict), no JobMatchResult"""
+
+    def test_llm_schema_excludes_job_and_telegram_message(self, mock_matcher):
+        matcher, _, _ = mock_matcher()
+
+        schemas = [c.args[0] for c in matcher.llm.with_structured_output.call_args_list]
+        assert MatchVerdict in schemas
+        properties = MatchVerdict.model_json_schema()["properties"]
+        assert set(properties) == {"match_score", "reason", "highlights"}
+
+    def test_verdict_is_completed_locally(self, make_job, raw_output, mock_matcher):
+        """
+        Escenario:
+        - Gemini devuelve score + reason + 5 highlights
+        - El resultado trae el job original, mensaje armado local y 3 highlights
+        """
+        job = make_job(7)
+        verdict = MatchVerdict(
+            match_score=72, reason="Matches porque: ✅ Python", highlights=["Python", " ", "Remote", "AWS", "SQL"]
+        )
+        matcher, _, _ = mock_matcher(single=[raw_output(verdict)])
+
+        result = matcher.match_job(job, ["python"], "USA")
+
+        assert result.job is job
+        assert result.personalized_message == "Matches porque: ✅ Python"
+        assert result.highlights == ["Python", "Remote", "AWS"]
+        assert "⭐ Score: 72/100" in result.telegram_message
+
+
+class TestFormatTelegramMessage:
+    """Tests para format_telegram_message()"""
+
+    def test_follows_examples_format(self, make_job):
+        job = make_job(1, title="Senior Python Developer 1", job_type="contract", source="indeed")
+        message = format_telegram_message(job, 15, "No matchea.")
+
+        assert message.startswith("❌ Senior Python Developer 1\n🏢 Company 1\n")
+        assert "📍 On-site | 💼 contract" in message
+        assert "⭐ Score: 15/100" in message
+        assert message.endswith("🔗 [Ver en Indeed](https://indeed.com/jobs/1)")
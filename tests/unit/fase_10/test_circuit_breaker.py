@@ -0,0 +1,170 @@
+"""
+Tests para backend/scrapers/circuit_breaker.py
+
+Propósito: Verificar estados CLOSED → OPEN → HALF_OPEN → CLOSED
+Framework: pytest
+"""
+
+import threading
+import time
+
+import pytest
+
+from backend.scrapers.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    counts_as_failure,
+)
+
+
+def make_breaker(**kwargs):
+    defaults = dict(failure_rate_threshold=0.5, window=10, min_calls=4, cooldown=0.1)
+    defaults.update(kwargs)
+    return CircuitBreaker("glassdoor", **defaults)
+
+
+class TestCircuitBreaker:
+    """Tests para la máquina de estados"""
+
+    def test_opens_after_failure_rate(self):
+        """
+        Glassdoor falla seguido → circuito abierto
+
+        Escenario:
+        - 4 llamadas, 3 fallos (75% >= 50%)
+        - La siguiente llamada falla al instante con CircuitOpenError
+        """
+        breaker = make_breaker()
+        breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_needs_min_calls(self):
+        """Un solo fallo no abre el circuito (poca evidencia)"""
+        breaker = make_breaker()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+        breaker.before_call()
+
+    def test_half_open_recovers(self):
+        """
+        Tras el cooldown se permite 1 prueba; si sale bien → CLOSED
+        """
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record_failure()
+        time.sleep(0.15)
+
+        trial = breaker.before_call()
+        assert trial and breaker.state == HALF_OPEN
+        # Solo 1 prueba a la vez
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success(trial)
+        assert breaker.state == CLOSED
+
+    def test_half_open_failure_reopens(self):
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record_failure()
+        time.sleep(0.15)
+
+        trial = breaker.before_call()
+        breaker.record_failure(trial)
+
+        assert breaker.state == OPEN
+
+    def test_only_the_trial_owner_frees_half_open(self):
+        """
+        Escenario:
+        - Un request entra con CLOSED y queda colgado mientras el circuito abre
+        - Pasado el cooldown, 2 callers a la vez en HALF_OPEN: solo 1 es la prueba
+        - El request viejo termina (4xx → release, luego un éxito tardío):
+          la prueba sigue siendo la única y el circuito no cierra sin ella
+        """
+        breaker = make_breaker()
+        stale = breaker.before_call()
+        for _ in range(4):
+            breaker.record_failure()
+        time.sleep(0.15)
+
+        barrier = threading.Barrier(2)
+        admitted, rejected = [], []
+
+        def caller():
+            barrier.wait()
+            try:
+                admitted.append(breaker.before_call())
+            except CircuitOpenError:
+                rejected.append(True)
+
+        threads = [threading.Thread(target=caller) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert (admitted, len(rejected)) == ([True], 1)
+        assert stale is False
+
+        breaker.release(stale)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success(stale)
+        assert breaker.state == HALF_OPEN
+
+        breaker.record_success(admitted[0])
+        assert breaker.state == CLOSED
+
+    def test_client_errors_do_not_count(self):
+        """HTTP 400 = request mal armado, la plataforma está bien"""
+        import requests
+
+        bad_request = requests.Response()
+        bad_request.status_code = 400
+        server_error = requests.Response()
+        server_error.status_code = 503
+
+        assert not counts_as_failure(requests.HTTPError(response=bad_request))
+        assert counts_as_failure(requests.HTTPError(response=server_error))
+        assert counts_as_failure(requests.Timeout())
+
+
+class TestPlatformHealth:
+    """Tests para JobSpyClient.platform_health()"""
+
+    def test_open_platform_is_skipped_and_reported(self):
+        """
+        Plataforma con circuito abierto se salta sin request y se ve en health
+        """
+        from unittest.mock import MagicMock
+        from backend.scrapers.cache import SearchCache
+        from backend.scrapers.circuit_breaker import CircuitBreakerRegistry
+        from backend.scrapers.jobspy_client import JobSpyClient
+        from backend.scrapers.throttle import ThrottleRegistry
+
+        breakers = CircuitBreakerRegistry(min_calls=1, cooldown=60)
+        breakers.get("glassdoor").record_failure()
+
+        transport = MagicMock()
+        client = JobSpyClient(
+            transport=transport,
+            cache=SearchCache(),
+            throttles=ThrottleRegistry(),
+            breakers=breakers,
+        )
+
+        jobs = client.search_jobs("python", "USA", platforms=["glassdoor"])
+
+        assert jobs == []
+        transport.get_json.assert_not_called()
+        assert client.platform_health()["glassdoor"]["circuit"]["state"] == OPEN
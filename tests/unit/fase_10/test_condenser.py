@@ -0,0 +1,145 @@
+"""
+Tests para backend/agents/condenser.py
+
+Propósito: Verificar que al prompt van los requisitos relevantes a las keywords,
+no la intro de la empresa, y sin pasar el presupuesto de tokens
+Framework: pytest
+"""
+
+import time
+
+import pytest
+
+from backend.agents.condenser import (
+    DescriptionCondenser,
+    estimate_tokens,
+    split_sentences,
+    truncate_to_tokens,
+)
+
+
+DESCRIPTION = """We are a fast-growing fintech company founded in 2015 with offices in 12 countries and a mission to democratize finance for everyone.
+Our culture values ownership, kindness and continuous learning across every team.
+Every quarter we gather the whole company for a week of planning, workshops and celebrations.
+
+**Requirements:**
+- 5+ years of experience with Python and Django
+- Experience with PostgreSQL and AWS
+- Fluent English
+
+We offer great benefits, health insurance and are an equal opportunity employer."""
+
+
+class TestSplitSentences:
+    """Tests para split_sentences()"""
+
+    def test_splits_lines_bullets_and_sentences(self):
+        sentences = split_sentences("Intro sentence here. Second sentence here!\n• Bullet with Python\n- Dash item long")
+
+        assert sentences == [
+            "Intro sentence here.",
+            "Second sentence here!",
+            "Bullet with Python",
+            "Dash item long",
+        ]
+
+    def test_drops_repeated_sentences(self):
+        assert split_sentences("Python and Django. " * 5) == ["Python and Django."]
+
+    def test_strips_markdown_and_noise(self):
+        assert split_sentences("**Requirements:**\n\\- Python 3\\.11 or newer\nApply") == [
+            "Requirements:",
+            "Python 3.11 or newer",
+        ]
+
+
+class TestDescriptionCondenser:
+    """Tests para DescriptionCondenser"""
+
+    def test_keeps_requirements_over_company_intro(self):
+        """
+        Escenario:
+        - La descripción empieza con 3 frases de intro de la empresa
+        - keywords python + django → el requisito con ambas va al prompt, la intro no
+        """
+        condenser = DescriptionCondenser(token_budget=40)
+
+        condensed = condenser.condense(DESCRIPTION, ["python", "django"])
+
+        assert "5+ years of experience with Python and Django." in condensed
+        assert "fintech" not in condensed
+        assert "equal opportunity" not in condensed
+        assert estimate_tokens(condensed) <= 40
+
+    def test_previous_cut_missed_the_requirements(self):
+        """El recorte anterior (description[:300]) no llegaba a los requisitos"""
+        assert "Python" not in DESCRIPTION[:300]
+        assert "Python" in DescriptionCondenser().condense(DESCRIPTION, ["python"])
+
+    def test_selected_sentences_keep_original_order(self):
+        condenser = DescriptionCondenser(token_budget=75)
+
+        condensed = condenser.condense(DESCRIPTION, ["aws", "python"])
+
+        assert condensed.index("Python and Django") < condensed.index("PostgreSQL and AWS")
+
+    def test_no_matches_falls_back_to_leading_sentences(self):
+        condenser = DescriptionCondenser(token_budget=40)
+
+        condensed = condenser.condense("First plain sentence here. Second plain sentence here.", ["cobol"])
+
+        assert condensed == "First plain sentence here. Second plain sentence here."
+
+    def test_long_sentence_is_truncated_on_word_boundary(self):
+        text = "Python " + "word " * 200
+        condensed = DescriptionCondenser(token_budget=10).condense(text, ["python"])
+
+        assert condensed.startswith("Python word")
+        assert condensed.endswith("…")
+        assert estimate_tokens(condensed) <= 10
+        assert truncate_to_tokens("short", 10) == "short"
+
+    def test_top_sentence_is_kept_even_when_over_budget(self):
+        """
+        Escenario:
+        - La frase con las keywords sola pasa el presupuesto; las demás son cortas
+        - Va la mejor frase recortada, no las cortas que sí entraban
+        """
+        text = "Python and Django " + "with plenty of detail " * 20 + ". Nice office. Free snacks."
+        condensed = DescriptionCondenser(token_budget=15).condense(text, ["python", "django"])
+
+        assert condensed.startswith("Python and Django")
+        assert "snacks" not in condensed
+        assert estimate_tokens(condensed) <= 15
+
+    def test_non_positive_budget(self):
+        """Budget 0 (ej: GEMINI_DESCRIPTION_TOKENS=0) no manda la descripción entera"""
+        assert truncate_to_tokens("Python " * 100, 0) == ""
+        assert truncate_to_tokens("Python " * 100, -5) == ""
+        with pytest.raises(ValueError):
+            DescriptionCondenser(token_budget=0)
+
+    def test_empty_description(self):
+        assert DescriptionCondenser().condense(None, ["python"]) == "No description"
+        assert DescriptionCondenser().condense("   ", ["python"]) == "No description"
+
+    def test_stats_track_tokens_per_call(self):
+        condenser = DescriptionCondenser(token_budget=40)
+        condenser.condense(DESCRIPTION, ["python"])
+        condenser.condense(DESCRIPTION, ["aws"])
+
+        stats = condenser.stats()
+        assert stats["calls"] == 2
+        assert stats["original_tokens"] == 2 * estimate_tokens(DESCRIPTION)
+        assert stats["condensed_tokens"] <= 80
+
+    def test_fast_enough_for_long_descriptions(self):
+        condenser = DescriptionCondenser()
+        long_description = DESCRIPTION * 20  # ~11k caracteres
+
+        start = time.perf_counter()
+        for _ in range(20):
+            condenser.condense(long_description, ["python", "django", "aws"])
+        per_call = (time.perf_counter() - start) / 20
+
+        assert per_call < 0.02
@@ -0,0 +1,118 @@
+"""
+Tests para backend/scrapers/dedup.py
+
+Propósito: Verificar dedup entre plataformas (URL, fingerprint, MinHash)
+Framework: pytest
+"""
+
+import time
+
+from database.models import Job
+from backend.scrapers.dedup import DedupStats, canonicalize_url, deduplicate_jobs
+
+
+def make_job(title, company, url, source="indeed", **kwargs):
+    return Job(title=title, company=company, job_url=url, source=source, **kwargs)
+
+
+class TestCanonicalizeUrl:
+    """Tests para URL canónica"""
+
+    def test_strips_tracking_params(self):
+        assert (
+            canonicalize_url("https://www.linkedin.com/jobs/view/123/?trk=abc&refId=x&utm_source=tg#top")
+            == "https://linkedin.com/jobs/view/123"
+        )
+
+    def test_keeps_identifying_params(self):
+        """Indeed identifica la vacante con ?jk= → NO se debe quitar"""
+        assert (
+            canonicalize_url("http://indeed.com/viewjob?jk=abc123&from=serp&vjs=3")
+            == "https://indeed.com/viewjob?jk=abc123"
+        )
+
+
+class TestDeduplicateJobs:
+    """Tests para deduplicate_jobs()"""
+
+    def test_same_url_with_tracking_is_duplicate(self):
+        jobs = [
+            make_job("Python Dev", "Acme", "https://linkedin.com/jobs/view/1?trk=a"),
+            make_job("Python Dev", "Acme", "https://www.linkedin.com/jobs/view/1/?trk=b"),
+        ]
+        stats = DedupStats()
+
+        assert len(deduplicate_jobs(jobs, stats=stats)) == 1
+        assert stats.by_url == 1
+
+    def test_same_title_company_across_platforms(self):
+        """
+        Misma vacante en Indeed y LinkedIn (URLs distintas)
+
+        Escenario:
+        - "Senior Python Developer" @ "Acme Corp" (Indeed)
+        - "Senior Python Developer" @ "ACME Corp." (LinkedIn)
+        - Debe quedar 1, la de Indeed (primera), completada con descripción de LinkedIn
+        """
+        jobs = [
+            make_job("Senior Python Developer", "Acme Corp", "https://indeed.com/viewjob?jk=1"),
+            make_job(
+                "Senior Python Developer", "ACME Corp.", "https://linkedin.com/jobs/view/9",
+                source="linkedin", description="FastAPI, PostgreSQL",
+            ),
+        ]
+
+        unique = deduplicate_jobs(jobs)
+
+        assert len(unique) == 1
+        assert unique[0].source == "indeed"
+        assert unique[0].description == "FastAPI, PostgreSQL"
+
+    def test_near_duplicate_titles(self):
+        """'Sr. Python Developer' ≈ 'Senior Python Developer - Remote' (misma empresa)"""
+        jobs = [
+            make_job("Senior Python Developer - Remote", "Acme Corp", "https://indeed.com/viewjob?jk=1"),
+            make_job("Sr. Python Developer", "ACME Corporation", "https://linkedin.com/jobs/view/9"),
+        ]
+        stats = DedupStats()
+
+        assert len(deduplicate_jobs(jobs, stats=stats)) == 1
+        assert stats.by_minhash == 1
+
+    def test_same_title_different_company_is_kept(self):
+        jobs = [
+            make_job("Python Developer", "Globant", "https://linkedin.com/jobs/view/1"),
+            make_job("Python Developer", "EPAM Systems", "https://linkedin.com/jobs/view/2"),
+        ]
+
+        assert len(deduplicate_jobs(jobs)) == 2
+
+    def test_same_title_without_company_is_kept(self):
+        """
+        Escenario:
+        - 2 "Python Developer" sin empresa (URLs distintas) → pueden ser de
+          empleadores distintos: se conservan los 2
+        - La misma URL sin empresa sí se deduplica
+        """
+        jobs = [
+            make_job("Python Developer", None, "https://linkedin.com/jobs/view/1"),
+            make_job("Python Developer", "", "https://indeed.com/viewjob?jk=2"),
+            make_job("Sr. Python Developer", None, "https://glassdoor.com/job/3"),
+            make_job("Python Developer", None, "https://www.linkedin.com/jobs/view/1/?trk=x"),
+        ]
+        stats = DedupStats()
+
+        assert len(deduplicate_jobs(jobs, stats=stats)) == 3
+        assert (stats.by_url, stats.by_fingerprint, stats.by_minhash) == (1, 0, 0)
+
+    def test_scales_to_thousands(self):
+        """5000 jobs deben procesarse en < 3s (tiempo ~lineal)"""
+        jobs = [
+            make_job(f"Engineer {i}", f"Company {i % 50}", f"https://indeed.com/viewjob?jk={i}")
+            for i in range(5000)
+        ]
+
+        start = time.perf_counter()
+        deduplicate_jobs(jobs)
+
+        assert time.perf_counter() - start < 3
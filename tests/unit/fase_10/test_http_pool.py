@@ -0,0 +1,225 @@
+"""
+Tests para backend/scrapers/http_pool.py
+
+Propósito: Verificar get_json() / aget_json() contra un servidor local
+(bytes crudos gzip e identity), la sesión aiohttp bajo demanda y el ciclo
+de vida del transporte global (init_transport / close_transport)
+Framework: pytest + pytest-asyncio + servidor aiohttp local (sin red)
+"""
+
+import asyncio
+import gzip
+import json
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from backend.scrapers import http_pool
+from backend.scrapers.http_pool import (
+    HTTPTransport,
+    close_transport,
+    get_transport,
+    init_transport,
+)
+
+
+PAYLOAD = {"count": 2, "jobs": [{"title": f"Python Dev {i}", "description": "Python " * 50} for i in (1, 2)]}
+BODY = json.dumps(PAYLOAD).encode()
+GZIPPED = gzip.compress(BODY)
+
+
+@asynccontextmanager
+async def serve(status=200):
+    """
+    jobspy-api falso en 127.0.0.1: gzip si el cliente lo anuncia, si no
+    identity. Devuelve (url, requests recibidos)
+    """
+    seen = []
+
+    async def handler(request):
+        seen.append(request)
+        if status != 200:
+            return web.Response(status=status, text="unavailable")
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(
+                body=GZIPPED, content_type="application/json", headers={"Content-Encoding": "gzip"}
+            )
+        return web.Response(body=BODY, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/v1/search_jobs", handler)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        yield str(server.make_url("/api/v1/search_jobs")), seen
+    finally:
+        await server.close()
+
+
+class TestGetJson:
+    """get_json() (sync): stream=True + raw.read(decode_content=False)"""
+
+    @pytest.mark.asyncio
+    async def test_gzip_body_is_read_raw(self):
+        """
+        Escenario:
+        - El servidor responde gzip
+        - requests NO descomprime: wire.py recibe los bytes comprimidos
+          (wire_bytes == tamaño gzip) y devuelve el JSON original
+        """
+        transport = HTTPTransport()
+        async with serve() as (url, seen):
+            data, elapsed = await asyncio.to_thread(
+                transport.get_json, url, params={"site_name": "indeed", "is_remote": True}
+            )
+        transport.session.close()
+
+        assert data == PAYLOAD
+        assert elapsed > 0
+        assert seen[0].query["is_remote"] == "True"
+        stats = transport.stats()["by_encoding"]["gzip"]
+        assert (stats["wire_bytes"], stats["body_bytes"]) == (len(GZIPPED), len(BODY))
+
+    @pytest.mark.asyncio
+    async def test_identity_body(self):
+        transport = HTTPTransport(compression=False)
+        async with serve() as (url, seen):
+            data, _ = await asyncio.to_thread(transport.get_json, url, headers={"X-Request-Id": "abc"})
+        transport.session.close()
+
+        assert data == PAYLOAD
+        assert seen[0].headers["Accept-Encoding"] == "identity"
+        assert seen[0].headers["X-Request-Id"] == "abc"
+        assert transport.stats()["by_encoding"]["identity"]["wire_bytes"] == len(BODY)
+
+    @pytest.mark.asyncio
+    async def test_server_error_raises(self):
+        transport = HTTPTransport()
+        async with serve(status=503) as (url, _):
+            with pytest.raises(requests.HTTPError):
+                await asyncio.to_thread(transport.get_json, url)
+        transport.session.close()
+
+        assert transport.stats()["responses"] == 0
+
+
+class TestAgetJson:
+    """aget_json() (async): sesión aiohttp con auto_decompress=False"""
+
+    @pytest.mark.asyncio
+    async def test_gzip_body_is_read_raw(self):
+        """
+        Escenario:
+        - La sesión aiohttp no existe hasta el 1er request
+        - aiohttp NO descomprime (auto_decompress=False): wire_bytes == gzip
+        - Los bool de params viajan como "true"/"false"
+        """
+        transport = HTTPTransport()
+        assert transport._async_session is None
+
+        async with serve() as (url, seen):
+            data, _ = await transport.aget_json(url, params={"is_remote": True, "results_wanted": 5})
+            await transport.aclose()
+
+        assert data == PAYLOAD
+        assert dict(seen[0].query) == {"is_remote": "true", "results_wanted": "5"}
+        stats = transport.stats()["by_encoding"]["gzip"]
+        assert (stats["wire_bytes"], stats["body_bytes"]) == (len(GZIPPED), len(BODY))
+
+    @pytest.mark.asyncio
+    async def test_identity_body(self):
+        transport = HTTPTransport(compression=False)
+        async with serve() as (url, seen):
+            data, _ = await transport.aget_json(url)
+            await transport.aclose()
+
+        assert data == PAYLOAD
+        assert seen[0].headers["Accept-Encoding"] == "identity"
+        assert transport.stats()["by_encoding"]["identity"]["wire_bytes"] == len(BODY)
+
+    @pytest.mark.asyncio
+    async def test_server_error_raises(self):
+        transport = HTTPTransport()
+        async with serve(status=503) as (url, _):
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                await transport.aget_json(url)
+            await transport.aclose()
+
+        assert error.value.status == 503
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_and_recreated_after_close(self):
+        """
+        Escenario:
+        - 2 requests → misma sesión aiohttp (keep-alive)
+        - aclose() cierra ambos pools; el siguiente request abre una sesión nueva
+        """
+        transport = HTTPTransport(pool_size=3)
+        async with serve() as (url, seen):
+            await transport.aget_json(url)
+            session = transport._async_session
+            await transport.aget_json(url)
+            assert transport._async_session is session
+            assert session.connector.limit == 3
+
+            await transport.aclose()
+            assert session.closed and transport._async_session is None
+
+            data, _ = await transport.aget_json(url)
+            assert transport._async_session is not session
+            await transport.aclose()
+
+        assert data == PAYLOAD
+        assert len(seen) == 3
+
+
+class TestProcessTransport:
+    """init_transport() / get_transport() / close_transport()"""
+
+    @pytest.fixture(autouse=True)
+    def no_global_transport(self, monkeypatch):
+        """Cada test arranca sin transporte global (y no pisa el del proceso)"""
+        monkeypatch.setattr(http_pool, "_transport", None)
+
+    @pytest.mark.asyncio
+    async def test_init_use_close_and_reinit(self):
+        """
+        Escenario:
+        - init_transport() (como post_init del bot) → get_transport() devuelve ese
+        - close_transport() cierra su sesión aiohttp y lo quita
+        - init_transport() otra vez → transporte nuevo y funcional
+        """
+        first = init_transport(pool_size=4, compression=False)
+        assert get_transport() is first and first.pool_size == 4
+
+        async with serve() as (url, _):
+            await first.aget_json(url)
+            session = first._async_session
+
+            await close_transport()
+            assert session.closed
+            assert http_pool._transport is None
+
+            second = init_transport()
+            data, _ = await get_transport().aget_json(url)
+            await close_transport()
+
+        assert second is not first
+        assert data == PAYLOAD
+        assert second.stats()["by_encoding"]["gzip"]["responses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_transport_creates_default_on_demand(self):
+        transport = get_transport()
+
+        assert transport is get_transport()
+        assert transport.pool_size == HTTPTransport.DEFAULT_POOL_SIZE
+
+        await close_transport()
+        await close_transport()  # idempotente
+        assert get_transport() is not transport
+        await close_transport()
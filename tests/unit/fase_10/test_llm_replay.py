@@ -0,0 +1,170 @@
+"""
+Tests para backend/agents/llm_replay.py
+
+Propósito: Verificar que RecordingLLM graba prompt → respuesta en el
+cassette, que ReplayLLM lo reproduce con JobMatcher sin red (latencia y
+errores configurables) y que create_chat_model() elige el backend
+Framework: pytest + mocking (sin API key ni red)
+"""
+
+import time
+
+import pytest
+
+from backend.agents.job_matcher import JobMatcher, MatchVerdict, create_chat_model
+from backend.agents.llm_replay import CassetteMiss, RecordingLLM, ReplayError, ReplayLLM
+from backend.agents.match_cache import MatchCache
+
+USAGE = {"input_tokens": 400, "output_tokens": 50}
+
+
+@pytest.fixture
+def fake_gemini(fake_llm, raw_output, score_every_job):
+    """Chat model mock: batch responde 80 a todo, individual responde 65"""
+
+    def build():
+        llm, _, _ = fake_llm(
+            batch=score_every_job(80, reason="grabado", **USAGE),
+            single=raw_output(MatchVerdict(match_score=65, reason="grabado"), **USAGE),
+        )
+        return llm
+
+    return build
+
+
+@pytest.fixture
+def cassette(tmp_path, fake_gemini, make_matcher, make_job):
+    """Cassette grabado con 1 búsqueda batch (3 jobs) + 1 llamada individual"""
+    path = str(tmp_path / "jobs.cassette.jsonl")
+    matcher = make_matcher(RecordingLLM(fake_gemini(), path))
+    matcher.match_jobs_batch([make_job(i) for i in (1, 2, 3)], ["python"], "USA")
+    matcher.match_job(make_job(9), ["python"], "USA")
+    return path
+
+
+class TestRecordingLLM:
+    """Tests para RecordingLLM"""
+
+    def test_records_one_entry_per_call(self, cassette):
+        entries = ReplayLLM.load(cassette)
+
+        assert [e["schema"] for e in entries] == ["BatchMatchResponse", "MatchVerdict"]
+        assert "JOBS (3)" in entries[0]["prompt"]
+        assert "Ejemplos de calibración" not in entries[0]["prompt"]  # solo el delta
+        assert entries[1]["parsed"]["match_score"] == 65
+        assert entries[1]["usage"] == USAGE
+
+    def test_unparsed_responses_are_not_recorded(self, tmp_path, fake_gemini, make_matcher, make_job):
+        path = tmp_path / "c.jsonl"
+        llm = fake_gemini()
+        llm.with_structured_output(MatchVerdict).invoke.return_value = {
+            "raw": None, "parsed": None, "parsing_error": ValueError("bad json")
+        }
+        recorder = RecordingLLM(llm, str(path))
+
+        make_matcher(recorder).match_job(make_job(1), ["python"], "USA")
+
+        assert recorder.recorded == 0
+        assert not path.exists()
+
+
+class TestReplayLLM:
+    """Tests para ReplayLLM + JobMatcher"""
+
+    def test_replay_matches_recording(self, cassette, make_matcher, make_job):
+        """
+        Escenario:
+        - Misma búsqueda que la grabada → mismos scores, 0 misses
+        - El usage grabado llega a JobMatcher (tokens del ledger)
+        """
+        replay = ReplayLLM(cassette, latency_scale=0)
+        matcher = make_matcher(replay)
+
+        results = matcher.match_jobs_batch([make_job(i) for i in (1, 2, 3)], ["python"], "USA")
+        single = matcher.match_job(make_job(9), ["python"], "USA")
+
+        assert [r.match_score for r in results] == [80, 80, 80]
+        assert single.match_score == 65
+        assert replay.stats() == {"entries": 2, "calls": 2, "hits": 2, "misses": 0, "errors": 0}
+        assert matcher.ledger.report()["today"]["input_tokens"] == 800
+
+    def test_strict_miss_raises(self, cassette, fake_gemini, make_matcher, make_job):
+        runnable = ReplayLLM(cassette, latency_scale=0).with_structured_output(MatchVerdict)
+        matcher = make_matcher(fake_gemini())
+
+        with pytest.raises(CassetteMiss):
+            runnable.invoke(matcher.build_messages(make_job(42), ["java"], "USA"))
+
+    def test_synthesize_covers_unrecorded_prompts(self, make_matcher, make_job):
+        """
+        Escenario:
+        - Cassette vacío, on_miss="synthesize"
+        - Batch de 4 jobs → 4 resultados válidos, scores estables entre corridas
+        """
+        jobs = [make_job(i) for i in range(1, 5)]
+
+        first = make_matcher(ReplayLLM(latency_scale=0, on_miss="synthesize")).match_jobs_batch(jobs, ["python"], "USA")
+        second = make_matcher(ReplayLLM(latency_scale=0, on_miss="synthesize")).match_jobs_batch(jobs, ["python"], "USA")
+
+        assert [r.job for r in first] == [r.job for r in second]
+        assert [r.match_score for r in first] == [r.match_score for r in second]
+        assert all(r.personalized_message == "Respuesta sintética (replay)" for r in first)
+
+    def test_injected_errors_fall_back_per_job(self, make_matcher, make_job):
+        replay = ReplayLLM(latency_scale=0, error_rate=1.0, on_miss="synthesize")
+
+        results = make_matcher(replay).match_jobs_batch([make_job(1), make_job(2)], ["python"], "USA")
+
+        assert [r.match_score for r in results] == [0, 0]
+        assert replay.stats()["errors"] == 3  # 1 batch + 2 individuales
+
+    def test_quota_errors_look_like_gemini_429(self):
+        runnable = ReplayLLM(error_rate=1.0, error_kind="quota", latency_scale=0).with_structured_output(MatchVerdict)
+
+        with pytest.raises(ReplayError, match="429 RESOURCE_EXHAUSTED"):
+            runnable.invoke("prompt")
+
+    def test_latency_is_scaled(self):
+        entry = {"key": "k", "schema": "MatchVerdict", "parsed": {"match_score": 1, "reason": "r"}, "latency": 1.0}
+        runnable = ReplayLLM(entries=[entry], latency_scale=0.05, on_miss="synthesize").with_structured_output(
+            MatchVerdict
+        )
+
+        start = time.perf_counter()
+        runnable.invoke("prompt no grabado")  # latencia mediana del cassette × 0.05
+
+        assert 0.04 < time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_async_replay(self, cassette, make_matcher, make_job):
+        replay = ReplayLLM(cassette, latency_scale=0)
+
+        results = await make_matcher(replay).amatch_jobs_batch([make_job(i) for i in (1, 2, 3)], ["python"], "USA")
+
+        assert [r.match_score for r in results] == [80, 80, 80]
+        assert replay.stats()["hits"] == 1
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            ReplayLLM(on_miss="ignore")
+        with pytest.raises(ValueError):
+            ReplayLLM(error_kind="timeout")
+
+
+class TestCreateChatModel:
+    """Tests para create_chat_model()"""
+
+    def test_replay_backend_without_cassette(self, tmp_path):
+        llm = create_chat_model("replay", str(tmp_path / "missing.jsonl"))
+
+        assert isinstance(llm, ReplayLLM)
+        assert len(llm) == 0 and llm.on_miss == "synthesize"
+
+    def test_empty_replay_is_still_used_by_matcher(self, tmp_path):
+        llm = create_chat_model("replay", str(tmp_path / "missing.jsonl"))
+
+        assert JobMatcher(llm=llm, cache=MatchCache(ttl_seconds=0)).llm is llm
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_chat_model("offline")
@@ -0,0 +1,266 @@
+"""
+Tests para backend/agents/llm_scheduler.py y backend/agents/heuristic_scorer.py
+
+Propósito: Verificar que la cuota de Gemini (RPM, RPD, tokens) se respeta
+para todo el proceso, que el admin pasa primero y que sin cuota el usuario
+recibe igual una lista ordenada con el score local
+Framework: pytest + mocking (sin API key ni red)
+"""
+
+import asyncio
+
+import pytest
+
+from backend.agents.heuristic_scorer import heuristic_verdict
+from backend.agents.job_matcher import MatchVerdict
+from backend.agents.llm_scheduler import (
+    ADMIN,
+    USER,
+    LLMScheduler,
+    QuotaExceeded,
+    is_quota_error,
+)
+
+
+@pytest.fixture
+def scheduled_matcher(mock_matcher, raw_output, score_every_job):
+    """JobMatcher con LLM mock: batch responde 90 a todo, individual responde 70"""
+
+    def build(scheduler):
+        return mock_matcher(
+            batch=score_every_job(90),
+            single=raw_output(MatchVerdict(match_score=70, reason="gemini")),
+            scheduler=scheduler,
+        )
+
+    return build
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLLMScheduler:
+    """Tests para LLMScheduler"""
+
+    def test_rpm_window_slides(self):
+        """
+        Escenario:
+        - rpm=2: el 3er request del minuto se rechaza
+        - 60s después la ventana se vacía y vuelve a pasar
+        """
+        clock = FakeClock()
+        scheduler = LLMScheduler(rpm=2, rpd=0, tpm=0, clock=clock)
+
+        scheduler.reserve_nowait()
+        scheduler.reserve_nowait()
+        with pytest.raises(QuotaExceeded) as error:
+            scheduler.reserve_nowait()
+        assert error.value.reason == "RPM"
+
+        clock.now += 60
+        scheduler.reserve_nowait()
+        assert scheduler.stats()["rpm_used"] == 1
+
+    def test_rpd_exhausted_rejects_even_if_minute_is_free(self):
+        clock = FakeClock()
+        scheduler = LLMScheduler(rpm=0, rpd=2, tpm=0, clock=clock)
+        scheduler.reserve_nowait()
+        scheduler.reserve_nowait()
+        clock.now += 3600
+
+        with pytest.raises(QuotaExceeded) as error:
+            scheduler.reserve_nowait()
+
+        assert error.value.reason == "RPD"
+        assert error.value.retry_in == pytest.approx(86400 - 3600)
+
+    def test_token_budget_uses_actual_usage(self):
+        """
+        Escenario:
+        - tpm=1000, se reservan 800 estimados → un request de 300 no entra
+        - El uso real fue 200 (Reservation.tokens corregido) → ahora sí entra
+        """
+        scheduler = LLMScheduler(rpm=0, rpd=0, tpm=1000, clock=FakeClock())
+        reservation = scheduler.reserve_nowait(tokens=800)
+
+        with pytest.raises(QuotaExceeded):
+            scheduler.reserve_nowait(tokens=300)
+
+        reservation.tokens = 200
+        scheduler.reserve_nowait(tokens=300)
+        assert scheduler.stats()["tpm_used"] == 500
+
+    @pytest.mark.asyncio
+    async def test_waits_for_slot_within_max_wait(self):
+        scheduler = LLMScheduler(rpm=1, rpd=0, tpm=0, window_seconds=0.05, max_wait=1)
+
+        async with scheduler.slot():
+            pass
+        async with scheduler.slot():
+            pass
+
+        assert scheduler.stats()["admitted"] == 2
+        assert scheduler.stats()["avg_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_immediately_when_wait_exceeds_max_wait(self):
+        scheduler = LLMScheduler(rpm=1, rpd=0, tpm=0, window_seconds=60, max_wait=1)
+        async with scheduler.slot():
+            pass
+
+        start = asyncio.get_running_loop().time()
+        with pytest.raises(QuotaExceeded):
+            async with scheduler.slot():
+                pass
+
+        assert asyncio.get_running_loop().time() - start < 0.1
+        assert scheduler.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_admin_goes_first(self):
+        """
+        Escenario:
+        - rpm=1 con ventana corta: la cuota está ocupada
+        - Llegan 2 usuarios y DESPUÉS el admin → el admin pasa primero
+        """
+        scheduler = LLMScheduler(rpm=1, rpd=0, tpm=0, window_seconds=0.05, max_wait=2)
+        async with scheduler.slot():
+            pass
+        order = []
+
+        async def request(name, priority):
+            async with scheduler.slot(priority=priority):
+                order.append(name)
+
+        tasks = [asyncio.create_task(request("user-1", USER)), asyncio.create_task(request("user-2", USER))]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("admin", ADMIN)))
+        await asyncio.gather(*tasks)
+
+        assert order == ["admin", "user-1", "user-2"]
+        assert scheduler.stats()["admitted_admin"] == 1
+
+    def test_penalize_blocks_calls(self):
+        clock = FakeClock()
+        scheduler = LLMScheduler(rpm=0, rpd=0, tpm=0, clock=clock)
+        scheduler.penalize(30)
+
+        with pytest.raises(QuotaExceeded):
+            scheduler.reserve_nowait()
+        clock.now += 30
+        scheduler.reserve_nowait()
+
+    def test_is_quota_error(self):
+        assert is_quota_error(RuntimeError("429 RESOURCE_EXHAUSTED: quota exceeded"))
+        assert not is_quota_error(RuntimeError("500 internal"))
+
+
+class TestHeuristicScorer:
+    """Tests para heuristic_verdict()"""
+
+    def test_title_beats_description_beats_missing(self, make_job):
+        in_title = make_job(1, title="Python Developer", description="Great team")
+        in_description = make_job(2, title="Backend Developer", description="We use Python daily")
+        missing = make_job(3, title="Java Developer", description="Spring Boot")
+
+        scores = [heuristic_verdict(job, ["python"])[0] for job in (in_title, in_description, missing)]
+
+        assert scores[0] > scores[1] > scores[2]
+        assert 0 < scores[2] and scores[0] < 100
+
+    def test_reason_and_highlights(self, make_job):
+        score, reason, highlights = heuristic_verdict(make_job(1, is_remote=True), ["python", "remote", "kotlin"])
+
+        assert highlights == ["python", "remote"]
+        assert reason.startswith("⚡ Estimado rápido (sin IA)")
+        assert "❌ kotlin" in reason
+
+    def test_no_keywords_is_neutral(self, make_job):
+        assert heuristic_verdict(make_job(1), [])[0] == 50
+
+
+class TestJobMatcherWithScheduler:
+    """JobMatcher + LLMScheduler"""
+
+    def test_sync_batch_falls_back_to_heuristic_without_quota(self, make_job, scheduled_matcher):
+        """
+        Escenario:
+        - rpm=1: la 1ª búsqueda usa Gemini (1 llamada batch)
+        - 2ª búsqueda en el mismo minuto: sin cuota → score local para todos,
+          sin llamar a Gemini y sin errores
+        """
+        scheduler = LLMScheduler(rpm=1, rpd=0, tpm=0, clock=FakeClock())
+        matcher, batch_llm, structured_llm = scheduled_matcher(scheduler)
+        jobs = [make_job(1), make_job(2, title="Java Developer", description="Spring")]
+
+        first = matcher.match_jobs_batch(jobs, ["python"], "USA")
+        second = matcher.match_jobs_batch(jobs, ["python"], "USA")
+
+        assert [r.match_score for r in first] == [90, 90]
+        assert batch_llm.invoke.call_count == 1
+        structured_llm.invoke.assert_not_called()
+        assert [r.job for r in second] == jobs
+        assert second[0].match_score > second[1].match_score
+        assert "Estimado rápido" in second[0].telegram_message
+
+    @pytest.mark.asyncio
+    async def test_async_batch_falls_back_to_heuristic_without_quota(self, make_job, scheduled_matcher):
+        scheduler = LLMScheduler(rpm=0, rpd=1, tpm=0)
+        matcher, batch_llm, _ = scheduled_matcher(scheduler)
+        jobs = [make_job(1), make_job(2)]
+
+        await matcher.amatch_jobs_batch(jobs, ["python"], "USA")
+        results = await matcher.amatch_jobs_batch(jobs, ["python"], "USA")
+
+        assert batch_llm.ainvoke.await_count == 1
+        assert len(results) == 2
+        assert all("Estimado rápido" in r.personalized_message for r in results)
+
+    @pytest.mark.asyncio
+    async def test_reservation_corrected_with_real_usage(self, make_job, scheduled_matcher):
+        scheduler = LLMScheduler(rpm=0, rpd=0, tpm=0)
+        matcher, _, _ = scheduled_matcher(scheduler)
+
+        await matcher.amatch_job(make_job(1), ["python"], "USA", priority=ADMIN)
+
+        stats = scheduler.stats()
+        assert stats["tpm_used"] == 120  # 100 input + 20 output del usage_metadata
+        assert stats["admitted_admin"] == 1
+
+    def test_gemini_429_pauses_scheduler(self, make_job, scheduled_matcher):
+        scheduler = LLMScheduler(rpm=0, rpd=0, tpm=0, clock=FakeClock())
+        matcher, _, structured_llm = scheduled_matcher(scheduler)
+        structured_llm.invoke.side_effect = RuntimeError("429 RESOURCE_EXHAUSTED")
+
+        failed = matcher.match_job(make_job(1), ["python"], "USA")
+        after = matcher.match_job(make_job(2), ["python"], "USA")
+
+        assert "Estimado rápido" in failed.personalized_message  # score local, no score 0
+        assert structured_llm.invoke.call_count == 1
+        assert "Estimado rápido" in after.personalized_message
+        assert scheduler.stats()["penalties"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_gemini_429_gets_heuristic_score(self, make_job, scheduled_matcher):
+        scheduler = LLMScheduler(rpm=0, rpd=0, tpm=0, clock=FakeClock())
+        matcher, _, structured_llm = scheduled_matcher(scheduler)
+        structured_llm.ainvoke.side_effect = RuntimeError("429 RESOURCE_EXHAUSTED")
+
+        result = await matcher.amatch_job(make_job(1), ["python"], "USA")
+
+        assert result.match_score > 0
+        assert "Estimado rápido" in result.personalized_message
+        assert scheduler.stats()["penalties"] == 1
+
+    def test_without_scheduler_there_is_no_quota(self, make_job, scheduled_matcher):
+        matcher, batch_llm, _ = scheduled_matcher(scheduler=None)
+
+        for _ in range(30):
+            matcher.match_jobs_batch([make_job(1), make_job(2)], ["python"], "USA")
+
+        assert batch_llm.invoke.call_count == 30
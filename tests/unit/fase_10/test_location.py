@@ -0,0 +1,105 @@
+"""
+Tests para backend/scrapers/location.py
+
+Propósito: Verificar parseo de ubicaciones de JobSpy y filtrado previo a Gemini
+Framework: pytest
+"""
+
+import time
+
+import pytest
+
+from database.models import Job, JobLocation
+from backend.scrapers.location import (
+    filter_jobs_by_location,
+    format_location,
+    parse_location,
+    parse_location_parts,
+)
+
+
+class TestParseLocation:
+    """Tests para parse_location()"""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("ANT, CO", ("Colombia", "Antioquia", None)),
+            ("Medellín, ANT, CO", ("Colombia", "Antioquia", "Medellín")),
+            ("Bogotá, Colombia", ("Colombia", "Bogotá D.C.", "Bogotá")),
+            ("San Francisco, CA, US", ("USA", "California", "San Francisco")),
+            ("Guadalajara, JAL, MX", ("Mexico", "Jalisco", "Guadalajara")),
+            ("Toronto, ON", ("Canada", "Ontario", "Toronto")),
+        ],
+    )
+    def test_parses_api_formats(self, raw, expected):
+        assert parse_location_parts(raw) == expected
+
+    def test_ambiguous_abbreviations(self):
+        """
+        "CO" = Colombia o Colorado, "CA" = Canadá o California
+
+        Escenario:
+        - "Denver, CO": Denver no es lugar de Colombia → Colorado
+        - "San Francisco, CA" → California
+        - "CO" con hint Colombia → país
+        """
+        assert parse_location_parts("Denver, CO") == ("USA", "Colorado", "Denver")
+        assert parse_location_parts("San Francisco, CA") == ("USA", "California", "San Francisco")
+        assert parse_location_parts("CO", "Colombia") == ("Colombia", None, None)
+
+    def test_remote_and_empty_are_none(self):
+        assert parse_location("Remote") is None
+        assert parse_location("") is None
+        assert parse_location(None) is None
+        assert parse_location("Remote, US") == JobLocation(country="USA")
+
+    def test_throughput(self):
+        """
+        Miles de strings por segundo (caso real: pocas ubicaciones distintas)
+
+        Escenario:
+        - 20k strings, 2000 distintos
+        - < 0.5s
+        """
+        raws = [f"City{i % 2000}, {('CA', 'TX', 'NY', 'WA')[i % 4]}, US" for i in range(20000)]
+
+        start = time.perf_counter()
+        for raw in raws:
+            parse_location(raw)
+
+        assert time.perf_counter() - start < 0.5
+
+
+class TestFormatAndFilter:
+    """Tests para format_location() y filter_jobs_by_location()"""
+
+    def test_format_location_for_csv(self):
+        assert format_location(parse_location("Medellín, ANT, CO")) == "Medellín, Antioquia, Colombia"
+        assert format_location(parse_location("Lima, PE")) == "Lima, Peru"
+        assert format_location(None) == ""
+
+    def test_filter_by_country_keeps_remote_and_unknown(self):
+        """
+        Escenario:
+        - 4 jobs: Colombia, USA, USA remoto, sin ubicación
+        - Filtro country="CO" → se descarta solo el de USA presencial
+        """
+        def job(n, loc, remote=False):
+            return Job(title=f"Dev {n}", job_url=f"https://x.com/{n}", location=parse_location(loc), is_remote=remote)
+
+        jobs = [job(1, "ANT, CO"), job(2, "Austin, TX"), job(3, "Austin, TX", remote=True), job(4, None)]
+
+        kept = filter_jobs_by_location(jobs, country="CO")
+
+        assert [j.title for j in kept] == ["Dev 1", "Dev 3", "Dev 4"]
+
+    def test_filter_by_state_accepts_abbreviation(self):
+        jobs = [
+            Job(title="A", job_url="https://x.com/a", location=parse_location("Medellín, ANT, CO")),
+            Job(title="B", job_url="https://x.com/b", location=parse_location("Cali, VAC, CO")),
+        ]
+
+        kept = filter_jobs_by_location(jobs, country="Colombia", state="ANT", keep_unknown=False)
+
+        assert [j.title for j in kept] == ["A"]
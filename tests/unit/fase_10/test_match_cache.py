@@ -0,0 +1,190 @@
+"""
+Tests para backend/agents/match_cache.py
+
+Propósito: Verificar que un job ya puntuado para el mismo perfil no vuelve a Gemini
+Framework: pytest + mocking (sin API key ni red)
+"""
+
+import threading
+
+import pytest
+
+from database.models import Job
+from backend.agents import match_cache as match_cache_module
+from backend.agents.job_matcher import PROMPT_VERSION, MatchVerdict
+from backend.agents.match_cache import MatchCache, make_match_key, profile_hash
+
+
+VALUE = {"match_score": 85.0, "personalized_message": "Matches", "telegram_message": "✅ msg"}
+
+
+class TestMatchCache:
+    """Tests para MatchCache"""
+
+    def test_key_normalizes_url_and_profile(self):
+        """
+        Escenario:
+        - Misma vacante con tracking params / www, keywords en otro orden y mayúsculas
+        - Misma key; otra versión de prompt → otra key
+        """
+        a = Job(title="Dev", job_url="https://www.linkedin.com/jobs/view/1/?trk=abc")
+        b = Job(title="Dev", job_url="https://linkedin.com/jobs/view/1")
+
+        assert make_match_key(a, ["Python", "remote "], "USA", "1") == make_match_key(
+            b, ["remote", "python", "python"], " usa", "1"
+        )
+        assert make_match_key(a, ["python"], "USA", "1") != make_match_key(a, ["python"], "USA", "2")
+        assert profile_hash(["python"], "USA") != profile_hash(["python"], "Colombia")
+
+    def test_get_set_and_hit_rate(self, make_job):
+        cache = MatchCache()
+        key = make_match_key(make_job(1), ["python"], "USA", "1")
+
+        assert cache.get(key) is None
+        cache.set(key, VALUE)
+        assert cache.get(key) == VALUE
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"], stats["size"]) == (1, 1, 0.5, 1)
+
+    def test_expired_entries_are_evicted(self, monkeypatch, make_job):
+        cache = MatchCache(ttl_seconds=60)
+        key = make_match_key(make_job(1), ["python"], "USA", "1")
+        cache.set(key, VALUE)
+
+        now = match_cache_module.time.time()
+        monkeypatch.setattr(match_cache_module.time, "time", lambda: now + 61)
+
+        assert cache.get(key) is None
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["expired"] == 1
+
+    def test_persists_across_instances(self, tmp_path, make_job):
+        path = str(tmp_path / "match_cache.sqlite3")
+        key = make_match_key(make_job(1), ["python"], "USA", "1")
+
+        first = MatchCache(path=path)
+        first.set(key, VALUE)
+        first.close()
+
+        assert MatchCache(path=path).get(key) == VALUE
+
+    def test_get_many_and_set_many(self, make_job):
+        cache = MatchCache()
+        keys = [make_match_key(make_job(i), ["python"], "USA", "1") for i in range(3)]
+
+        cache.set_many([(keys[0], VALUE), (keys[1], dict(VALUE, match_score=40.0))])
+        found = cache.get_many(keys)
+
+        assert found == {keys[0]: VALUE, keys[1]: dict(VALUE, match_score=40.0)}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (2, 1, 2)
+
+    def test_disk_cache_uses_wal(self, tmp_path):
+        cache = MatchCache(path=str(tmp_path / "match_cache.sqlite3"))
+
+        assert cache._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_the_event_loop(self, make_job):
+        """
+        Escenario:
+        - aget_many() / aset_many() desde el event loop
+        - El SQLite corre en otro thread (el loop no espera al disco)
+        """
+        cache = MatchCache()
+        key = make_match_key(make_job(1), ["python"], "USA", "1")
+        threads = []
+        for name in ("get_many", "set_many"):
+            original = getattr(cache, name)
+
+            def spy(*args, _original=original):
+                threads.append(threading.get_ident())
+                return _original(*args)
+
+            setattr(cache, name, spy)
+
+        await cache.aset_many([(key, VALUE)])
+        assert await cache.aget_many([key]) == {key: VALUE}
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    def test_ttl_zero_disables(self, make_job):
+        cache = MatchCache(ttl_seconds=0)
+        key = make_match_key(make_job(1), ["python"], "USA", "1")
+        cache.set(key, VALUE)
+
+        assert cache.get(key) is None
+        assert cache.stats()["misses"] == 0
+
+
+class TestJobMatcherWithCache:
+    """JobMatcher + MatchCache"""
+
+    @pytest.fixture
+    def matcher_and_llm(self, mock_matcher):
+        matcher, batch_llm, _ = mock_matcher(cache=MatchCache())
+        return matcher, batch_llm
+
+    def test_cache_hits_skip_gemini(self, matcher_and_llm, make_job, raw_output, batch_response):
+        """
+        Escenario:
+        - 1ª búsqueda: 3 jobs → 1 llamada batch, se guardan
+        - 2ª búsqueda (otro usuario, mismo perfil): 2 de esos + 1 nuevo
+          → solo el nuevo va a Gemini
+        """
+        matcher, batch_llm = matcher_and_llm
+        jobs = [make_job(i) for i in range(4)]
+        batch_llm.invoke.return_value = raw_output(batch_response((1, 90), (2, 60), (3, 30)))
+        matcher.match_jobs_batch(jobs[:3], ["python"], "USA")
+
+        batch_llm.invoke.reset_mock()
+        matcher.structured_llm.invoke.return_value = raw_output(
+            MatchVerdict(match_score=50, reason="m")
+        )
+        second = [make_job(1), make_job(2), jobs[3]]
+        results = matcher.match_jobs_batch(second, ["Python"], "usa")
+
+        # 1 solo job pendiente → llamada individual, no batch
+        batch_llm.invoke.assert_not_called()
+        assert matcher.structured_llm.invoke.call_count == 1
+        assert [r.job for r in results] == second
+        assert [r.match_score for r in results] == [60, 30, 50]
+        assert matcher.cache.stats()["hits"] == 2
+
+    def test_error_results_are_not_cached(self, matcher_and_llm, make_job):
+        matcher, _ = matcher_and_llm
+        matcher.structured_llm.invoke.side_effect = RuntimeError("500 internal")
+
+        result = matcher.match_job(make_job(1), ["python"], "USA")
+
+        assert result.match_score == 0
+        assert matcher.cache.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_path_uses_cache(self, matcher_and_llm, make_job):
+        matcher, batch_llm = matcher_and_llm
+        job = make_job(1)
+        matcher.cache.set(make_match_key(job, ["python"], "USA", PROMPT_VERSION), VALUE)
+
+        result = await matcher.amatch_job(job, ["python"], "USA")
+
+        assert result.match_score == 85
+        assert result.job is job
+        matcher.structured_llm.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_batch_is_stored_in_one_transaction(
+        self, matcher_and_llm, make_job, raw_output, batch_response
+    ):
+        matcher, batch_llm = matcher_and_llm
+        batch_llm.ainvoke.return_value = raw_output(batch_response((1, 90), (2, 60), (3, 30)))
+        calls = []
+        original = matcher.cache.set_many
+        matcher.cache.set_many = lambda items: calls.append(len(items)) or original(items)
+
+        await matcher.amatch_jobs_batch([make_job(i) for i in range(3)], ["python"], "USA")
+
+        assert calls == [3]
+        assert matcher.cache.stats()["size"] == 3
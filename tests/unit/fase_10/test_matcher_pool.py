@@ -0,0 +1,165 @@
+"""
+Tests para backend/agents/matcher_pool.py
+
+Propósito: Verificar que los JobMatchers se construyen una sola vez, se
+reparten por carga y comparten el límite de concurrencia hacia Gemini
+Framework: pytest + mocking (sin API key ni red)
+"""
+
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from database.models import Job
+from backend.agents.job_matcher import JobMatcher, MatchVerdict
+from backend.agents.llm_replay import ReplayLLM
+from backend.agents.llm_scheduler import LLMScheduler
+from backend.agents.match_cache import MatchCache
+from backend.agents.matcher_pool import MatcherPool
+
+
+def make_llm():
+    """Chat model mock; el cliente expone close() / aio.aclose() como google-genai"""
+    llm = MagicMock()
+    llm.client.aio.aclose = AsyncMock()
+    return llm
+
+
+def make_factory(built):
+    def factory(semaphore):
+        matcher = JobMatcher(llm=make_llm(), cache=MatchCache(ttl_seconds=0), semaphore=semaphore)
+        built.append(matcher)
+        return matcher
+
+    return factory
+
+
+class TestMatcherPool:
+    """Tests para MatcherPool"""
+
+    @pytest.mark.asyncio
+    async def test_matchers_are_built_once(self):
+        """
+        Escenario:
+        - Pool de 2 → 2 JobMatchers construidos al crear el pool
+        - 10 /vacantes después: sigue habiendo 2 (cero construcción por request)
+        """
+        built = []
+        pool = MatcherPool(size=2, factory=make_factory(built))
+
+        seen = set()
+        for _ in range(10):
+            async with pool.acquire() as matcher:
+                seen.add(id(matcher))
+
+        assert len(built) == 2
+        assert seen == {id(m) for m in built}
+        assert pool.stats()["acquisitions"] == 10
+        assert pool.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_picks_least_loaded_without_waiting(self):
+        built = []
+        pool = MatcherPool(size=2, factory=make_factory(built))
+
+        async with pool.acquire() as first, pool.acquire() as second, pool.acquire() as third:
+            assert first is not second
+            assert third in (first, second)
+            assert pool.stats()["in_flight"] == 3
+
+        assert pool.stats()["peak_in_flight"] == 3
+
+    @pytest.mark.asyncio
+    async def test_semaphore_is_shared_across_matchers(self):
+        """
+        Escenario:
+        - 2 matchers, max_concurrency=1
+        - 2 requests simultáneos (uno en cada matcher) → nunca 2 llamadas a Gemini a la vez
+        """
+        built = []
+        pool = MatcherPool(size=2, max_concurrency=1, factory=make_factory(built))
+        in_flight = peak = 0
+
+        async def tracked(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"raw": SimpleNamespace(usage_metadata={}), "parsed": MatchVerdict(match_score=50, reason="ok"), "parsing_error": None}
+
+        for matcher in built:
+            matcher.structured_llm.ainvoke = AsyncMock(side_effect=tracked)
+
+        async def one_request(n):
+            async with pool.acquire() as matcher:
+                job = Job(id=str(n), title="Dev", job_url=f"https://x.com/{n}")
+                return await matcher.amatch_job(job, ["python"], "USA")
+
+        results = await asyncio.gather(one_request(1), one_request(2))
+
+        assert [r.match_score for r in results] == [50, 50]
+        assert peak == 1
+        assert pool.stats()["usage"]["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients(self):
+        built = []
+        pool = MatcherPool(size=2, factory=make_factory(built))
+
+        await pool.aclose()
+
+        for matcher in built:
+            matcher.llm.client.aio.aclose.assert_awaited_once()
+            matcher.llm.client.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            async with pool.acquire():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stream_returns_matcher_before_consumer_finishes(self):
+        """
+        Escenario:
+        - /vacantes toma el 1er resultado y se pausa (manda la tarjeta, sleep)
+        - El matcher ya volvió al pool: in_flight 0 mientras el consumidor sigue
+        """
+        def factory(semaphore):
+            replay = ReplayLLM(latency_scale=0, on_miss="synthesize")
+            return JobMatcher(llm=replay, cache=MatchCache(ttl_seconds=0), semaphore=semaphore)
+
+        pool = MatcherPool(size=1, factory=factory)
+        jobs = [Job(id=str(n), title=f"Dev {n}", job_url=f"https://x.com/{n}") for n in range(3)]
+
+        async with aclosing(pool.astream_jobs_batch(jobs, ["python"], "USA")) as results:
+            first = await results.__anext__()
+            await asyncio.sleep(0.01)  # consumidor ocupado
+            assert pool.stats()["in_flight"] == 0
+            rest = [result async for result in results]
+
+        assert sorted(r.job.id for r in [first, *rest]) == ["0", "1", "2"]
+        assert pool.stats()["acquisitions"] == 1
+
+    def test_default_factory_uses_pool_settings(self, tmp_path):
+        """
+        Escenario:
+        - Factory por defecto con backend replay (sin API key) y budget de 20 tokens
+        - Cada matcher recibe su propio ReplayLLM y el budget del pool
+        """
+        pool = MatcherPool(
+            size=2,
+            scheduler=LLMScheduler(),
+            description_tokens=20,
+            backend="replay",
+            cassette=str(tmp_path / "missing.jsonl"),
+        )
+
+        first, second = pool._matchers
+        assert isinstance(first.llm, ReplayLLM) and first.llm is not second.llm
+        assert first.condenser.token_budget == 20
+
+    def test_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            MatcherPool(size=0, factory=make_factory([]))
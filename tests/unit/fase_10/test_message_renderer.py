@@ -0,0 +1,131 @@
+"""
+Tests para backend/agents/message_renderer.py
+
+Propósito: Verificar que el mensaje de Telegram se arma localmente con los
+datos del Job y que ningún valor rompe el Markdown de Telegram
+Framework: pytest
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from database.models import Job
+from backend.agents.job_matcher import PROMPT_VERSION, JobMatcher
+from backend.agents.match_cache import MatchCache, make_match_key
+from backend.agents.message_renderer import (
+    MessageTemplate,
+    escape_markdown,
+    escape_url,
+    render_job_message,
+)
+
+
+def make_job(**overrides):
+    fields = dict(
+        title="Senior Python Developer",
+        company="Acme Corp",
+        job_url="https://indeed.com/jobs/123",
+        is_remote=True,
+        job_type="contract",
+        source="indeed",
+    )
+    fields.update(overrides)
+    return Job(**fields)
+
+
+class TestEscaping:
+    """Tests para escape_markdown() / escape_url()"""
+
+    def test_escapes_markdown_v1_specials(self):
+        assert escape_markdown("senior_dev *remote* `x` [y]") == r"senior\_dev \*remote\* \`x\` \[y]"
+
+    def test_plain_text_unchanged(self):
+        assert escape_markdown("Matches porque: ✅ Python (skill exacto)") == (
+            "Matches porque: ✅ Python (skill exacto)"
+        )
+
+    def test_url_parenthesis_and_spaces(self):
+        assert escape_url(" https://x.com/jobs/a b(1) ") == "https://x.com/jobs/a%20b(1%29"
+
+
+class TestMessageTemplate:
+    """Tests para MessageTemplate"""
+
+    def test_fields_parsed_once(self):
+        template = MessageTemplate("{a} y {b}", raw={"b"})
+
+        assert template.fields == ["a", "b"]
+        assert template.render(a="x_y", b="*bold*") == r"x\_y y *bold*"
+
+    def test_missing_field_raises(self):
+        with pytest.raises(KeyError):
+            MessageTemplate("{a}").render()
+
+
+class TestRenderJobMessage:
+    """Tests para render_job_message()"""
+
+    def test_same_format_as_examples(self):
+        message = render_job_message(make_job(), 85, "Matches porque: ✅ Python")
+
+        assert message == (
+            "✅ Senior Python Developer\n"
+            "🏢 Acme Corp\n"
+            "📍 Remote | 💼 contract\n"
+            "⭐ Score: 85/100\n\n"
+            "🤖 Matches porque: ✅ Python\n\n"
+            "🔗 [Ver en Indeed](https://indeed.com/jobs/123)"
+        )
+
+    def test_ranked_message_has_single_real_link(self):
+        """
+        Escenario:
+        - Mensaje para cmd_vacantes (rank=2)
+        - Encabezado "#2" y UN solo link: el real del job (antes se borraban
+          los links de ejemplo de Gemini con una regex)
+        """
+        message = render_job_message(make_job(), 40, "No matchea", rank=2)
+
+        assert message.startswith("*#2*\n❌ Senior Python Developer")
+        assert message.count("](") == 1
+        assert message.endswith("🔗 [*Aplicar Ahora →*](https://indeed.com/jobs/123)")
+
+    def test_user_and_model_text_is_escaped(self):
+        job = make_job(title="ML_Engineer *Senior*", company="[Acme]_Labs", job_type=None)
+
+        message = render_job_message(job, 70, "Usa `pytest` y *Django*\nremote_first", rank=1)
+
+        assert r"ML\_Engineer \*Senior\*" in message
+        assert r"\[Acme]\_Labs" in message
+        assert "💼 N/A" in message
+        assert r"🤖 Usa \`pytest\` y \*Django\* remote\_first" in message
+        # Solo quedan sin escapar el encabezado y el link (markup propio)
+        unescaped_stars = message.replace(r"\*", "").count("*")
+        assert unescaped_stars == 4
+
+    def test_job_without_url_has_no_link(self):
+        message = render_job_message(make_job(job_url=""), 60, "ok")
+
+        assert "🔗" not in message
+
+
+class TestCachedMessagesAreRerendered:
+    """Los hits de MatchCache usan el template actual, no el mensaje guardado"""
+
+    def test_cached_telegram_message_is_rebuilt(self):
+        job = make_job(title="Data_Engineer")
+        matcher = JobMatcher(llm=MagicMock(), cache=MatchCache())
+        matcher.cache.set(
+            make_match_key(job, ["python"], "USA", PROMPT_VERSION),
+            {
+                "match_score": 80,
+                "personalized_message": "ok",
+                "telegram_message": "✅ Data_Engineer [link de ejemplo](https://indeed.com/jobs/456)",
+            },
+        )
+
+        result = matcher.match_job(job, ["python"], "USA")
+
+        assert result.telegram_message == render_job_message(job, 80, "ok")
+        assert r"Data\_Engineer" in result.telegram_message
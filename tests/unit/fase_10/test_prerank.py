@@ -0,0 +1,80 @@
+"""
+Tests para backend/agents/prerank.py
+
+Propósito: Verificar que el pre-ranking BM25 elige los jobs relevantes para Gemini
+Framework: pytest
+"""
+
+import time
+
+from database.models import Job
+from backend.agents.prerank import BM25Ranker, query_terms, rank_jobs, tokenize
+
+
+def make_job(n, title, description=""):
+    return Job(title=title, job_url=f"https://x.com/{n}", description=description)
+
+
+class TestTokenize:
+    """Tests para tokenize() / query_terms()"""
+
+    def test_tokenize_normalizes(self):
+        assert tokenize("Senior Python/Django Developer") == ["senior", "python", "django", "developer"]
+        assert tokenize("Desarrollador C++ y C#") == ["desarrollador", "c++", "c#"]
+        assert tokenize("Ingeniería") == ["ingenieria"]
+
+    def test_query_terms_dedupes_multiword_keywords(self):
+        assert query_terms(["Python Developer", "python", "Django"]) == ["python", "developer", "django"]
+
+
+class TestBM25Ranker:
+    """Tests para BM25Ranker"""
+
+    def test_relevant_jobs_rank_first(self):
+        """
+        Escenario:
+        - 6 jobs, los relevantes al final (orden de plataforma)
+        - keywords python + django → el job con ambos en el título primero
+        """
+        jobs = [
+            make_job(1, "Java Developer", "Spring Boot microservices"),
+            make_job(2, "Sales Manager", "B2B sales"),
+            make_job(3, "Frontend Developer", "React and TypeScript"),
+            make_job(4, "Data Analyst", "SQL, some Python scripting"),
+            make_job(5, "Backend Engineer", "Python APIs with Django REST framework"),
+            make_job(6, "Python Django Developer", "Build Django apps in Python"),
+        ]
+
+        top = rank_jobs(jobs, ["python", "django"], top_n=3)
+
+        assert [j.title for j in top] == ["Python Django Developer", "Backend Engineer", "Data Analyst"]
+
+    def test_ties_keep_original_order(self):
+        """Sin matches (score 0) se conserva el orden de plataforma"""
+        jobs = [make_job(i, f"Job {i}") for i in range(4)]
+
+        assert rank_jobs(jobs, ["rust"]) == jobs
+        assert rank_jobs(jobs, []) == jobs
+
+    def test_title_weight(self):
+        """Un término en el título pesa más que en la descripción"""
+        in_title = make_job(1, "Python Developer", "backend services")
+        in_description = make_job(2, "Backend Developer", "python services")
+
+        scores = BM25Ranker().score([in_description, in_title], ["python"])
+
+        assert scores[1] > scores[0] > 0
+
+    def test_scores_hundreds_of_jobs_fast(self):
+        """
+        Escenario:
+        - 300 jobs con descripciones de ~3000 caracteres
+        - Ranking completo < 100ms (objetivo: pocos ms para 25-75 jobs reales)
+        """
+        description = "We build backend services with Python, Django and PostgreSQL on AWS. " * 40
+        jobs = [make_job(i, f"Developer {i}", description) for i in range(300)]
+
+        start = time.perf_counter()
+        rank_jobs(jobs, ["python", "django", "aws"], top_n=5)
+
+        assert time.perf_counter() - start < 0.1
@@ -0,0 +1,89 @@
+"""
+Tests para backend/scrapers/cache.py
+
+Propósito: Verificar caché TTL + LRU + nivel de disco
+Framework: pytest (sin API real)
+"""
+
+import time
+
+from backend.scrapers.cache import SearchCache, make_cache_key
+
+
+RESPONSE = {"count": 1, "jobs": [{"title": "Python Dev", "job_url": "https://x.com/1"}]}
+
+
+class TestCacheKey:
+    """Tests para normalización de keys"""
+
+    def test_key_is_normalized(self):
+        """Mayúsculas y espacios extra no generan entradas distintas"""
+        assert make_cache_key("Python  Remote", "USA", "Indeed") == make_cache_key(
+            "python remote", "usa", "indeed"
+        )
+
+    def test_key_distinguishes_filters(self):
+        assert make_cache_key("python", "USA", "indeed", is_remote=True) != make_cache_key(
+            "python", "USA", "indeed", is_remote=False
+        )
+
+
+class TestSearchCache:
+    """Tests para SearchCache"""
+
+    def test_hit_and_miss_counters(self):
+        cache = SearchCache()
+        key = make_cache_key("python", "USA", "indeed")
+
+        assert cache.get(key) is None
+        cache.set(key, RESPONSE)
+        assert cache.get(key) == RESPONSE
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_ttl_expires(self):
+        cache = SearchCache(ttl_seconds=0.05)
+        key = make_cache_key("python", "USA", "indeed")
+
+        cache.set(key, RESPONSE)
+        time.sleep(0.1)
+
+        assert cache.get(key) is None
+
+    def test_lru_eviction(self):
+        """
+        Al superar max_entries se desaloja la menos usada
+
+        Escenario:
+        - max_entries=2, guardar a, b → leer a → guardar c
+        - b (la menos usada) debe salir
+        """
+        cache = SearchCache(max_entries=2)
+        a, b, c = (make_cache_key(k, "USA", "indeed") for k in ("a", "b", "c"))
+
+        cache.set(a, RESPONSE)
+        cache.set(b, RESPONSE)
+        cache.get(a)
+        cache.set(c, RESPONSE)
+
+        assert cache.get(b) is None
+        assert cache.get(a) == RESPONSE
+        assert cache.stats()["evictions"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """
+        Nivel de disco: un hit sobrevive a una nueva instancia (reinicio)
+        """
+        path = str(tmp_path / "cache.sqlite")
+        key = make_cache_key("python", "USA", "indeed")
+
+        first = SearchCache(disk_path=path)
+        first.set(key, RESPONSE)
+        first.close()
+
+        second = SearchCache(disk_path=path)
+        assert second.get(key) == RESPONSE
+        assert second.stats()["disk_hits"] == 1
+        second.close()
@@ -0,0 +1,83 @@
+"""
+Tests para backend/scrapers/singleflight.py
+
+Propósito: Verificar que búsquedas idénticas en curso comparten 1 llamada
+Framework: pytest + pytest-asyncio
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.scrapers.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestAsyncSingleFlight:
+    """Tests para la variante async"""
+
+    @pytest.mark.asyncio
+    async def test_identical_keys_share_one_call(self):
+        """
+        10 usuarios con la misma query → 1 llamada upstream
+
+        Escenario:
+        - 10 corrutinas piden la misma key a la vez
+        - fetch() se ejecuta 1 sola vez, todas reciben el mismo resultado
+        """
+        flights = AsyncSingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"jobs": [1, 2, 3]}
+
+        results = await asyncio.gather(*(flights.do("python-usa", fetch) for _ in range(10)))
+
+        assert calls == 1
+        assert all(r == {"jobs": [1, 2, 3]} for r in results)
+        assert flights.stats() == {"in_flight": 0, "coalesced": 9}
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_waiters(self):
+        flights = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise TimeoutError("Read timed out")
+
+        results = await asyncio.gather(
+            *(flights.do("k", fetch) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, TimeoutError) for r in results)
+
+
+class TestSingleFlight:
+    """Tests para la variante sync (hilos)"""
+
+    def test_threads_share_one_call(self):
+        flights = SingleFlight()
+        calls = 0
+        results = []
+
+        def fetch():
+            nonlocal calls
+            calls += 1
+            time.sleep(0.1)
+            return "data"
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flights.do("k", fetch)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == 1
+        assert results == ["data"] * 5
@@ -0,0 +1,268 @@
+"""
+Tests para JobMatcher.astream_jobs_batch() (entrega progresiva de /vacantes)
+
+Propósito: Verificar que cada resultado sale apenas está listo (caché,
+entradas del batch a medida que Gemini las escribe, fallback por job) sin
+cambiar los scores respecto de amatch_jobs_batch()
+Framework: pytest + pytest-asyncio (sin API key ni red)
+"""
+
+import asyncio
+import json
+from contextlib import aclosing
+from operator import itemgetter
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnablePassthrough
+
+from backend.agents.job_matcher import BatchMatchResponse, JobMatcher, MatchVerdict
+from backend.agents.llm_replay import RecordingLLM, ReplayLLM, cassette_key
+from backend.agents.llm_scheduler import LLMScheduler
+from backend.agents.match_cache import MatchCache
+
+
+async def collect(stream):
+    return [result async for result in stream]
+
+
+class StreamingFakeChat(GenericFakeChatModel):
+    """Chat model de LangChain que streamea token por token, con la misma
+    cadena include_raw que ChatGoogleGenerativeAI.with_structured_output()"""
+
+    def with_structured_output(self, schema, method=None, include_raw=False):
+        parser = PydanticOutputParser(pydantic_object=schema)
+        with_parsed = RunnablePassthrough.assign(
+            parsed=itemgetter("raw") | parser, parsing_error=lambda _: None
+        ).with_fallbacks([RunnablePassthrough.assign(parsed=lambda _: None)], exception_key="parsing_error")
+        return {"raw": self} | with_parsed
+
+
+class TestAstreamJobsBatch:
+    """Tests para astream_jobs_batch()"""
+
+    @pytest.mark.asyncio
+    async def test_results_arrive_progressively(self, make_job, make_matcher):
+        """
+        Escenario:
+        - ReplayLLM con 0.5s de latencia por llamada, repartida en el stream
+        - 5 jobs en 1 batch → el 1er resultado llega mucho antes que el último
+        - Mismos scores que amatch_jobs_batch()
+        """
+        jobs = [make_job(i) for i in range(1, 6)]
+        replay = ReplayLLM(latency_scale=0.5, on_miss="synthesize")
+        matcher = make_matcher(replay)
+        loop = asyncio.get_running_loop()
+        start, arrivals, results = loop.time(), [], []
+
+        async for result in matcher.astream_jobs_batch(jobs, ["python"], "USA"):
+            arrivals.append(loop.time() - start)
+            results.append(result)
+
+        assert len(results) == 5
+        assert arrivals[0] < arrivals[-1] / 2
+        assert replay.stats()["calls"] == 1
+
+        expected = await make_matcher(ReplayLLM(latency_scale=0, on_miss="synthesize")).amatch_jobs_batch(
+            jobs, ["python"], "USA"
+        )
+        by_id = {r.job.id: r.match_score for r in expected}
+        assert {r.job.id: r.match_score for r in results} == by_id
+
+    @pytest.mark.asyncio
+    async def test_langchain_token_stream(self, make_job, make_matcher):
+        """
+        Escenario:
+        - Runnable de LangChain real (include_raw): los tokens llegan por
+          astream_events, el parsed final por on_chain_end
+        - Gemini omitió el job 3 → sale por el fallback individual
+        """
+        text = json.dumps(
+            {"results": [{"index": i, "match_score": 50 + i, "reason": f"razón número {i}"} for i in (1, 2, 4)]}
+        )
+        single = json.dumps({"match_score": 33, "reason": "solo"})
+        llm = StreamingFakeChat(messages=iter([AIMessage(content=text), AIMessage(content=single)]))
+        jobs = [make_job(i) for i in range(1, 5)]
+
+        results = await collect(make_matcher(llm).astream_jobs_batch(jobs, ["python"], "USA"))
+
+        assert [(r.job.id, r.match_score) for r in results] == [
+            ("in-1", 51), ("in-2", 52), ("in-4", 54), ("in-3", 33)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_jobs_come_first_without_gemini(self, make_job, make_matcher):
+        cache = MatchCache()
+        replay = ReplayLLM(latency_scale=0, on_miss="synthesize")
+        matcher = make_matcher(replay, cache=cache)
+        jobs = [make_job(i) for i in range(1, 4)]
+        await collect(matcher.astream_jobs_batch(jobs[:1], ["python"], "USA"))
+
+        results = await collect(matcher.astream_jobs_batch(jobs, ["python"], "USA"))
+
+        assert results[0].job is jobs[0]
+        assert {r.job.id for r in results} == {"in-1", "in-2", "in-3"}
+        assert replay.stats()["calls"] == 2  # 1 individual antes + 1 batch para 2 jobs
+
+    @pytest.mark.asyncio
+    async def test_model_without_stream_uses_ainvoke(self, make_job, mock_matcher, raw_output, batch_response):
+        matcher, batch_llm, structured_llm = mock_matcher(
+            batch=raw_output(batch_response((1, 70), (2, 70))),
+            single=raw_output(MatchVerdict(match_score=10, reason="x")),
+        )
+
+        results = await collect(matcher.astream_jobs_batch([make_job(1), make_job(2)], ["python"], "USA"))
+
+        assert [r.match_score for r in results] == [70, 70]
+        batch_llm.ainvoke.assert_awaited_once()
+        structured_llm.ainvoke.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_falls_back_per_job(self, make_job, make_matcher):
+        replay = ReplayLLM(latency_scale=0, error_rate=1.0, on_miss="synthesize")
+
+        results = await collect(
+            make_matcher(replay).astream_jobs_batch([make_job(1), make_job(2)], ["python"], "USA")
+        )
+
+        assert sorted(r.job.id for r in results) == ["in-1", "in-2"]
+        assert all(r.match_score == 0 for r in results)
+        assert replay.stats()["errors"] == 3  # 1 batch + 2 individuales
+
+    @pytest.mark.asyncio
+    async def test_without_quota_all_jobs_get_local_score(self, make_job, make_matcher):
+        scheduler = LLMScheduler(rpm=0, rpd=1, tpm=0)
+        replay = ReplayLLM(latency_scale=0, on_miss="synthesize")
+        matcher = make_matcher(replay, scheduler=scheduler)
+        jobs = [make_job(1), make_job(2)]
+        await collect(matcher.astream_jobs_batch(jobs, ["python"], "USA"))
+
+        results = await collect(matcher.astream_jobs_batch(jobs, ["python"], "USA"))
+
+        assert replay.stats()["calls"] == 1
+        assert all("Estimado rápido" in r.personalized_message for r in results)
+
+    @pytest.mark.asyncio
+    async def test_streamed_usage_reaches_ledger(self, make_job, make_matcher):
+        jobs = [make_job(1), make_job(2)]
+        messages = make_matcher(ReplayLLM()).build_batch_messages(jobs, ["python"], "USA")
+        entry = {
+            "key": cassette_key(BatchMatchResponse, messages),
+            "parsed": {"results": [{"index": i, "match_score": 60, "reason": "grabado"} for i in (1, 2)]},
+            "usage": {"input_tokens": 420, "output_tokens": 40},
+            "latency": 0.0,
+        }
+        matcher = make_matcher(ReplayLLM(entries=[entry], latency_scale=0))
+
+        results = await collect(matcher.astream_jobs_batch(jobs, ["python"], "USA"))
+
+        assert [r.match_score for r in results] == [60, 60]
+        assert matcher.usage == {"calls": 1, "input_tokens": 420, "output_tokens": 40}
+        assert matcher.ledger.last_call.kind == "batch"
+
+    @pytest.mark.asyncio
+    async def test_semaphore_is_free_while_consumer_is_paused(self, make_job, make_matcher):
+        """
+        Escenario:
+        - Semáforo de 1 llamada; el consumidor toma el 1er resultado y se pausa
+          (como /vacantes mandando una tarjeta)
+        - Otra llamada a Gemini entra igual: el stream ya soltó el semáforo
+        """
+        semaphore = asyncio.Semaphore(1)
+        replay = ReplayLLM(latency_scale=0, on_miss="synthesize")
+        matcher = make_matcher(replay, semaphore=semaphore)
+        stream = matcher.astream_jobs_batch([make_job(i) for i in range(1, 4)], ["python"], "USA")
+
+        await stream.__anext__()
+        await asyncio.sleep(0.01)  # consumidor ocupado
+        other = await asyncio.wait_for(matcher.amatch_job(make_job(9), ["python"], "USA"), timeout=1)
+
+        assert not semaphore.locked()
+        assert other.job.id == "in-9"
+        assert len(await collect(stream)) == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_cancels_gemini_call(self, make_job, make_matcher):
+        """
+        Escenario:
+        - El consumidor corta después del 1er resultado (aclosing en /vacantes)
+        - La llamada a Gemini que seguía streameando se cancela, no queda colgada
+        """
+        replay = ReplayLLM(latency_scale=0.5, on_miss="synthesize")
+        matcher = make_matcher(replay)
+        before = asyncio.all_tasks()
+
+        async with aclosing(matcher.astream_jobs_batch([make_job(i) for i in range(1, 6)], ["python"], "USA")) as stream:
+            async for _ in stream:
+                break
+        await asyncio.sleep(0)
+
+        assert asyncio.all_tasks() == before
+
+    @pytest.mark.asyncio
+    async def test_recorded_stream_replays_offline(self, tmp_path, make_job, make_matcher):
+        """
+        Escenario:
+        - GEMINI_BACKEND=record: RecordingLLM sobre un modelo que streamea
+        - El batch streameado se graba (1 entrada) y ReplayLLM lo reproduce
+          sin misses, con los mismos scores
+        """
+        path = str(tmp_path / "stream.cassette.jsonl")
+        text = json.dumps(
+            {"results": [{"index": i, "match_score": 40 + i, "reason": f"razón {i}"} for i in (1, 2, 3)]}
+        )
+        recorder = RecordingLLM(StreamingFakeChat(messages=iter([AIMessage(content=text)])), path)
+        jobs = [make_job(i) for i in range(1, 4)]
+
+        matcher = make_matcher(recorder)
+        assert JobMatcher._supports_streaming(matcher.batch_llm)  # el record no apaga el stream
+
+        recorded = await collect(matcher.astream_jobs_batch(jobs, ["python"], "USA"))
+        replay = ReplayLLM(path, latency_scale=0)
+        replayed = await collect(make_matcher(replay).astream_jobs_batch(jobs, ["python"], "USA"))
+
+        assert recorder.recorded == 1
+        assert [r.match_score for r in recorded] == [41, 42, 43]
+        assert [r.match_score for r in replayed] == [41, 42, 43]
+        assert replay.stats()["hits"] == 1 and replay.stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_recording_non_streaming_model(self, tmp_path, make_job, make_matcher):
+        """El modelo real sin astream_events: RecordingLLM cae a ainvoke() y graba igual"""
+        path = str(tmp_path / "c.jsonl")
+        inner = ReplayLLM(latency_scale=0, on_miss="synthesize").with_structured_output(
+            BatchMatchResponse, include_raw=True
+        )
+        llm = MagicMock()
+        llm.with_structured_output.return_value = SimpleNamespace(ainvoke=inner.ainvoke)
+        recorder = RecordingLLM(llm, path)
+        messages = make_matcher(ReplayLLM()).build_batch_messages([make_job(1), make_job(2)], ["python"], "USA")
+
+        runnable = recorder.with_structured_output(BatchMatchResponse, include_raw=True)
+        events = [event async for event in runnable.astream_events(messages)]
+
+        assert [event["event"] for event in events] == ["on_chain_end"]
+        assert recorder.recorded == 1
+
+
+class TestCompleteScores:
+    """Tests para el parseo del JSON batch a medio escribir"""
+
+    def test_only_closed_entries_count(self, make_job):
+        jobs = [make_job(i) for i in range(1, 4)]
+        text = '{"results": [{"index": 1, "match_score": 80, "reason": "ok"}, {"index": 2, "match_score": 4'
+
+        scores = JobMatcher._complete_scores(jobs, text)
+
+        assert list(scores) == [1]
+        assert scores[1].match_score == 80
+
+    def test_garbage_and_out_of_range(self, make_job):
+        jobs = [make_job(1)]
+
+        assert JobMatcher._complete_scores(jobs, "") == {}
+        assert JobMatcher._complete_scores(jobs, '{"results": [{"index": 7, "match_score": 1, "reason": "x"}, {') == {}
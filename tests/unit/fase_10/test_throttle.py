@@ -0,0 +1,92 @@
+"""
+Tests para backend/scrapers/throttle.py
+
+Propósito: Verificar token bucket + AIMD por plataforma
+Framework: pytest (sin API real)
+"""
+
+import pytest
+
+from backend.scrapers.throttle import (
+    PlatformThrottle,
+    ThrottleLimits,
+    ThrottleRegistry,
+    is_backoff_error,
+)
+
+
+LIMITS = ThrottleLimits(rate=10.0, burst=2, min_rate=1.0, max_rate=20.0, increase_step=1.0)
+
+
+class TestPlatformThrottle:
+    """Tests para el token bucket"""
+
+    def test_burst_passes_without_waiting(self):
+        """
+        Carga baja: el burst no espera
+
+        Escenario:
+        - burst=2 → las primeras 2 búsquedas salen de inmediato
+        - La 3ra debe esperar ~1/rate
+        """
+        throttle = PlatformThrottle("indeed", LIMITS)
+
+        assert throttle.acquire() == 0
+        assert throttle.acquire() == 0
+        assert throttle.acquire() == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_async_acquire_waits(self):
+        """aacquire() respeta el mismo bucket que acquire()"""
+        throttle = PlatformThrottle("indeed", LIMITS)
+
+        await throttle.aacquire()
+        await throttle.aacquire()
+        assert await throttle.aacquire() > 0
+
+    def test_aimd_adapts_rate(self):
+        """
+        Éxito sube la tasa de a un paso, fallo la reduce a la mitad
+
+        Escenario:
+        - rate=10 → on_failure → 5 → on_success → 6
+        - Nunca baja de min_rate ni sube de max_rate
+        """
+        throttle = PlatformThrottle("indeed", LIMITS)
+
+        throttle.on_failure()
+        assert throttle.rate == 5.0
+        throttle.on_success()
+        assert throttle.rate == 6.0
+
+        for _ in range(10):
+            throttle.on_failure()
+        assert throttle.rate == LIMITS.min_rate
+
+        for _ in range(50):
+            throttle.on_success()
+        assert throttle.rate == LIMITS.max_rate
+
+
+class TestThrottleRegistry:
+    """Tests para el registry por plataforma"""
+
+    def test_one_throttle_per_platform(self):
+        registry = ThrottleRegistry()
+
+        assert registry.get("indeed") is registry.get("indeed")
+        assert registry.get("indeed") is not registry.get("linkedin")
+
+    def test_backoff_errors(self):
+        """Timeouts y 429 reducen la tasa; otros errores no"""
+        import requests
+
+        too_many = requests.Response()
+        too_many.status_code = 429
+        bad_request = requests.Response()
+        bad_request.status_code = 400
+
+        assert is_backoff_error(requests.Timeout())
+        assert is_backoff_error(requests.HTTPError(response=too_many))
+        assert not is_backoff_error(requests.HTTPError(response=bad_request))
+        assert not is_backoff_error(ValueError("x"))
@@ -0,0 +1,120 @@
+"""
+Tests para el prefijo estático de JobMatcher y backend/agents/token_ledger.py
+
+Propósito: Verificar que instrucciones + EXAMPLES viajan como system
+instruction idéntica en cada llamada, que el mensaje por llamada lleva solo
+job + perfil, y que el ledger reporta tokens por llamada y por día
+Framework: pytest + mocking (sin API key ni red)
+"""
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from backend.agents.job_matcher import MatchVerdict
+from backend.agents.token_ledger import TokenLedger
+
+
+@pytest.fixture
+def ledger_matcher(mock_matcher, raw_output, batch_response):
+    """Individual: 300 input (200 cacheados) + 20 output; batch de 3 jobs: 500 + 60"""
+
+    def build(ledger):
+        return mock_matcher(
+            batch=raw_output(batch_response((1, 60), (2, 60), (3, 60)), input_tokens=500, output_tokens=60),
+            single=raw_output(MatchVerdict(match_score=70, reason="ok"), input_tokens=300, cache_read=200),
+            ledger=ledger,
+        )
+
+    return build
+
+
+class TestStaticPrefix:
+    """El few-shot va una sola vez como system instruction"""
+
+    def test_single_call_sends_system_prefix_and_delta(self, ledger_matcher, make_job):
+        """
+        Escenario:
+        - 2 jobs distintos, 1 llamada cada uno
+        - El SystemMessage es el MISMO objeto en ambas (prefijo idéntico)
+        - El HumanMessage lleva solo el job + perfil, sin los EXAMPLES
+        """
+        matcher, _, structured_llm = ledger_matcher(TokenLedger())
+
+        matcher.match_job(make_job(1), ["python"], "USA")
+        matcher.match_job(make_job(2), ["python"], "USA")
+
+        (first,), (second,) = [c.args for c in structured_llm.invoke.call_args_list]
+        assert isinstance(first[0], SystemMessage) and first[0] is second[0]
+        assert "Acme Corp" in first[0].content  # EXAMPLES en el prefijo
+        assert isinstance(first[1], HumanMessage)
+        assert "Python Developer 1" in first[1].content
+        assert "Acme Corp" not in first[1].content
+        assert "Python Developer 2" in second[1].content
+
+    def test_batch_call_sends_batch_prefix_and_delta(self, ledger_matcher, make_job):
+        matcher, batch_llm, _ = ledger_matcher(TokenLedger())
+
+        matcher.match_jobs_batch([make_job(i) for i in (1, 2, 3)], ["python"], "USA")
+
+        system, human = batch_llm.invoke.call_args.args[0]
+        assert "Ejemplos de calibración" in system.content
+        assert "Ejemplos de calibración" not in human.content
+        assert "JOBS (3)" in human.content
+
+    def test_delta_is_much_smaller_than_prefix(self, ledger_matcher, make_job):
+        matcher, _, _ = ledger_matcher(TokenLedger())
+
+        system, human = matcher.build_messages(make_job(1), ["python"], "USA")
+
+        assert len(human.content) * 2 < len(system.content)
+
+
+class TestTokenLedger:
+    """Tests para TokenLedger"""
+
+    def test_matcher_records_each_call(self, ledger_matcher, make_job):
+        ledger = TokenLedger()
+        matcher, _, _ = ledger_matcher(ledger)
+
+        matcher.match_job(make_job(1), ["python"], "USA")
+        matcher.match_jobs_batch([make_job(i) for i in (2, 3, 4)], ["python"], "USA")
+
+        report = ledger.report()
+        assert report["per_call"]["calls"] == 2
+        today = report["today"]
+        assert (today["calls"], today["jobs"]) == (2, 4)
+        assert today["input_tokens"] == 800
+        assert today["cached_tokens"] == 200
+        assert today["output_tokens"] == 80
+        assert today["cached_share"] == 0.25
+        assert ledger.last_call.kind == "batch"
+
+    def test_per_day_buckets(self):
+        now = [86400 * 100 + 10]
+        ledger = TokenLedger(clock=lambda: now[0])
+        ledger.record("single", 1, prefix_tokens=200, delta_tokens=50, usage={"input_tokens": 250})
+        now[0] += 86400
+        ledger.record("single", 1, prefix_tokens=200, delta_tokens=50, usage={"input_tokens": 250})
+        ledger.record("single", 1, prefix_tokens=200, delta_tokens=50, usage={"input_tokens": 250})
+
+        report = ledger.report()
+        assert [d["calls"] for d in report["days"].values()] == [1, 2]
+        assert report["today"]["calls"] == 2
+        assert report["today"]["prefix_share"] == 0.8
+        assert report["per_call"]["avg_prefix_tokens"] == 200
+
+    def test_missing_usage_falls_back_to_estimate(self):
+        ledger = TokenLedger()
+
+        call = ledger.record("single", 1, prefix_tokens=200, delta_tokens=50, usage=None)
+
+        assert (call.input_tokens, call.cached_tokens, call.output_tokens) == (250, 0, 0)
+
+    def test_keeps_at_most_max_days(self):
+        now = [0.0]
+        ledger = TokenLedger(max_days=2, clock=lambda: now[0])
+        for _ in range(3):
+            ledger.record("single", 1, prefix_tokens=1, delta_tokens=1)
+            now[0] += 86400
+
+        assert len(ledger.report()["days"]) == 2
@@ -0,0 +1,115 @@
+"""
+Tests para backend/scrapers/wire.py y la decodificación en HTTPTransport
+
+Propósito: Verificar negociación, descompresión y métricas de tráfico
+Framework: pytest + servidor aiohttp local
+"""
+
+import gzip
+import json
+
+import pytest
+from aiohttp import web
+
+from backend.scrapers.http_pool import HTTPTransport
+from backend.scrapers.wire import (
+    decode_response,
+    decompress,
+    negotiation_headers,
+)
+
+
+PAYLOAD = {
+    "count": 20,
+    "jobs": [
+        {"title": f"Python Dev {i}", "job_url": f"https://x.com/{i}", "description": "Python " * 100}
+        for i in range(20)
+    ],
+    "cached": False,
+}
+
+
+class TestWireCodecs:
+    """Tests para negociación y decodificación"""
+
+    def test_negotiation_headers(self):
+        """
+        Escenario:
+        - compression=True anuncia al menos gzip
+        - compression=False pide identity
+        """
+        assert "gzip" in negotiation_headers()["Accept-Encoding"]
+        assert negotiation_headers(compression=False)["Accept-Encoding"] == "identity"
+        assert negotiation_headers()["Accept"] == "application/json"
+
+    def test_gzip_round_trip(self):
+        body = json.dumps(PAYLOAD).encode()
+        raw = gzip.compress(body)
+
+        data, body_bytes, _ = decode_response(raw, "gzip", "application/json")
+
+        assert data == PAYLOAD
+        assert body_bytes == len(body)
+        assert len(raw) < len(body) / 5
+
+    def test_zstd_round_trip(self):
+        zstandard = pytest.importorskip("zstandard")
+        body = json.dumps(PAYLOAD).encode()
+
+        assert decompress(zstandard.ZstdCompressor().compress(body), "zstd") == body
+
+    def test_unknown_encoding_raises(self):
+        with pytest.raises(ValueError):
+            decompress(b"abc", "compress")
+
+
+class TestHTTPTransportCompression:
+    """Tests de extremo a extremo contra un servidor aiohttp local"""
+
+    @staticmethod
+    async def start_server(aiohttp_server_handler):
+        app = web.Application()
+        app.router.add_get("/search", aiohttp_server_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f"http://127.0.0.1:{port}/search"
+
+    @pytest.mark.asyncio
+    async def test_async_and_sync_decode_gzip(self):
+        """
+        El transporte anuncia gzip, decodifica y registra bytes en la red
+
+        Escenario:
+        - Servidor responde gzip solo si Accept-Encoding lo incluye
+        - aget_json() y get_json() devuelven el JSON original
+        - stats(): 2 respuestas gzip, ratio > 5
+        """
+        import asyncio
+
+        async def handler(request):
+            body = json.dumps(PAYLOAD).encode()
+            if "gzip" not in request.headers.get("Accept-Encoding", ""):
+                return web.Response(body=body, content_type="application/json")
+            return web.Response(
+                body=gzip.compress(body),
+                content_type="application/json",
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        runner, url = await self.start_server(handler)
+        transport = HTTPTransport()
+        try:
+            data, _ = await transport.aget_json(url)
+            sync_data, _ = await asyncio.to_thread(transport.get_json, url)
+        finally:
+            await transport.aclose()
+            await runner.cleanup()
+
+        assert data == PAYLOAD
+        assert sync_data == PAYLOAD
+        stats = transport.stats()
+        assert stats["by_encoding"]["gzip"]["responses"] == 2
+        assert stats["ratio"] > 5
@@ -267,3 +267,360 @@ class TestJobModelParsing:
             _ = job.location
             _ = job.salary
             _ = job.job_type
+
+
+class TestJobSpyClientAsync:
+    """Tests para asearch_jobs() (fan-out concurrente, sin API real)"""
+
+    @pytest.mark.asyncio
+    async def test_asearch_jobs_runs_platforms_concurrently(self):
+        """
+        asearch_jobs() debe consultar las plataformas en paralelo
+
+        Escenario:
+        - _asearch_platform tarda 0.2s por plataforma (mock)
+        - 3 plataformas en paralelo deben tardar ~0.2s, no ~0.6s
+        - Resultados en el orden de `platforms`
+        """
+        import asyncio
+        import time
+        from unittest.mock import patch
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        async def fake_search(platform, **kwargs):
+            await asyncio.sleep(0.2)
+            return [Job(title=f"{platform} job", job_url=f"https://{platform}.com/1", source=platform)]
+
+        client = JobSpyClient()
+        with patch.object(client, "_asearch_platform", side_effect=fake_search):
+            start = time.perf_counter()
+            jobs = await client.asearch_jobs(keywords="python", country="USA")
+            elapsed = time.perf_counter() - start
+
+        assert [j.source for j in jobs] == ["indeed", "linkedin", "glassdoor"]
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_asearch_jobs_platform_error_is_isolated(self):
+        """
+        Error en una plataforma no debe tumbar las demás
+
+        Escenario:
+        - Glassdoor lanza excepción
+        - Indeed y LinkedIn devuelven resultados
+        """
+        from unittest.mock import patch
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        async def fake_search(platform, **kwargs):
+            if platform == "glassdoor":
+                raise TimeoutError("Read timed out")
+            return [Job(title=f"{platform} dev", job_url=f"https://{platform}.com/1", source=platform)]
+
+        client = JobSpyClient()
+        with patch.object(client, "_asearch_platform", side_effect=fake_search):
+            jobs = await client.asearch_jobs(keywords="python", country="USA")
+
+        assert {j.source for j in jobs} == {"indeed", "linkedin"}
+
+    @pytest.mark.asyncio
+    async def test_asearch_jobs_invalid_country(self):
+        """asearch_jobs() valida parámetros igual que search_jobs()"""
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        client = JobSpyClient()
+
+        with pytest.raises(ValueError):
+            await client.asearch_jobs(keywords="python", country="InvalidCountry")
+
+
+class TestHTTPTransport:
+    """Tests para el pool HTTP compartido (backend/scrapers/http_pool.py)"""
+
+    def test_clients_share_process_transport(self):
+        """
+        Varios JobSpyClient deben reutilizar el MISMO pool
+
+        Escenario:
+        - Crear 2 clientes sin pasar transport
+        - Ambos usan get_transport() (mismo objeto)
+        """
+        from backend.scrapers.jobspy_client import JobSpyClient
+        from backend.scrapers.http_pool import get_transport
+
+        a = JobSpyClient()
+        b = JobSpyClient()
+
+        assert a.transport is b.transport is get_transport()
+
+    def test_bool_params_encoded_for_aiohttp(self):
+        """aiohttp rechaza bool en query params → se envían como "true"/"false" """
+        from backend.scrapers.http_pool import _encode_params
+
+        assert _encode_params({"is_remote": True, "results_wanted": 25}) == {
+            "is_remote": "true",
+            "results_wanted": 25,
+        }
+
+
+class TestJobSpyClientCache:
+    """Tests para la caché de resultados en JobSpyClient"""
+
+    @pytest.mark.asyncio
+    async def test_second_search_served_from_cache(self):
+        """
+        Misma búsqueda 2 veces → 1 sola llamada HTTP por plataforma
+        """
+        from unittest.mock import AsyncMock, MagicMock
+        from backend.scrapers.cache import SearchCache
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        transport = MagicMock()
+        transport.aget_json = AsyncMock(
+            return_value=({"count": 1, "jobs": [{"title": "Dev", "job_url": "https://x.com/1"}]}, 0.1)
+        )
+        from backend.scrapers.circuit_breaker import CircuitBreakerRegistry
+        from backend.scrapers.throttle import ThrottleRegistry
+
+        # Breakers y throttles propios: los tests en vivo pueden dejar abiertos los globales
+        client = JobSpyClient(
+            transport=transport,
+            cache=SearchCache(),
+            throttles=ThrottleRegistry(),
+            breakers=CircuitBreakerRegistry(),
+        )
+
+        first = await client.asearch_jobs("python", "USA", platforms=["indeed"])
+        second = await client.asearch_jobs("python", "USA", platforms=["indeed"])
+
+        assert len(first) == len(second) == 1
+        assert transport.aget_json.await_count == 1
+        assert client.cache.stats()["hits"] == 1
+
+
+class TestJobSpyClientStreaming:
+    """Tests para astream_jobs() (entrega por plataforma)"""
+
+    @pytest.mark.asyncio
+    async def test_astream_yields_fastest_platform_first(self):
+        """
+        astream_jobs() entrega cada plataforma apenas termina
+
+        Escenario:
+        - LinkedIn tarda 0.01s, Indeed 0.1s, Glassdoor 0.2s (mock)
+        - El primer lote debe ser LinkedIn (orden de llegada, no de platforms)
+        """
+        import asyncio
+        from unittest.mock import patch
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        delays = {"indeed": 0.1, "linkedin": 0.01, "glassdoor": 0.2}
+
+        async def fake_search(platform, **kwargs):
+            await asyncio.sleep(delays[platform])
+            return [Job(title=f"{platform} job", job_url=f"https://{platform}.com/1", source=platform)]
+
+        client = JobSpyClient()
+        with patch.object(client, "_asearch_platform", side_effect=fake_search):
+            order = [batch.platform async for batch in client.astream_jobs("python", "USA")]
+
+        assert order == ["linkedin", "indeed", "glassdoor"]
+
+    @pytest.mark.asyncio
+    async def test_astream_dedupes_across_batches(self):
+        """Un job que ya llegó por LinkedIn no se repite en el lote de Indeed"""
+        import asyncio
+        from unittest.mock import patch
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        async def fake_search(platform, **kwargs):
+            await asyncio.sleep(0.01 if platform == "linkedin" else 0.05)
+            return [Job(title="Senior Python Developer", company="Acme", job_url=f"https://{platform}.com/1", source=platform)]
+
+        client = JobSpyClient()
+        with patch.object(client, "_asearch_platform", side_effect=fake_search):
+            batches = [b async for b in client.astream_jobs("python", "USA", platforms=["indeed", "linkedin"])]
+
+        assert len(batches[0].jobs) == 1
+        assert len(batches[1].jobs) == 0
+
+
+class TestJobSpyClientDeadline:
+    """Tests para deadline + hedged requests"""
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_results(self):
+        """
+        Plataforma lenta no retiene la respuesta
+
+        Escenario:
+        - Glassdoor tarda 5s, deadline=0.3s
+        - Reporte: Indeed y LinkedIn completadas, Glassdoor en dropped
+        """
+        import asyncio
+        import time
+        from unittest.mock import patch
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        async def fake_search(platform, **kwargs):
+            await asyncio.sleep(5 if platform == "glassdoor" else 0.01)
+            return [Job(title=f"{platform} job", job_url=f"https://{platform}.com/1", source=platform)]
+
+        client = JobSpyClient()
+        with patch.object(client, "_asearch_platform", side_effect=fake_search):
+            start = time.perf_counter()
+            report = await client.asearch_jobs_report("python", "USA", deadline=0.3)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 1
+        assert report.dropped == ["glassdoor"]
+        assert set(report.completed) == {"indeed", "linkedin"}
+        assert report.partial
+        assert {j.source for j in report.jobs} == {"indeed", "linkedin"}
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_is_slow(self):
+        """
+        Hedge: si el request supera el p95, un respaldo puede ganar
+
+        Escenario:
+        - p95 de Indeed ≈ 0.05s (mediciones previas)
+        - 1er request tarda 5s, el respaldo 0.01s
+        - La búsqueda termina en < 1s con el resultado del respaldo
+        """
+        import asyncio
+        import time
+        from unittest.mock import MagicMock
+        from backend.scrapers.cache import SearchCache
+        from backend.scrapers.circuit_breaker import CircuitBreakerRegistry
+        from backend.scrapers.jobspy_client import JobSpyClient
+        from backend.scrapers.latency import LatencyRegistry
+        from backend.scrapers.throttle import ThrottleRegistry
+
+        latencies = LatencyRegistry(min_samples=1)
+        latencies.get("indeed").record(0.05)
+
+        calls = 0
+
+        async def fake_get_json(url, params=None, timeout=30):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(5 if calls == 1 else 0.01)
+            return {"count": 1, "jobs": [{"title": "Dev", "job_url": "https://x.com/1"}]}, 0.01
+
+        transport = MagicMock()
+        transport.aget_json = fake_get_json
+        client = JobSpyClient(
+            transport=transport,
+            cache=SearchCache(),
+            throttles=ThrottleRegistry(),
+            latencies=latencies,
+            breakers=CircuitBreakerRegistry(),
+        )
+
+        start = time.perf_counter()
+        jobs = await client.asearch_jobs("hedge test", "USA", platforms=["indeed"], hedge=True)
+
+        assert time.perf_counter() - start < 1
+        assert len(jobs) == 1
+        assert calls == 2
+
+
+class TestJobSpyClientBulkParsing:
+    """Tests para el parseo por lotes (_parse_jobs_bulk)"""
+
+    def test_bulk_matches_per_record_parsing(self):
+        """
+        _parse_jobs_bulk() debe producir los mismos Jobs que _parse_job()
+
+        Escenario:
+        - Respuesta con campos completos y con campos faltantes
+        - Comparar model_dump() de ambos caminos
+        """
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        client = JobSpyClient()
+        jobs_data = [
+            {
+                "id": "in-1",
+                "title": "Python Dev",
+                "company": "Acme",
+                "job_url": "https://indeed.com/1",
+                "location": "ANT, CO",
+                "is_remote": True,
+                "date_posted": "2026-02-15",
+            },
+            {"title": "Backend Dev", "job_url": "https://indeed.com/2"},
+        ]
+
+        bulk = client._parse_jobs_bulk(jobs_data, "indeed")
+        single = [client._parse_job(d, "indeed") for d in jobs_data]
+
+        assert [j.model_dump() for j in bulk] == [j.model_dump() for j in single]
+        assert all(j.source == "indeed" for j in bulk)
+
+    def test_bulk_drops_only_invalid_records(self):
+        """
+        Un registro inválido no debe tumbar toda la plataforma
+
+        Escenario:
+        - 3 registros, el del medio sin title
+        - Se devuelven los 2 válidos, en orden
+        """
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        client = JobSpyClient()
+        jobs = client._parse_response(
+            {
+                "count": 3,
+                "jobs": [
+                    {"title": "A", "job_url": "https://x.com/a"},
+                    {"title": None, "job_url": "https://x.com/b"},
+                    {"title": "C", "job_url": "https://x.com/c"},
+                ],
+            },
+            "indeed",
+            0.1,
+        )
+
+        assert [j.title for j in jobs] == ["A", "C"]
+
+    def test_location_string_is_parsed(self):
+        """
+        La ubicación de la API ("ANT, CO") debe llegar como JobLocation
+
+        Escenario:
+        - Registro con location="Medellín, ANT, CO"
+        - Job.location.country == "Colombia", state == "Antioquia"
+        """
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        client = JobSpyClient()
+        jobs = client._parse_jobs_bulk(
+            [{"title": "Dev", "job_url": "https://x.com/1", "location": "Medellín, ANT, CO"}],
+            "indeed",
+            country="Colombia",
+        )
+
+        assert jobs[0].location.country == "Colombia"
+        assert jobs[0].location.state == "Antioquia"
+        assert jobs[0].location.city == "Medellín"
+
+    def test_requests_only_parsed_fields(self):
+        """
+        El cliente debe pedir con ?fields= exactamente las columnas que parsea
+
+        Escenario:
+        - _build_params() incluye fields
+        - Cada campo leído por _map_job_fields() está en la lista
+        """
+        from backend.scrapers.jobspy_client import JobSpyClient
+
+        client = JobSpyClient()
+        params = client._build_params("indeed", "python", "USA")
+        requested = set(params["fields"].split(","))
+
+        mapped = client._map_job_fields({}, "indeed")
+        api_columns = set(mapped) - {"source", "scraped_at"}
+
+        assert requested == api_columns